@@ -4,5 +4,6 @@ Contains the implementation of the specialized agents.
 """
 
 from meeting_room_booking.agents.agents import RoomAppointmentAgents
+from meeting_room_booking.agents.router import FastRouter
 
-__all__ = ['RoomAppointmentAgents']
+__all__ = ['RoomAppointmentAgents', 'FastRouter']
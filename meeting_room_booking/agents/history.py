@@ -0,0 +1,155 @@
+"""
+Token-budgeted history compaction for the Meeting Room Booking System.
+
+With server-side sessions the message history grows with every turn, and every supervisor
+and sub-agent call would resend all of it. ``HistoryCompactor`` builds the history a model
+call sees instead: the last few turns verbatim, and everything older folded into one
+message of extracted facts (customer identity, rooms, bookings made, cancelled or
+rescheduled, earlier requests). The checkpointed state keeps the full history.
+"""
+
+import os
+import re
+import threading
+from typing import Any, Dict, List, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+HISTORY_TURNS_ENV = "HISTORY_MAX_TURNS"
+HISTORY_BUDGET_ENV = "HISTORY_TOKEN_BUDGET"
+DEFAULT_MAX_TURNS = 3
+DEFAULT_TOKEN_BUDGET = 2000
+
+# Facts worth carrying over from summarized turns, matched against the tool results the
+# sub-agents pass back and against the user's own words
+_BOOKED_RE = re.compile(r"booked Room (\d+) for .*? from (\S+ \S+) to .*?Booking ID: (\d+)")
+_CANCELLED_RE = re.compile(r"canceled booking ID (\d+)", re.IGNORECASE)
+_RESCHEDULED_RE = re.compile(r"rescheduled booking (\d+) to new booking (\d+)", re.IGNORECASE)
+_BOOKING_ID_RE = re.compile(r"\bbooking(?:[ _]id)?[: ]+(?:id[: ]+)?(\d{3,})", re.IGNORECASE)
+_ROOM_RE = re.compile(r"\broom(?:[ _]id)?[: ]+(\d+)", re.IGNORECASE)
+_MAX_REQUEST_CHARS = 120
+_MAX_REQUESTS = 5
+
+
+def _text(message: BaseMessage) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+
+
+def _turns(messages: Sequence[BaseMessage]) -> List[List[BaseMessage]]:
+    """Split a history into turns, each starting at a user message."""
+    turns: List[List[BaseMessage]] = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+def _unique(values) -> List[str]:
+    return list(dict.fromkeys(values))
+
+
+def summarize(messages: Sequence[BaseMessage]) -> List[str]:
+    """Fact lines extracted from ``messages``, oldest first, without duplicates."""
+    booked, cancelled, rescheduled, booking_ids, rooms, requests = [], [], [], [], [], []
+    for message in messages:
+        text = _text(message)
+        if isinstance(message, HumanMessage):
+            request = " ".join(text.split())
+            requests.append(request if len(request) <= _MAX_REQUEST_CHARS
+                            else request[:_MAX_REQUEST_CHARS - 3] + "...")
+        booked += [f"{booking_id} (room {room_id}, {start})" for room_id, start, booking_id in _BOOKED_RE.findall(text)]
+        cancelled += _CANCELLED_RE.findall(text)
+        rescheduled += [f"{old} -> {new}" for old, new in _RESCHEDULED_RE.findall(text)]
+        booking_ids += _BOOKING_ID_RE.findall(text)
+        rooms += _ROOM_RE.findall(text)
+
+    facts = []
+    if booked:
+        facts.append("Bookings made: " + ", ".join(_unique(booked)))
+    if cancelled:
+        facts.append("Bookings cancelled: " + ", ".join(_unique(cancelled)))
+    if rescheduled:
+        facts.append("Bookings rescheduled: " + ", ".join(_unique(rescheduled)))
+    if booking_ids:
+        facts.append("Booking IDs mentioned: " + ", ".join(_unique(booking_ids)))
+    if rooms:
+        # The most recent room is the one the user was working with
+        facts.append("Rooms discussed: " + ", ".join(_unique(rooms)) + f" (latest: room {rooms[-1]})")
+    if requests:
+        facts.append("Earlier requests: " + " | ".join(requests[-_MAX_REQUESTS:]))
+    return facts
+
+
+class HistoryCompactor:
+    """
+    Builds the message history sent to a model call.
+
+    The last ``max_turns`` turns are kept verbatim, fewer if they exceed ``token_budget``
+    (the latest turn is always kept whole). Older turns are replaced by a single message
+    stating the customer's identity and the facts extracted from them.
+    """
+
+    def __init__(self, max_turns: int = DEFAULT_MAX_TURNS, token_budget: int = DEFAULT_TOKEN_BUDGET):
+        self.max_turns = max(1, max_turns)
+        self.token_budget = token_budget
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._compacted = 0
+        self._tokens_before = 0
+        self._tokens_after = 0
+        self._tokens_saved = 0
+
+    @classmethod
+    def from_env(cls) -> "HistoryCompactor":
+        """Compactor configured by HISTORY_MAX_TURNS and HISTORY_TOKEN_BUDGET."""
+        return cls(max_turns=int(os.environ.get(HISTORY_TURNS_ENV, DEFAULT_MAX_TURNS)),
+                   token_budget=int(os.environ.get(HISTORY_BUDGET_ENV, DEFAULT_TOKEN_BUDGET)))
+
+    def compact(self, messages: Sequence[BaseMessage], customer_id: Any = None,
+                customer_name: Any = None) -> Tuple[List[BaseMessage], int]:
+        """
+        Return the history to send and the number of tokens saved against sending
+        ``messages`` in full (with the identity message the agents always prepend).
+        """
+        identity = f"my identification number is {customer_id} and my name is {customer_name}"
+        turns = _turns(messages)
+        turn_tokens = [count_tokens_approximately(turn) for turn in turns]
+
+        keep = min(self.max_turns, len(turns))
+        while keep > 1 and sum(turn_tokens[-keep:]) > self.token_budget:
+            keep -= 1
+        older = [message for turn in turns[:len(turns) - keep] for message in turn]
+        kept = [message for turn in turns[len(turns) - keep:] for message in turn]
+
+        facts = summarize(older)
+        header = HumanMessage(content=identity if not facts else
+                              identity + ". Summary of the earlier conversation:\n- " + "\n- ".join(facts))
+        compacted = [header] + kept
+
+        before = count_tokens_approximately([HumanMessage(content=identity)]) + sum(turn_tokens)
+        after = count_tokens_approximately([header]) + sum(turn_tokens[len(turns) - keep:])
+        saved = max(0, before - after)
+        with self._lock:
+            self._calls += 1
+            self._compacted += bool(older)
+            self._tokens_before += before
+            self._tokens_after += after
+            self._tokens_saved += saved
+        return compacted, saved
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'calls': self._calls,
+                'compacted_calls': self._compacted,
+                'tokens_before': self._tokens_before,
+                'tokens_after': self._tokens_after,
+                'tokens_saved': self._tokens_saved,
+                'max_turns': self.max_turns,
+                'token_budget': self.token_budget,
+            }
@@ -0,0 +1,150 @@
+"""
+Rule-based fast-path router for the Meeting Room Booking System.
+
+Classifies unambiguous turns locally so the supervisor can skip its structured-output
+LLM call. Anything the rules are not sure about returns ``None`` and goes to the LLM.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+BOOKING_ID_PATTERN = re.compile(r"\b(?:booking|reservation)\s*(?:id|number|no\.?)?\s*[:#]?\s*(\d{4,})\b|#(\d{4,})\b",
+                                re.IGNORECASE)
+ROOM_ID_PATTERN = re.compile(r"\broom\s*(?:id|number|no\.?)?\s*[:#]?\s*(\d+)\b", re.IGNORECASE)
+DATE_PATTERN = re.compile(
+    r"\b\d{4}-\d{2}-\d{2}\b|\b(?:today|tomorrow|tonight)\b"
+    r"|\b(?:next\s+)?(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday|week)\b",
+    re.IGNORECASE)
+TIME_PATTERN = re.compile(r"\b\d{1,2}(?::\d{2})\s*(?:am|pm)?\b|\b\d{1,2}\s*(?:am|pm)\b|\bnoon\b", re.IGNORECASE)
+
+BOOK_WORDS = re.compile(r"\b(?:book|reserve)\b", re.IGNORECASE)
+CANCEL_WORDS = re.compile(r"\b(?:cancel|delete|remove)\b", re.IGNORECASE)
+RESCHEDULE_WORDS = re.compile(r"\b(?:reschedule|move|change|shift|postpone)\b", re.IGNORECASE)
+AVAILABILITY_WORDS = re.compile(r"\b(?:available|availability|free|vacant|open slots?)\b", re.IGNORECASE)
+MY_BOOKINGS_WORDS = re.compile(
+    r"\b(?:my|our)\s+(?:\w+\s+)?(?:bookings?|reservations?|meetings?)\b"
+    r"|\b(?:bookings?|reservations?)\s+(?:do\s+i|have\s+i|i\s+have|i\s+made)\b",
+    re.IGNORECASE)
+
+# Messages returned by a sub-agent carry the agent's name, or the tool's name when the
+# agent's last useful message was a tool result
+AGENT_NAMES = {
+    'room_information_agent': 'information_node',
+    'check_availability_features': 'information_node',
+    'check_specific_room': 'information_node',
+    'check_availability_batch': 'information_node',
+    'check_availability_range': 'information_node',
+    'find_next_available': 'information_node',
+    'booking_agent': 'booking_node',
+    'book_room': 'booking_node',
+    'cancel_booking': 'booking_node',
+    'reschedule_booking': 'booking_node',
+    'book_recurring_room': 'booking_node',
+    'cancel_series': 'booking_node',
+    'reschedule_series': 'booking_node',
+    'user_info_agent': 'user_info_node',
+    'get_user_bookings': 'user_info_node',
+}
+
+
+class FastRouter:
+    """
+    Deterministic pre-router with hit counters.
+
+    ``route`` returns a decision shaped like the supervisor's ``Router`` output, or ``None``
+    when the turn is ambiguous and the LLM has to decide.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses = 0
+
+    def route(self, messages: List) -> Optional[dict]:
+        decision = self._classify(messages)
+        with self._lock:
+            if decision is None:
+                self._misses += 1
+            else:
+                self._hits[decision['next']] = self._hits.get(decision['next'], 0) + 1
+        return decision
+
+    def stats(self) -> dict:
+        """Hit/miss counters; every hit is one supervisor LLM round trip saved."""
+        with self._lock:
+            hits = sum(self._hits.values())
+            total = hits + self._misses
+            return {
+                'hits': hits,
+                'misses': self._misses,
+                'hit_rate': hits / total if total else 0.0,
+                'hits_by_route': dict(self._hits),
+            }
+
+    # ------------------------------------------------------------------
+    # Rules
+    # ------------------------------------------------------------------
+    def _classify(self, messages: List) -> Optional[dict]:
+        latest_index = next((i for i in range(len(messages) - 1, -1, -1) if isinstance(messages[i], HumanMessage)),
+                            None)
+        if latest_index is None:
+            return None
+        query = messages[latest_index].content
+        if not isinstance(query, str):
+            return None
+        replies = [msg for msg in messages[latest_index + 1:] if isinstance(msg, AIMessage)]
+        if replies:
+            return self._after_agent(query, replies)
+        return self._first_hop(query)
+
+    def _first_hop(self, query: str) -> Optional[dict]:
+        booking_ids = {a or b for a, b in BOOKING_ID_PATTERN.findall(query)}
+        wants_book = bool(BOOK_WORDS.search(query))
+        wants_cancel = bool(CANCEL_WORDS.search(query))
+        wants_reschedule = bool(RESCHEDULE_WORDS.search(query))
+        has_date = bool(DATE_PATTERN.search(query))
+
+        if wants_cancel and not (wants_book or wants_reschedule) and len(booking_ids) == 1:
+            booking_id = booking_ids.pop()
+            return _decision('booking_node', f"Cancellation of booking {booking_id} with an explicit booking ID.")
+
+        if wants_book or wants_cancel or wants_reschedule:
+            # Booking a specific room at a specific time always starts with an availability check
+            room_ids = set(ROOM_ID_PATTERN.findall(query))
+            if (wants_book and not (wants_cancel or wants_reschedule) and len(room_ids) == 1
+                    and has_date and TIME_PATTERN.search(query)):
+                return _decision('information_node',
+                                 f"Booking request for room {room_ids.pop()}: check its availability first.")
+            return None
+
+        if MY_BOOKINGS_WORDS.search(query) and not booking_ids:
+            return _decision('user_info_node', "The user asks for their bookings.")
+
+        if AVAILABILITY_WORDS.search(query) and has_date:
+            return _decision('information_node', "Room availability question with a date.")
+        return None
+
+    def _after_agent(self, query: str, replies: List[AIMessage]) -> Optional[dict]:
+        node = AGENT_NAMES.get(replies[-1].name)
+        if node == 'booking_node':
+            # Errors and follow-up questions need the supervisor; the booking tools report success explicitly
+            content = replies[-1].content
+            if isinstance(content, str) and content.lstrip().startswith("Successfully"):
+                return _decision('FINISH', "The booking agent has completed the request.")
+            return None
+        if node is None or len(replies) > 1:
+            return None
+
+        wants_change = BOOK_WORDS.search(query) or CANCEL_WORDS.search(query) or RESCHEDULE_WORDS.search(query)
+        if node == 'user_info_node' and not wants_change:
+            return _decision('FINISH', "The user's bookings have been listed.")
+        if node == 'information_node' and not wants_change:
+            return _decision('FINISH', "The availability question has been answered.")
+        return None
+
+
+def _decision(next_node: str, reasoning: str) -> dict:
+    return {'next': next_node, 'reasoning': f"[fast path] {reasoning}", 'supervisor_response_content': None}
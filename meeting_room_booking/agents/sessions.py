@@ -0,0 +1,285 @@
+"""
+Conversation sessions for the Meeting Room Booking System.
+
+Sessions are LangGraph checkpointer threads: the compiled workflow saves its state under
+the session ID after every step, so a request only has to send the new message. Two
+checkpointers are available:
+
+- ``BoundedMemorySaver`` (default): in memory, keeps only the latest checkpoint of each
+  session and evicts sessions by LRU and idle time, so memory stays bounded
+- ``SqliteSessionSaver``: persisted in a SQLite file with the same bounds; needs the
+  ``langgraph-checkpoint-sqlite`` package
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set
+from urllib.parse import quote
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+SESSION_STORE_ENV = "SESSION_STORE"
+SESSION_MAX_ENV = "SESSION_MAX"
+SESSION_TTL_ENV = "SESSION_TTL"
+SESSION_DB_ENV = "SESSION_DB_PATH"
+DEFAULT_MAX_SESSIONS = 1000
+DEFAULT_SESSION_TTL = 3600.0
+SESSION_DB_FILE = "data/sessions.db"
+
+
+def session_thread_id(customer_id: str, session_id: str) -> str:
+    """
+    Checkpointer thread of a customer's session. The customer is part of the key, so a session
+    ID sent with another customer ID starts a separate conversation instead of reading this one.
+    """
+    # Quoting keeps ':' in the customer ID from making two different pairs collide
+    return f"{quote(customer_id, safe='')}:{session_id}"
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    In-memory checkpointer with a bounded number of sessions.
+
+    Only the newest checkpoint of each session (and the channel values it references) is
+    kept, so a session's size follows its current state rather than its whole history.
+    Sessions idle for longer than ``ttl`` seconds, or beyond the ``max_sessions`` most
+    recently used, are dropped.
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS, ttl: float = DEFAULT_SESSION_TTL):
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._last_used: "OrderedDict[str, float]" = OrderedDict()
+        # Keys of ``self.blobs`` and ``self.writes`` per session, so a session is dropped without a full scan
+        self._blob_keys: Dict[str, Set[tuple]] = {}
+        self._write_keys: Dict[str, Set[tuple]] = {}
+        self._evictions = 0
+        self._expirations = 0
+
+    # ------------------------------------------------------------------
+    # Checkpointer interface
+    # ------------------------------------------------------------------
+    def get_tuple(self, config):
+        with self._lock:
+            self._evict()
+            thread_id = config["configurable"]["thread_id"]
+            if thread_id in self._last_used:
+                self._touch(thread_id)
+            return super().get_tuple(config)
+
+    def list(self, config, **kwargs):
+        with self._lock:
+            return iter(list(super().list(config, **kwargs)))
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        with self._lock:
+            result = super().put(config, checkpoint, metadata, new_versions)
+            thread_id = config["configurable"]["thread_id"]
+            checkpoint_ns = config["configurable"]["checkpoint_ns"]
+            self._blob_keys.setdefault(thread_id, set()).update(
+                (thread_id, checkpoint_ns, channel, version) for channel, version in new_versions.items())
+            self._prune(thread_id, checkpoint_ns, checkpoint["id"], checkpoint["channel_versions"])
+            self._touch(thread_id)
+            self._evict()
+            return result
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        with self._lock:
+            super().put_writes(config, writes, task_id, task_path)
+            configurable = config["configurable"]
+            thread_id = configurable["thread_id"]
+            self._write_keys.setdefault(thread_id, set()).add(
+                (thread_id, configurable.get("checkpoint_ns", ""), configurable["checkpoint_id"]))
+
+    def delete_thread(self, thread_id: str):
+        with self._lock:
+            self.storage.pop(thread_id, None)
+            for key in self._write_keys.pop(thread_id, ()):
+                self.writes.pop(key, None)
+            for key in self._blob_keys.pop(thread_id, ()):
+                self.blobs.pop(key, None)
+            self._last_used.pop(thread_id, None)
+
+    # ------------------------------------------------------------------
+    # Bounding
+    # ------------------------------------------------------------------
+    def _touch(self, thread_id: str):
+        self._last_used[thread_id] = time.monotonic()
+        self._last_used.move_to_end(thread_id)
+
+    def _prune(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str, channel_versions: dict):
+        """Drop older checkpoints of a namespace and the values only they referenced."""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        for old_id in [old_id for old_id in checkpoints if old_id != checkpoint_id]:
+            del checkpoints[old_id]
+
+        write_keys = self._write_keys.get(thread_id, set())
+        for key in [key for key in write_keys if key[1] == checkpoint_ns and key[2] != checkpoint_id]:
+            write_keys.discard(key)
+            self.writes.pop(key, None)
+
+        blob_keys = self._blob_keys[thread_id]
+        for key in [key for key in blob_keys if key[1] == checkpoint_ns and channel_versions.get(key[2]) != key[3]]:
+            blob_keys.discard(key)
+            self.blobs.pop(key, None)
+
+    def _evict(self):
+        deadline = time.monotonic() - self.ttl
+        while self._last_used:
+            thread_id, last_used = next(iter(self._last_used.items()))
+            if last_used < deadline:
+                self._expirations += 1
+            elif len(self._last_used) > self.max_sessions:
+                self._evictions += 1
+            else:
+                break
+            self.delete_thread(thread_id)
+
+    def stats(self) -> dict:
+        """Session count and the bytes of serialized state held for them."""
+        with self._lock:
+            self._evict()
+            held = sum(len(data) for checkpoints in self.storage.values() for namespace in checkpoints.values()
+                       for saved, metadata, _ in namespace.values() for data in (saved[1], metadata[1]))
+            held += sum(len(data) for _, data in self.blobs.values())
+            held += sum(len(value[2][1]) for writes in self.writes.values() for value in writes.values())
+            return {
+                'sessions': len(self._last_used),
+                'bytes': held,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'max_sessions': self.max_sessions,
+                'ttl': self.ttl,
+            }
+
+
+def _sqlite_saver_class():
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError as e:
+        raise ImportError("SQLite sessions need the 'langgraph-checkpoint-sqlite' package") from e
+
+    class SqliteSessionSaver(SqliteSaver):
+        """
+        ``SqliteSaver`` bounded like ``BoundedMemorySaver``: every ``put`` deletes the older
+        checkpoints of the session, and sessions idle for longer than ``ttl`` seconds or beyond
+        the ``max_sessions`` most recently used are deleted. Last use is kept in a
+        ``session_activity`` table. The async methods run the sync ones in a thread, so the
+        ASGI server can use it.
+        """
+
+        def __init__(self, conn: sqlite3.Connection, db_path: Optional[str] = None,
+                     max_sessions: int = DEFAULT_MAX_SESSIONS, ttl: float = DEFAULT_SESSION_TTL):
+            super().__init__(conn)
+            self.db_path = db_path
+            self.max_sessions = max_sessions
+            self.ttl = ttl
+            self._evictions = 0
+            self._expirations = 0
+
+        def setup(self):
+            if self.is_setup:
+                return
+            super().setup()
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS session_activity (
+                    thread_id TEXT PRIMARY KEY,
+                    last_used REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_session_activity_last_used ON session_activity (last_used);
+            """)
+            # Sessions saved before activity was tracked count as used now
+            self.conn.execute("INSERT OR IGNORE INTO session_activity (thread_id, last_used) "
+                              "SELECT DISTINCT thread_id, ? FROM checkpoints", (time.time(),))
+            self.conn.commit()
+
+        def put(self, config, checkpoint, metadata, new_versions):
+            result = super().put(config, checkpoint, metadata, new_versions)
+            thread_id = str(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"]["checkpoint_ns"]
+            with self.cursor() as cur:
+                # Checkpoint IDs sort by creation time; the values of older ones are already in the new one
+                for table in ('checkpoints', 'writes'):
+                    cur.execute(f"DELETE FROM {table} WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?",
+                                (thread_id, checkpoint_ns, checkpoint["id"]))
+                cur.execute("INSERT INTO session_activity (thread_id, last_used) VALUES (?, ?) "
+                            "ON CONFLICT (thread_id) DO UPDATE SET last_used = excluded.last_used",
+                            (thread_id, time.time()))
+                self._evict(cur)
+            return result
+
+        def delete_thread(self, thread_id: str):
+            super().delete_thread(thread_id)
+            with self.cursor() as cur:
+                cur.execute("DELETE FROM session_activity WHERE thread_id = ?", (str(thread_id),))
+
+        def _evict(self, cur: sqlite3.Cursor):
+            cur.execute("SELECT thread_id FROM session_activity WHERE last_used < ?", (time.time() - self.ttl,))
+            expired = {row[0] for row in cur.fetchall()}
+            cur.execute("SELECT thread_id FROM session_activity ORDER BY last_used DESC LIMIT -1 OFFSET ?",
+                        (self.max_sessions,))
+            evicted = {row[0] for row in cur.fetchall()} - expired
+            for thread_id in expired | evicted:
+                for table in ('checkpoints', 'writes', 'session_activity'):
+                    cur.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            self._expirations += len(expired)
+            self._evictions += len(evicted)
+
+        async def aget_tuple(self, config):
+            return await asyncio.to_thread(self.get_tuple, config)
+
+        async def alist(self, config, **kwargs):
+            for item in await asyncio.to_thread(lambda: list(self.list(config, **kwargs))):
+                yield item
+
+        async def aput(self, config, checkpoint, metadata, new_versions):
+            return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+        async def aput_writes(self, config, writes, task_id, task_path=""):
+            return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+        async def adelete_thread(self, thread_id):
+            return await asyncio.to_thread(self.delete_thread, thread_id)
+
+        def stats(self) -> dict:
+            with self.cursor() as cur:
+                self._evict(cur)
+                cur.execute("SELECT COUNT(*) FROM session_activity")
+                sessions = cur.fetchone()[0]
+            return {
+                'sessions': sessions,
+                'bytes': os.path.getsize(self.db_path) if self.db_path else 0,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'max_sessions': self.max_sessions,
+                'ttl': self.ttl,
+            }
+
+    return SqliteSessionSaver
+
+
+def create_checkpointer() -> Optional[BaseCheckpointSaver]:
+    """
+    Build the session checkpointer selected by SESSION_STORE: 'memory' (default) or 'sqlite'
+    (file at SESSION_DB_PATH), both bounded by SESSION_MAX sessions and SESSION_TTL idle
+    seconds, or 'none' (no sessions; every request starts a new conversation).
+    """
+    store = os.environ.get(SESSION_STORE_ENV, 'memory').lower()
+    if store == 'none':
+        return None
+    max_sessions = int(os.environ.get(SESSION_MAX_ENV, DEFAULT_MAX_SESSIONS))
+    ttl = float(os.environ.get(SESSION_TTL_ENV, DEFAULT_SESSION_TTL))
+    if store == 'sqlite':
+        path = os.environ.get(SESSION_DB_ENV, SESSION_DB_FILE)
+        return _sqlite_saver_class()(sqlite3.connect(path, check_same_thread=False), db_path=path,
+                                     max_sessions=max_sessions, ttl=ttl)
+    if store == 'memory':
+        return BoundedMemorySaver(max_sessions=max_sessions, ttl=ttl)
+    raise ValueError(f"Unknown {SESSION_STORE_ENV} '{store}'. Use 'memory', 'sqlite' or 'none'.")
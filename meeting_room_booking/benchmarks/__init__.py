@@ -0,0 +1,4 @@
+"""
+Benchmarks module for the Meeting Room Booking System.
+Contains runnable stress tests and benchmarks, e.g. ``python -m meeting_room_booking.benchmarks.stress``.
+"""
@@ -0,0 +1,123 @@
+"""
+Concurrent-request throughput: sync Flask handler vs async ASGI handler.
+
+Both servers run the real workflow against a stub chat model that only sleeps for
+``--latency`` seconds per call (``time.sleep`` on the sync path, ``asyncio.sleep`` on the
+async path), so the numbers show how many conversations each server keeps in flight while
+waiting on the model. The sync handler gets ``--sync-threads`` worker threads, like a
+threaded WSGI server; the ASGI app runs on a single event loop.
+
+Usage (from the repository root, which holds ``data/``):
+    python -m meeting_room_booking.benchmarks.async_serving --requests 200 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from meeting_room_booking.agents import RoomAppointmentAgents
+from meeting_room_booking.web import runtime
+
+FORM = {'customer_name': 'Bench User', 'customer_id': '1', 'prompt': 'show my bookings'}
+
+
+class LatencyChatModel(BaseChatModel):
+    """Stub model: a fixed delay, then the supervisor/sub-agent reply a real model would give."""
+
+    latency: float = 0.2
+
+    @property
+    def _llm_type(self) -> str:
+        return "latency-stub"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _reply(self, messages) -> AIMessage:
+        if isinstance(messages[0], SystemMessage) and 'supervisor' in messages[0].content[:100]:
+            latest = max(i for i, msg in enumerate(messages) if isinstance(msg, HumanMessage))
+            answered = any(isinstance(msg, AIMessage) for msg in messages[latest + 1:])
+            args = ({'next': 'FINISH', 'reasoning': 'answered', 'supervisor_response_content': 'Done.'} if answered
+                    else {'next': 'user_info_node', 'reasoning': 'bookings', 'supervisor_response_content': None})
+            return AIMessage(content='', tool_calls=[{'name': 'Router', 'args': args, 'id': 'router'}])
+        if isinstance(messages[-1], ToolMessage):
+            return AIMessage(content='Here are your bookings.')
+        return AIMessage(content='', tool_calls=[{'name': 'get_user_bookings', 'args': {'customer_id': '1'},
+                                                   'id': 'lookup'}])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+
+def _summary(name: str, latencies: List[float], errors: int, elapsed: float):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+    print(f"{name:6s} {len(latencies) / elapsed:8.1f} req/s   p50 {statistics.median(latencies):6.2f}s   "
+          f"p95 {p95:6.2f}s   errors {errors}   wall {elapsed:.2f}s")
+
+
+def run_sync(n_requests: int, threads: int):
+    from meeting_room_booking.web.app import app
+
+    client = app.test_client()
+
+    def one(_):
+        started = time.perf_counter()
+        response = client.post('/process', data=FORM)
+        return time.perf_counter() - started, response.status_code == 200
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(one, range(n_requests)))
+    _summary('sync', [r[0] for r in results], sum(not r[1] for r in results), time.perf_counter() - started)
+
+
+async def run_async(n_requests: int, concurrency: int):
+    from meeting_room_booking.web.asgi import app
+
+    limit = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://bench',
+                                 timeout=None) as client:
+        async def one():
+            async with limit:
+                started = time.perf_counter()
+                response = await client.post('/process', data=FORM)
+                return time.perf_counter() - started, response.status_code == 200
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(one() for _ in range(n_requests)))
+    _summary('async', [r[0] for r in results], sum(not r[1] for r in results), time.perf_counter() - started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=100, help="in-flight requests on the async server")
+    parser.add_argument('--sync-threads', type=int, default=8, help="worker threads of the sync server")
+    parser.add_argument('--latency', type=float, default=0.2, help="seconds per stub model call")
+    args = parser.parse_args(argv)
+
+    # Every request makes four model calls: supervisor, two sub-agent steps, supervisor
+    runtime.agents = RoomAppointmentAgents(fast_routing=False, model=LatencyChatModel(latency=args.latency))
+    runtime.workflow = runtime.agents.workflow()
+
+    print(f"{args.requests} requests, {4 * args.latency:.2f}s of model latency each")
+    run_sync(args.requests, args.sync_threads)
+    asyncio.run(run_async(args.requests, args.concurrency))
+
+
+if __name__ == '__main__':
+    main()
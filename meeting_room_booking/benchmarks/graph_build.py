@@ -0,0 +1,73 @@
+"""
+Per-request graph construction overhead.
+
+Before graphs were cached, every ``/process`` request compiled the supervisor graph and
+every sub-agent hop built a fresh prompt template and ReAct graph. This measures those
+build costs against the cached path (graph lookup plus rendering the time-stamped prompt).
+No model is called.
+
+Usage:
+    python -m meeting_room_booking.benchmarks.graph_build --hops 2
+"""
+
+import argparse
+import statistics
+import time
+
+from langchain_core.prompts.chat import ChatPromptTemplate
+from langgraph.prebuilt import create_react_agent
+
+from meeting_room_booking.agents.agents import RoomAppointmentAgents, _prompt_with_time
+from meeting_room_booking.tools import check_availability_features, check_specific_room
+from meeting_room_booking.utils.prompts import current_datetime, room_information_agent_prompt
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--hops', type=int, default=2, help="sub-agent hops per request")
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    agents = RoomAppointmentAgents()
+
+    def compile_graph():
+        agents.app = None
+        agents.workflow()
+
+    def build_sub_agent():
+        # What each sub-agent node used to do on every call
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", room_information_agent_prompt.format(current_datetime=current_datetime())),
+            ("placeholder", "{messages}"),
+        ])
+        create_react_agent(model=agents.llm, tools=[check_availability_features, check_specific_room],
+                           prompt=prompt, name="room_information_agent")
+
+    render_prompt = _prompt_with_time(room_information_agent_prompt)
+
+    graph_ms = _median_ms(compile_graph, args.repeat)
+    sub_agent_ms = _median_ms(build_sub_agent, args.repeat)
+    cached_ms = _median_ms(agents.workflow, args.repeat)
+    render_ms = _median_ms(lambda: render_prompt({'messages': []}), args.repeat)
+
+    before = graph_ms + args.hops * sub_agent_ms
+    after = cached_ms + (args.hops + 1) * render_ms
+    print(f"supervisor graph compile: {graph_ms:8.3f} ms")
+    print(f"sub-agent build:          {sub_agent_ms:8.3f} ms")
+    print(f"cached graph lookup:      {cached_ms:8.3f} ms")
+    print(f"prompt render:            {render_ms:8.3f} ms")
+    print(f"per request ({args.hops} hops):     {before:8.3f} ms before, {after:.3f} ms after "
+          f"({before - after:.3f} ms saved)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+"""
+HTTP load test of ``POST /process`` with concurrent simulated users.
+
+Starts a local server (Flask on a threaded WSGI server, or the ASGI app on uvicorn with
+``--workers`` processes) on a scratch copy of ``data/``, backed by the offline
+``ScriptedChatModel`` with ``--latency`` seconds per model call, or targets a running server
+given by ``--url``. ``--concurrency`` users then send a weighted mix of availability,
+booking, cancel and "my bookings" prompts, each user keeping its own session. Bookings aim
+at a small window of rooms and slots so users compete for them.
+
+Reports throughput, p50/p95/p99 latency overall and per kind of prompt, HTTP and tool error
+rates, and, after the run, reloads the bookings and checks that no room is double-booked
+and that every confirmed, uncancelled booking was persisted (with ``--url``, pass the
+server's working directory as ``--data-dir`` to check it).
+
+Usage (from the repository root, which holds ``data/``):
+    python -m meeting_room_booking.benchmarks.loadtest --requests 500 --concurrency 32 --latency 0.1
+    python -m meeting_room_booking.benchmarks.loadtest --server asgi --workers 4 --mode sqlite
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+DEFAULT_MIX = 'availability=4,book=3,cancel=1,my_bookings=2'
+FIRST_DAY = '2030-06-03'
+DAYS = 5
+HOURS = range(9, 17)
+BOOKED_RE = re.compile(r"Booking ID: (\d+)")
+CANCELLED_RE = re.compile(r"canceled booking ID (\d+)", re.IGNORECASE)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(','):
+        kind, _, weight = part.partition('=')
+        if kind not in ('availability', 'book', 'cancel', 'my_bookings'):
+            raise argparse.ArgumentTypeError(f"unknown prompt kind {kind!r}")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def _prompt(kind: str, rng: random.Random, room_ids: List[int]) -> str:
+    day = f"{FIRST_DAY[:-2]}{int(FIRST_DAY[-2:]) + rng.randrange(DAYS):02d}"
+    hour = rng.choice(HOURS)
+    if kind == 'availability':
+        if rng.random() < 0.5:
+            return f"Is room {rng.choice(room_ids)} available on {day} at {hour:02d}:00?"
+        return f"Is there a room with a projector available on {day} at {hour:02d}:00?"
+    if kind == 'book':
+        return f"Book room {rng.choice(room_ids)} on {day} at {hour:02d}:00"
+    if kind == 'cancel':
+        return "Cancel my booking"
+    return "Show my bookings"
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def _latency_summary(samples: List[dict], elapsed: float) -> Dict[str, object]:
+    latencies = [sample['seconds'] * 1000 for sample in samples]
+    n = len(samples)
+    return {
+        'requests': n,
+        'throughput_rps': round(n / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(_percentile(latencies, 0.50), 1),
+        'p95_ms': round(_percentile(latencies, 0.95), 1),
+        'p99_ms': round(_percentile(latencies, 0.99), 1),
+        'max_ms': round(max(latencies, default=0.0), 1),
+        'http_error_rate': round(sum(sample['http_error'] for sample in samples) / n, 4) if n else 0.0,
+        'tool_error_rate': round(sum(sample['tool_error'] for sample in samples) / n, 4) if n else 0.0,
+    }
+
+
+async def run_load(url: str, n_requests: int, concurrency: int, mix: Dict[str, float], room_ids: List[int],
+                   seed: int, timeout: float) -> Tuple[List[dict], float]:
+    """Send ``n_requests`` prompts from ``concurrency`` users; one sample per request."""
+    kinds, weights = list(mix), list(mix.values())
+    remaining = iter(range(n_requests))
+    samples: List[dict] = []
+
+    async def user(number: int, client: httpx.AsyncClient):
+        rng = random.Random(seed * 100003 + number)
+        form = {'customer_name': f"Load User {number}", 'customer_id': f"7{number:05d}"}
+        for _ in remaining:
+            kind = rng.choices(kinds, weights)[0]
+            started = time.perf_counter()
+            sample = {'kind': kind, 'http_error': False, 'tool_error': False, 'response': ''}
+            try:
+                response = await client.post('/process', data={**form, 'prompt': _prompt(kind, rng, room_ids)})
+                body = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
+                sample['http_error'] = response.status_code != 200 or not body.get('success')
+                sample['response'] = body.get('response') or body.get('error') or response.text[:200]
+                if body.get('session_id'):
+                    form['session_id'] = body['session_id']
+            except httpx.HTTPError as e:
+                sample['http_error'] = True
+                sample['response'] = repr(e)
+            sample['seconds'] = time.perf_counter() - started
+            sample['tool_error'] = not sample['http_error'] and sample['response'].startswith("Error")
+            samples.append(sample)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(user(number, client) for number in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return samples, elapsed
+
+
+def verify(data_dir: str, mode: str, samples: List[dict]) -> Dict[str, object]:
+    """Double bookings on disk, and confirmed bookings that were not persisted."""
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(os.path.abspath(data_dir)))
+    os.environ['BOOKING_STORAGE_MODE'] = mode
+    try:
+        from meeting_room_booking.storage import BookingStore, SQLiteBookingStore
+        store = SQLiteBookingStore() if mode == 'sqlite' else BookingStore(journaled=mode == 'journal')
+        double_bookings, stored = [], set()
+        for room in store.rooms():
+            bookings = store.room_bookings(room.room_id)
+            stored.update(str(booking.booking_id) for booking in bookings)
+            for previous, current in zip(bookings, bookings[1:]):
+                if current.start_dt < previous.end_dt:
+                    double_bookings.append(f"room {room.room_id}: {previous.booking_id} and {current.booking_id}")
+    finally:
+        os.chdir(cwd)
+
+    confirmed, cancelled = set(), set()
+    for sample in samples:
+        if sample['response'].startswith("Successfully booked"):
+            confirmed.update(BOOKED_RE.findall(sample['response']))
+        cancelled.update(CANCELLED_RE.findall(sample['response']))
+    lost = sorted(confirmed - cancelled - stored)
+    return {'double_bookings': double_bookings, 'confirmed_bookings': len(confirmed),
+            'cancelled_bookings': len(cancelled & confirmed), 'lost_bookings': lost}
+
+
+def _start_server(args, workdir: str, port: int) -> subprocess.Popen:
+    package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = {**os.environ, 'LLM_PROVIDER': 'scripted', 'LLM_LATENCY': str(args.latency),
+           'BOOKING_STORAGE_MODE': args.mode,
+           'PYTHONPATH': os.pathsep.join(filter(None, [package_root, os.environ.get('PYTHONPATH')]))}
+    if args.workers > 1:
+        # Sessions must be visible to every worker process
+        env['SESSION_STORE'] = 'sqlite'
+    if args.server == 'asgi':
+        command = [sys.executable, '-m', 'uvicorn', 'meeting_room_booking.web.asgi:app', '--host', '127.0.0.1',
+                   '--port', str(port), '--workers', str(args.workers), '--log-level', 'warning']
+    else:
+        command = [sys.executable, '-m', 'meeting_room_booking.benchmarks.loadtest', '--serve', str(port)]
+    return subprocess.Popen(command, cwd=workdir, env=env, stdout=subprocess.DEVNULL)
+
+
+def _wait_ready(url: str, server: subprocess.Popen, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"server exited with code {server.returncode}")
+        try:
+            if httpx.get(url + '/router/stats', timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server not ready after {timeout:.0f}s")
+
+
+def _serve(port: int):
+    """Flask app on a threaded WSGI server (the server process of ``--server flask``)."""
+    import logging
+    from werkzeug.serving import run_simple
+    from meeting_room_booking.web.app import app
+    # One access log line per request would dominate the driver's output
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    run_simple('127.0.0.1', port, app, threaded=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--concurrency', type=int, default=16, help="simulated users sending requests in parallel")
+    parser.add_argument('--mix', type=_parse_mix, default=_parse_mix(DEFAULT_MIX),
+                        help=f"weights of the prompt kinds (default {DEFAULT_MIX})")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds per stub model call")
+    parser.add_argument('--server', choices=['flask', 'asgi'], default='flask')
+    parser.add_argument('--workers', type=int, default=1, help="uvicorn worker processes (asgi)")
+    parser.add_argument('--mode', choices=['csv', 'journal', 'sqlite'], default='csv')
+    parser.add_argument('--url', help="load a running server instead of starting one")
+    parser.add_argument('--data-dir', help="with --url: the server's data directory, to check for double bookings")
+    parser.add_argument('--timeout', type=float, default=120.0, help="per-request timeout in seconds")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    parser.add_argument('--serve', type=int, metavar='PORT', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        _serve(args.serve)
+        return 0
+
+    server: Optional[subprocess.Popen] = None
+    workdir = None
+    data_dir = args.data_dir
+    if args.url:
+        url = args.url.rstrip('/')
+    else:
+        # Writes go to a scratch copy of the data directory
+        workdir = tempfile.mkdtemp(prefix='booking-load-')
+        data_dir = os.path.join(workdir, 'data')
+        shutil.copytree(os.path.abspath('data'), data_dir)
+        if args.mode == 'sqlite':
+            cwd = os.getcwd()
+            os.chdir(workdir)
+            from meeting_room_booking.storage import SQLiteBookingStore
+            SQLiteBookingStore().import_csv()
+            os.chdir(cwd)
+        port = _free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = _start_server(args, workdir, port)
+
+    try:
+        if server is not None:
+            _wait_ready(url, server)
+        rooms_csv = os.path.join(data_dir or 'data', 'meeting_rooms.csv')
+        with open(rooms_csv) as f:
+            room_ids = [int(line.split(',', 1)[0]) for line in f.readlines()[1:] if line.strip()]
+        samples, elapsed = asyncio.run(run_load(url, args.requests, args.concurrency, args.mix, room_ids,
+                                                args.seed, args.timeout))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    by_kind: Dict[str, List[dict]] = defaultdict(list)
+    for sample in samples:
+        by_kind[sample['kind']].append(sample)
+    summary = {'all': _latency_summary(samples, elapsed)}
+    summary.update({kind: _latency_summary(group, elapsed) for kind, group in sorted(by_kind.items())})
+    checks = verify(data_dir, args.mode, samples) if data_dir else None
+
+    for kind, values in summary.items():
+        print(f"{kind:14s} {values['requests']:6d} req  {values['throughput_rps']:8.1f} req/s   "
+              f"p50 {values['p50_ms']:8.1f} ms   p95 {values['p95_ms']:8.1f} ms   p99 {values['p99_ms']:8.1f} ms   "
+              f"http errors {values['http_error_rate']:6.2%}   tool errors {values['tool_error_rate']:6.2%}",
+              file=sys.stderr)
+    if checks is not None:
+        print(f"{checks['confirmed_bookings']} bookings confirmed, {checks['cancelled_bookings']} cancelled, "
+              f"{len(checks['double_bookings'])} double bookings, {len(checks['lost_bookings'])} lost",
+              file=sys.stderr)
+        for problem in checks['double_bookings']:
+            print(f"FAIL: double booking in {problem}", file=sys.stderr)
+        if checks['lost_bookings']:
+            print(f"FAIL: confirmed bookings missing: {', '.join(checks['lost_bookings'])}", file=sys.stderr)
+
+    report = {
+        'benchmark': 'loadtest',
+        'parameters': {'url': args.url, 'server': None if args.url else args.server, 'workers': args.workers,
+                       'mode': args.mode, 'requests': args.requests, 'concurrency': args.concurrency,
+                       'mix': args.mix, 'latency': args.latency, 'seed': args.seed},
+        'elapsed_seconds': round(elapsed, 3),
+        'summary': summary,
+        'checks': checks,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if workdir is not None:
+        shutil.rmtree(workdir, ignore_errors=True)
+    failed = checks is not None and (checks['double_bookings'] or checks['lost_bookings'])
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
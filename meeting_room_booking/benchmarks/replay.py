@@ -0,0 +1,202 @@
+"""
+Offline replay of a conversation corpus through the full workflow.
+
+Runs every conversation of a built-in corpus (availability, booking, cancellation,
+rescheduling, booking lookups and multi-turn sessions) through the supervisor graph with the
+deterministic ``ScriptedChatModel``, or with a ``ReplayChatModel`` reading responses
+recorded by an earlier run (``--save-replay`` / ``--replay``). No network access is needed,
+so the numbers isolate the framework: per intent it reports model calls, graph hops, time
+spent in the model and tools, and the remaining framework overhead per request.
+
+Writes go to a scratch copy of ``data/``. A replay file only matches runs with the same
+corpus and routing setting it was recorded with.
+
+Usage (from the repository root, which holds ``data/``):
+    python -m meeting_room_booking.benchmarks.replay --repeat 5
+    python -m meeting_room_booking.benchmarks.replay --save-replay corpus.json
+    python -m meeting_room_booking.benchmarks.replay --replay corpus.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import HumanMessage
+
+# (intent, turns): each conversation is one session of a distinct customer
+CORPUS = [
+    ('availability_features', ["Is there a room with a projector available on 2030-03-04 at 10:00?"]),
+    ('availability_features', ["Any rooms with a whiteboard and internet free on 2030-03-05 at 14:00 for 2 hours?"]),
+    ('availability_room', ["Is room 2 available on 2030-03-04 at 09:00?"]),
+    ('availability_room', ["Is room 4 free on 2030-03-06?"]),
+    ('book', ["Book room 3 on 2030-03-04 at 10:00 for 1 hour"]),
+    ('book', ["Please reserve room 5 on 2030-03-07 at 15:00"]),
+    ('my_bookings', ["Show my bookings"]),
+    ('cancel', ["Book room 4 on 2030-03-08 at 11:00", "Cancel my booking"]),
+    ('reschedule', ["Book room 1 on 2030-03-11 at 09:00", "Reschedule my booking to room 1 on 2030-03-12 at 13:00"]),
+    ('multi_turn', ["Is there a room with a projector available on 2030-03-13 at 10:00?",
+                    "Book room 2 on 2030-03-13 at 10:00",
+                    "Show my bookings",
+                    "Reschedule my booking to room 2 on 2030-03-14 at 10:00",
+                    "Cancel my booking"]),
+]
+
+
+class _Timings(BaseCallbackHandler):
+    """Counts model calls and sums model and tool wall time."""
+
+    run_inline = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started: Dict[Any, float] = {}
+        self.llm_calls = 0
+        self.llm_seconds = 0.0
+        self.tool_seconds = 0.0
+
+    def _start(self, run_id):
+        with self._lock:
+            self._started[run_id] = time.perf_counter()
+
+    def _stop(self, run_id) -> float:
+        with self._lock:
+            started = self._started.pop(run_id, None)
+        return 0.0 if started is None else time.perf_counter() - started
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self.llm_calls += 1
+        self._start(run_id)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self.llm_seconds += self._stop(run_id)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self.llm_seconds += self._stop(run_id)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        self._start(run_id)
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self.tool_seconds += self._stop(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self.tool_seconds += self._stop(run_id)
+
+
+def run_corpus(model, fast_routing: bool, repeat: int, callbacks: List[BaseCallbackHandler] = ()) -> List[dict]:
+    """Run the corpus ``repeat`` times; one result row per conversation."""
+    from meeting_room_booking.agents import RoomAppointmentAgents
+    from meeting_room_booking.agents.sessions import BoundedMemorySaver
+
+    workflow = RoomAppointmentAgents(fast_routing=fast_routing, model=model,
+                                     checkpointer=BoundedMemorySaver()).workflow()
+    rows = []
+    for round_ in range(repeat):
+        for number, (intent, turns) in enumerate(CORPUS):
+            customer_id = f"9{round_:03d}{number:02d}"
+            timings = _Timings()
+            config = {'configurable': {'thread_id': f"replay-{round_}-{number}"},
+                      'callbacks': [timings, *callbacks]}
+            hops, answers = 0, []
+            started = time.perf_counter()
+            for turn in turns:
+                state = {'messages': [HumanMessage(content=turn)], 'customer_id': customer_id,
+                         'customer_name': f"Replay {number}", 'tokens_saved': 0}
+                for update in workflow.stream(state, config, stream_mode="updates"):
+                    hops += len(update)
+                answers.append(workflow.get_state(config).values['messages'][-1].content)
+            wall = time.perf_counter() - started
+            rows.append({
+                'intent': intent, 'turns': len(turns), 'hops': hops, 'llm_calls': timings.llm_calls,
+                'wall_ms': wall * 1000, 'llm_ms': timings.llm_seconds * 1000, 'tool_ms': timings.tool_seconds * 1000,
+                'overhead_ms': (wall - timings.llm_seconds - timings.tool_seconds) * 1000,
+                'ok': not any(answer.startswith("Error") for answer in answers),
+                'answer': answers[-1][:200],
+            })
+    return rows
+
+
+def summarize(rows: List[dict]) -> Dict[str, dict]:
+    """Per intent means (per conversation, and overhead per turn)."""
+    by_intent: Dict[str, List[dict]] = defaultdict(list)
+    for row in rows:
+        by_intent[row['intent']].append(row)
+    by_intent['all'] = rows
+    summary = {}
+    for intent, group in by_intent.items():
+        n, turns = len(group), sum(row['turns'] for row in group)
+        summary[intent] = {
+            'conversations': n,
+            'llm_calls_per_conversation': round(sum(row['llm_calls'] for row in group) / n, 2),
+            'hops_per_conversation': round(sum(row['hops'] for row in group) / n, 2),
+            'wall_ms_per_turn': round(sum(row['wall_ms'] for row in group) / turns, 3),
+            'llm_ms_per_turn': round(sum(row['llm_ms'] for row in group) / turns, 3),
+            'tool_ms_per_turn': round(sum(row['tool_ms'] for row in group) / turns, 3),
+            'overhead_ms_per_turn': round(sum(row['overhead_ms'] for row in group) / turns, 3),
+            'failed': sum(not row['ok'] for row in group),
+        }
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help="passes over the corpus")
+    parser.add_argument('--no-fast-routing', action='store_true', help="route every request with the model")
+    parser.add_argument('--replay', help="replay model responses recorded in this file")
+    parser.add_argument('--save-replay', help="record the model responses of this run into this file")
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    from meeting_room_booking.utils.fake_llm import ReplayChatModel, ResponseRecorder, ScriptedChatModel
+
+    model = ReplayChatModel.from_file(args.replay) if args.replay else ScriptedChatModel()
+    recorder = ResponseRecorder() if args.save_replay else None
+    save_path = os.path.abspath(args.save_replay) if args.save_replay else None
+
+    # The tools use paths relative to the working directory; write to a scratch copy
+    source = os.path.abspath('data')
+    workdir = tempfile.mkdtemp(prefix='booking-replay-')
+    shutil.copytree(source, os.path.join(workdir, 'data'))
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        rows = run_corpus(model, not args.no_fast_routing, args.repeat, [recorder] if recorder else [])
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+    if recorder is not None:
+        recorder.save(save_path)
+
+    summary = summarize(rows)
+    for intent, values in summary.items():
+        print(f"{intent:22s} llm calls {values['llm_calls_per_conversation']:5.2f}   "
+              f"hops {values['hops_per_conversation']:5.2f}   "
+              f"overhead {values['overhead_ms_per_turn']:8.3f} ms/turn   "
+              f"tools {values['tool_ms_per_turn']:8.3f} ms/turn   failed {values['failed']}", file=sys.stderr)
+
+    report = {
+        'benchmark': 'replay',
+        'model': 'replay' if args.replay else 'scripted',
+        'fast_routing': not args.no_fast_routing,
+        'repeat': args.repeat,
+        'summary': summary,
+        'conversations': rows,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""
+Concurrency stress test for booking writes.
+
+Hammers ``book_room``/``cancel_booking`` from many threads (and optionally several
+processes) against a scratch copy of the data directory, then reloads the bookings from
+disk and checks that no room was double-booked and no write was lost.
+
+Usage:
+    python -m meeting_room_booking.benchmarks.stress --threads 32 --processes 4 --mode journal
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+BASE_TIME = datetime(2030, 1, 7, 0, 0)
+
+
+def _write_rooms(path: str, n_rooms: int):
+    with open(path, 'w') as f:
+        f.write("room_id,room_location,capacity,projector,whiteboard,internet\n")
+        for room_id in range(1, n_rooms + 1):
+            f.write(f"{room_id},Stress Building - Room {room_id},10,yes,yes,yes\n")
+
+
+def _slot(hour: int) -> str:
+    return (BASE_TIME + timedelta(hours=hour)).strftime('%Y-%m-%d %H:%M')
+
+
+def _run_threads(target, n_threads: int) -> List[dict]:
+    results = [None] * n_threads
+
+    def run(i):
+        results[i] = target(i)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def _worker(worker: int, n_threads: int, n_rooms: int, n_slots: int) -> Dict[str, int]:
+    """Run every scenario from ``n_threads`` threads; ``worker`` distinguishes processes."""
+    from meeting_room_booking.tools import book_room, cancel_booking
+
+    def same_room(i):
+        # Everybody races for the same slots of room 1: exactly one booking per slot may win
+        won = 0
+        for hour in random.sample(range(n_slots), n_slots):
+            result = book_room.invoke({'room_id': 1, 'customer_name': f'w{worker}t{i}', 'start_time': _slot(hour),
+                                       'customer_id': f'{worker}-{i}'})
+            won += result.startswith("Successfully")
+        return {'same_room_wins': won}
+
+    def different_rooms(i):
+        # Disjoint slots spread over the other rooms: every booking must succeed
+        room_id = 2 + (worker * n_threads + i) % (n_rooms - 1)
+        won = 0
+        for k in range(n_slots):
+            hour = 1000 + (worker * n_threads + i) * n_slots + k
+            result = book_room.invoke({'room_id': room_id, 'customer_name': f'w{worker}t{i}', 'start_time': _slot(hour),
+                                       'customer_id': f'{worker}-{i}'})
+            won += result.startswith("Successfully")
+        return {'different_rooms_wins': won}
+
+    def churn(i):
+        # Book then cancel in a shared room; cancels must never remove another thread's booking
+        kept = 0
+        for k in range(n_slots):
+            hour = 100000 + ((worker * n_threads + i) * n_slots + k) * 2
+            result = book_room.invoke({'room_id': 1, 'customer_name': f'w{worker}t{i}', 'start_time': _slot(hour),
+                                       'customer_id': f'{worker}-{i}'})
+            if not result.startswith("Successfully"):
+                continue
+            if k % 2:
+                booking_id = result.rsplit("Booking ID: ", 1)[1]
+                cancel_booking.invoke({'booking_id': booking_id})
+            else:
+                kept += 1
+        return {'churn_kept': kept}
+
+    totals: Dict[str, int] = {}
+    for scenario in (same_room, different_rooms, churn):
+        for result in _run_threads(scenario, n_threads):
+            for key, value in result.items():
+                totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def _process_entry(worker, n_threads, n_rooms, n_slots, queue):
+    queue.put(_worker(worker, n_threads, n_rooms, n_slots))
+
+
+def _verify(n_slots: int, n_workers: int, n_threads: int, totals: Dict[str, int]) -> List[str]:
+    from meeting_room_booking.storage import BookingStore, SQLiteBookingStore
+
+    mode = os.environ.get('BOOKING_STORAGE_MODE')
+    store = SQLiteBookingStore() if mode == 'sqlite' else BookingStore(journaled=mode == 'journal')
+    errors = []
+    for room in store.rooms():
+        bookings = store.room_bookings(room.room_id)
+        for previous, current in zip(bookings, bookings[1:]):
+            if current.start_dt < previous.end_dt:
+                errors.append(f"Room {room.room_id} double-booked: {previous.booking_id} and {current.booking_id}")
+
+    same_room = sum(1 for b in store.room_bookings(1) if b.start_dt < BASE_TIME + timedelta(hours=n_slots))
+    churn = sum(1 for b in store.room_bookings(1) if b.start_dt >= BASE_TIME + timedelta(hours=100000))
+    different = sum(len(store.room_bookings(room.room_id)) for room in store.rooms() if room.room_id != 1)
+
+    expected_different = n_workers * n_threads * n_slots
+    if totals.get('same_room_wins') != n_slots or same_room != n_slots:
+        errors.append(f"Same-room race: {totals.get('same_room_wins')} reported wins, {same_room} on disk, "
+                      f"expected {n_slots}")
+    if totals.get('different_rooms_wins') != expected_different or different != expected_different:
+        errors.append(f"Different rooms: {totals.get('different_rooms_wins')} reported, {different} on disk, "
+                      f"expected {expected_different}")
+    if churn != totals.get('churn_kept'):
+        errors.append(f"Book/cancel churn: {totals.get('churn_kept')} kept, {churn} on disk")
+    return errors
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, default=16, help="threads per process")
+    parser.add_argument('--processes', type=int, default=1, help="worker processes sharing the data directory")
+    parser.add_argument('--rooms', type=int, default=8)
+    parser.add_argument('--slots', type=int, default=12, help="slots booked per thread and scenario")
+    parser.add_argument('--mode', choices=['csv', 'journal', 'sqlite'], default='csv')
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='booking-stress-')
+    os.makedirs(os.path.join(workdir, 'data'))
+    _write_rooms(os.path.join(workdir, 'data', 'meeting_rooms.csv'), args.rooms)
+    with open(os.path.join(workdir, 'data', 'bookings.csv'), 'w') as f:
+        f.write("booking_id,room_id,customer_name,customer_id,start_time,end_time\n")
+    # The tools use paths relative to the working directory
+    os.chdir(workdir)
+    os.environ['BOOKING_STORAGE_MODE'] = args.mode
+    if args.mode == 'sqlite':
+        from meeting_room_booking.storage import SQLiteBookingStore
+        SQLiteBookingStore().import_csv()
+
+    started = time.perf_counter()
+    if args.processes == 1:
+        totals = _worker(0, args.threads, args.rooms, args.slots)
+    else:
+        context = multiprocessing.get_context('spawn')
+        queue = context.Queue()
+        processes = [context.Process(target=_process_entry, args=(w, args.threads, args.rooms, args.slots, queue))
+                     for w in range(args.processes)]
+        for process in processes:
+            process.start()
+        totals = {}
+        for _ in processes:
+            for key, value in queue.get().items():
+                totals[key] = totals.get(key, 0) + value
+        for process in processes:
+            process.join()
+    elapsed = time.perf_counter() - started
+
+    attempts = args.processes * args.threads * args.slots * 3
+    print(f"{attempts} booking attempts from {args.processes} process(es) x {args.threads} threads "
+          f"({args.mode} mode) in {elapsed:.2f}s ({attempts / elapsed:.0f}/s)")
+    print(f"Results: {totals}")
+
+    errors = _verify(args.slots, args.processes, args.threads, totals)
+    for error in errors:
+        print(f"FAIL: {error}")
+    print("FAILED" if errors else f"OK - no double bookings, no lost writes (data in {workdir})")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
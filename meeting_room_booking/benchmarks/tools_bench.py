@@ -0,0 +1,234 @@
+"""
+Microbenchmarks of the booking tools on synthetic data.
+
+For every dataset size, generates rooms and bookings with ``datagen`` in a scratch
+directory, then times each tool in ``tools/tools.py`` and the interval helpers in
+``tools/find_intervals.py`` on specific-time and whole-day queries. Every size runs in a
+fresh process, so store loading is measured cold. The availability cache is cleared
+before each timed call except in the ``cached`` cases.
+
+Results go to stdout (or ``--output``) as JSON, with the commit and library versions, so
+runs of different versions can be diffed; a readable table goes to stderr.
+
+Usage:
+    python -m meeting_room_booking.benchmarks.tools_bench --sizes 100:10000 1000:100000 --output bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from meeting_room_booking.benchmarks import datagen
+
+DEFAULT_SIZES = ['100:10000', '1000:100000', '10000:1000000']
+# Writes land far after the generated period so they never conflict with it
+WRITE_DAY = datetime(2099, 1, 5, 8, 0)
+
+
+def _time_ms(call: Callable[[], object], repeat: int, before: Callable[[], None] = None) -> Dict[str, object]:
+    samples, result = [], None
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        result = call()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    ok = not (isinstance(result, str) and result.startswith("Error"))
+    return {
+        'repeat': repeat,
+        'median_ms': round(samples[len(samples) // 2], 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'min_ms': round(samples[0], 3),
+        'mean_ms': round(sum(samples) / len(samples), 3),
+        'ok': ok,
+    }
+
+
+def _query_day(start: date, years: float) -> datetime:
+    """A working day in the middle of the generated period."""
+    middle = np.datetime64(start, 'D') + int(365.25 * years / 2)
+    day = np.busday_offset(middle, 0, roll='forward').astype(datetime)
+    return datetime(day.year, day.month, day.day)
+
+
+def _run_size(n_rooms: int, n_bookings: int, args_dict: dict) -> List[dict]:
+    """Generate one dataset and time every case; runs in its own process."""
+    workdir = tempfile.mkdtemp(prefix='booking-bench-')
+    started = time.perf_counter()
+    datagen.generate(os.path.join(workdir, 'data'), n_rooms, n_bookings, args_dict['start'], args_dict['years'],
+                     args_dict['skew'], args_dict['seed'])
+    generate_seconds = time.perf_counter() - started
+    # The tools use paths relative to the working directory
+    os.chdir(workdir)
+    os.environ['BOOKING_STORAGE_MODE'] = args_dict['mode']
+    if args_dict['mode'] == 'sqlite':
+        from meeting_room_booking.storage import SQLiteBookingStore
+        SQLiteBookingStore().import_csv()
+
+    import pandas as pd
+    from meeting_room_booking.storage import get_store
+    from meeting_room_booking.tools import (book_room, cancel_booking, check_availability_features,
+                                            check_specific_room, get_user_bookings, reschedule_booking)
+    from meeting_room_booking.tools.cache import availability_cache
+    from meeting_room_booking.tools.find_intervals import find_available_intervals, find_available_intervals_batch
+
+    repeat, write_repeat = args_dict['repeat'], args_dict['write_repeat']
+    results = []
+
+    def record(case: str, tool: str, query: str, timing: Dict[str, object]):
+        results.append({'rooms': n_rooms, 'bookings': n_bookings, 'mode': args_dict['mode'],
+                        'case': case, 'tool': tool, 'query': query, **timing})
+
+    record('generate_data', 'datagen.generate', 'all', {'repeat': 1, 'median_ms': round(generate_seconds * 1000, 3)})
+    record('load_store', 'get_store', 'all', _time_ms(lambda: get_store().rooms(), 1))
+
+    store = get_store()
+    busiest_room = max(store.rooms(), key=lambda room: len(store.room_bookings(room.room_id))).room_id
+    customers = pd.read_csv(os.path.join('data', 'bookings.csv'), usecols=['customer_id'], dtype=str)['customer_id']
+    top_customer = customers.value_counts().index[0] if len(customers) else '1000'
+    day = _query_day(args_dict['start'], args_dict['years'])
+    at_ten = day.replace(hour=10).strftime('%Y-%m-%d %H:%M')
+    whole_day = day.strftime('%Y-%m-%d')
+    clear = availability_cache.clear
+
+    for query, start in (('specific_time', at_ten), ('whole_day', whole_day)):
+        features = {'start': start, 'features': ['projector', 'internet'], 'duration': 1}
+        record('availability_features', 'check_availability_features', query,
+               _time_ms(lambda: check_availability_features.invoke(features), repeat, clear))
+        record('availability_features_cached', 'check_availability_features', query,
+               _time_ms(lambda: check_availability_features.invoke(features), repeat))
+        room = {'start': start, 'room_id': busiest_room, 'duration': 1}
+        record('specific_room_busiest', 'check_specific_room', query,
+               _time_ms(lambda: check_specific_room.invoke(room), repeat, clear))
+
+    record('user_bookings_top_customer', 'get_user_bookings', 'customer',
+           _time_ms(lambda: get_user_bookings.invoke({'customer_id': top_customer}), repeat))
+
+    day_end = day + timedelta(days=1)
+    busiest_day = [(booking.start_dt, booking.end_dt) for booking in store.overlapping(busiest_room, day, day_end)]
+    record('intervals_one_room', 'find_available_intervals', 'whole_day',
+           _time_ms(lambda: find_available_intervals(day, day_end, busiest_day), repeat))
+    room_ids = [room.room_id for room in store.rooms()]
+    position = {room_id: i for i, room_id in enumerate(room_ids)}
+    day_bookings = [(position[room_id], booking.start_dt, booking.end_dt)
+                    for room_id in room_ids for booking in store.overlapping(room_id, day, day_end)]
+    index = np.array([b[0] for b in day_bookings], dtype=np.int64)
+    starts = np.array([b[1] for b in day_bookings], dtype='datetime64[us]')
+    ends = np.array([b[2] for b in day_bookings], dtype='datetime64[us]')
+    record('intervals_all_rooms', 'find_available_intervals_batch', 'whole_day',
+           _time_ms(lambda: find_available_intervals_batch(np.datetime64(day, 'us'), np.datetime64(day_end, 'us'),
+                                                           index, starts, ends, n_rooms=len(room_ids)), repeat))
+
+    # Writes in the busiest room: book then cancel a free slot, and move one booking from slot to slot
+    slots = iter(range(10**6))
+
+    def book_and_cancel():
+        slot = WRITE_DAY + timedelta(hours=next(slots))
+        result = book_room.invoke({'room_id': busiest_room, 'customer_name': 'Bench', 'customer_id': 'bench',
+                                   'start_time': slot.strftime('%Y-%m-%d %H:%M')})
+        if result.startswith("Successfully"):
+            cancel_booking.invoke({'booking_id': result.rsplit("Booking ID: ", 1)[1]})
+        return result
+
+    record('book_and_cancel', 'book_room+cancel_booking', 'specific_time', _time_ms(book_and_cancel, write_repeat))
+
+    held = book_room.invoke({'room_id': busiest_room, 'customer_name': 'Bench', 'customer_id': 'bench',
+                             'start_time': (WRITE_DAY - timedelta(days=1)).strftime('%Y-%m-%d %H:%M')})
+    booking_id = held.rsplit("Booking ID: ", 1)[1] if held.startswith("Successfully") else None
+
+    def reschedule():
+        nonlocal booking_id
+        if booking_id is None:
+            return held
+        slot = WRITE_DAY + timedelta(hours=next(slots))
+        result = reschedule_booking.invoke({'room_id': busiest_room, 'customer_name': 'Bench', 'customer_id': 'bench',
+                                            'start_time': slot.strftime('%Y-%m-%d %H:%M'), 'duration': 1,
+                                            'booking_id': booking_id})
+        if "new booking " in result:
+            booking_id = result.split("new booking ", 1)[1].split(".", 1)[0]
+        return result
+
+    record('reschedule', 'reschedule_booking', 'specific_time', _time_ms(reschedule, write_repeat))
+    return results
+
+
+def _process_entry(n_rooms, n_bookings, args_dict, queue):
+    try:
+        queue.put(_run_size(n_rooms, n_bookings, args_dict))
+    except Exception as e:
+        queue.put([{'rooms': n_rooms, 'bookings': n_bookings, 'case': 'failed', 'error': repr(e)}])
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(__file__), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help="ROOMS:BOOKINGS pairs")
+    parser.add_argument('--years', type=float, default=2.0)
+    parser.add_argument('--start', type=date.fromisoformat, default=date(2024, 1, 1))
+    parser.add_argument('--skew', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=20, help="timed calls per read case")
+    parser.add_argument('--write-repeat', type=int, default=5, help="timed calls per write case")
+    parser.add_argument('--mode', choices=['csv', 'journal', 'sqlite'], default='csv')
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    args_dict = {'years': args.years, 'start': args.start, 'skew': args.skew, 'seed': args.seed,
+                 'repeat': args.repeat, 'write_repeat': args.write_repeat, 'mode': args.mode}
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for size in args.sizes:
+        n_rooms, n_bookings = (int(part) for part in size.split(':'))
+        queue = context.Queue()
+        process = context.Process(target=_process_entry, args=(n_rooms, n_bookings, args_dict, queue))
+        process.start()
+        size_results = queue.get()
+        process.join()
+        results += size_results
+        for row in size_results:
+            if 'error' in row:
+                print(f"{n_rooms:>6} rooms {n_bookings:>8} bookings  FAILED: {row['error']}", file=sys.stderr)
+            else:
+                print(f"{n_rooms:>6} rooms {n_bookings:>8} bookings  {row['case']:30s} {row['query']:14s} "
+                      f"{row['median_ms']:10.3f} ms{'' if row.get('ok', True) else '  (tool reported an error)'}",
+                      file=sys.stderr)
+
+    import pandas as pd
+    report = {
+        'benchmark': 'tools',
+        'commit': _commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'parameters': {key: str(value) if isinstance(value, date) else value for key, value in args_dict.items()},
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
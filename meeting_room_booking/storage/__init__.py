@@ -0,0 +1,24 @@
+"""
+Storage module for the Meeting Room Booking System.
+Contains the booking backends (CSV/journal and SQLite) that serve the tools.
+"""
+
+from meeting_room_booking.storage.base import BookingBackend
+from meeting_room_booking.storage.catalog import RoomCatalog
+from meeting_room_booking.storage.sqlite_store import SQLiteBookingStore
+from meeting_room_booking.storage.store import (
+    Booking,
+    BookingStore,
+    Room,
+    get_store
+)
+
+__all__ = [
+    'BookingBackend',
+    'RoomCatalog',
+    'SQLiteBookingStore',
+    'Booking',
+    'BookingStore',
+    'Room',
+    'get_store'
+]
@@ -0,0 +1,136 @@
+"""
+Storage backend interface for the Meeting Room Booking System.
+
+The tools only talk to this interface, so any backend (CSV files, SQLite, ...) can
+serve them unchanged.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Optional
+
+from meeting_room_booking.storage.catalog import RoomCatalog
+
+
+class BookingBackend(ABC):
+    """Rooms catalog plus bookings with atomic write operations."""
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Counter that changes whenever rooms or bookings change, including writes by other processes."""
+
+    @abstractmethod
+    def rooms(self) -> list:
+        """All rooms in catalog order."""
+
+    @abstractmethod
+    def get_room(self, room_id: int):
+        """The room with this ID, or None."""
+
+    def catalog(self) -> RoomCatalog:
+        """Feature/capacity index over ``rooms()``; backends cache it until the rooms change."""
+        return RoomCatalog(self.rooms())
+
+    @abstractmethod
+    def get_booking(self, booking_id: str):
+        """The booking with this ID, or None."""
+
+    def has_booking_id(self, booking_id: str) -> bool:
+        return self.get_booking(booking_id) is not None
+
+    @abstractmethod
+    def room_bookings(self, room_id: int) -> list:
+        """Valid bookings for a room in start-time order."""
+
+    @abstractmethod
+    def overlapping(self, room_id: int, start: datetime, end: datetime) -> list:
+        """Bookings of a room that overlap [start, end), in start-time order."""
+
+    def has_conflict(self, room_id: int, start: datetime, end: datetime) -> bool:
+        """Whether any booking of the room overlaps [start, end)."""
+        return bool(self.overlapping(room_id, start, end))
+
+    def day_bookings(self, room_id: int, day: datetime) -> list:
+        """Bookings of a room that overlap the calendar day containing ``day``."""
+        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.overlapping(room_id, day_start, day_start + timedelta(days=1))
+
+    @abstractmethod
+    def customer_bookings(self, customer_id: str) -> list:
+        """All bookings made by a customer."""
+
+    @abstractmethod
+    def series_bookings(self, series_id: str) -> list:
+        """Occurrences of a recurring series in start-time order."""
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+    @abstractmethod
+    def allocate_booking_ids(self, count: int = 1) -> list:
+        """
+        Reserve ``count`` new booking IDs: increasing numbers above every existing numeric ID,
+        never handed out twice, safe across threads and processes.
+        """
+
+    @abstractmethod
+    def book(self, booking) -> bool:
+        """
+        Atomically add a booking if its room is free for the booking's time range.
+
+        Returns:
+            True if the booking was stored, False if it overlaps an existing booking
+
+        Raises:
+            ValueError: If the booking ID is already in use
+        """
+
+    @abstractmethod
+    def add_booking(self, booking):
+        """Add (or overwrite) a booking without checking for conflicts."""
+
+    @abstractmethod
+    def remove_booking(self, booking_id: str):
+        """Remove a booking by ID. Returns the removed booking, if any."""
+
+    @abstractmethod
+    def reschedule(self, booking_id: str, booking) -> Optional[bool]:
+        """
+        Atomically replace a booking with a new one.
+
+        Returns:
+            None if ``booking_id`` does not exist, False if the new slot is taken, True on success
+        """
+
+    @abstractmethod
+    def book_many(self, bookings: list, partial: bool = False) -> list:
+        """
+        Atomically add several bookings. Nothing is stored if any of them conflicts, unless
+        ``partial`` is set, in which case the free ones are stored.
+
+        Returns:
+            The conflicting bookings (empty if everything was stored)
+
+        Raises:
+            ValueError: If a booking ID is already in use
+        """
+
+    @abstractmethod
+    def cancel_series(self, series_id: str, after: Optional[datetime] = None) -> list:
+        """Remove the occurrences of a series starting at or after ``after`` (all if None). Returns them."""
+
+    @abstractmethod
+    def reschedule_series(self, series_id: str, bookings: list) -> Optional[list]:
+        """
+        Atomically replace occurrences of a series with new versions carrying the same booking IDs.
+
+        Returns:
+            None if the series does not exist, otherwise the conflicting new bookings (empty on success)
+
+        Raises:
+            ValueError: If a booking does not belong to the series
+        """
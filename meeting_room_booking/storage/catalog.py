@@ -0,0 +1,132 @@
+"""
+Room catalog index for the Meeting Room Booking System.
+
+Feature and capacity filters run against a columnar view of the rooms built once per
+catalog load instead of re-checking every room for every requested feature. Each room's
+yes/no features are packed into an integer bitmask, so "has all of these features" is a
+single AND per room, and capacities are kept sorted so a capacity constraint is a binary
+search that yields a contiguous run of rooms.
+
+Feature names are not fixed: every yes/no column of ``meeting_rooms.csv`` is a feature
+(see ``feature_columns``).
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# Columns every catalog has; any other yes/no column is a feature
+BASE_ROOM_COLUMNS = ['room_id', 'room_location', 'capacity']
+FEATURE_VALUES = ('yes', 'no')
+
+_CAPACITY_RE = re.compile(r'capacity\s*(>=|<=|==?|>|<)\s*(\d+)')
+# Feature names double as SQLite column names, so they are restricted to identifiers
+_FEATURE_NAME_RE = re.compile(r'[a-z][a-z0-9_]*')
+
+
+def feature_key(name: str) -> str:
+    """Normalized feature name: lower case, with spaces and dashes as underscores."""
+    return re.sub(r'[\s-]+', '_', str(name).strip().lower())
+
+
+def feature_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Columns of a rooms DataFrame (read with ``dtype=str``) that hold yes/no features.
+
+    A column qualifies when its name is a valid feature name and every non-blank value is
+    'yes' or 'no' (case-insensitive), with at least one such value.
+    """
+    columns = []
+    for column in df.columns:
+        if column in BASE_ROOM_COLUMNS or not _FEATURE_NAME_RE.fullmatch(feature_key(column)):
+            continue
+        values = df[column].str.strip().str.lower()
+        values = values[values != '']
+        if len(values) and values.isin(FEATURE_VALUES).all():
+            columns.append(column)
+    return columns
+
+
+def _capacity_bounds(features: Sequence[str]) -> Tuple[Optional[int], Optional[int]]:
+    """Combine every capacity constraint into one inclusive (low, high) range; None means unbounded."""
+    low = high = None
+    for feature in features:
+        match = _CAPACITY_RE.match(feature.strip().lower())
+        if not match:
+            continue
+        operator, value = match.group(1), int(match.group(2))
+        if operator in ('>', '>='):
+            bound = value + 1 if operator == '>' else value
+            low = bound if low is None else max(low, bound)
+        if operator in ('<', '<='):
+            bound = value - 1 if operator == '<' else value
+            high = bound if high is None else min(high, bound)
+        if operator in ('=', '=='):
+            low = value if low is None else max(low, value)
+            high = value if high is None else min(high, value)
+    return low, high
+
+
+class RoomCatalog:
+    """
+    Rooms indexed for feature and capacity filtering.
+
+    ``_masks[i]`` has bit ``_bits[name]`` set when room ``i`` (in catalog order) has the
+    feature. ``_capacities`` is sorted, and ``_by_capacity[j]`` is the catalog position of
+    the room with the j-th smallest capacity; rooms without a capacity are left out of both,
+    so they never satisfy a capacity constraint.
+    """
+
+    def __init__(self, rooms: list, feature_names: Optional[Sequence[str]] = None):
+        self.rooms = list(rooms)
+        if feature_names is None:
+            feature_names = list(dict.fromkeys(name for room in self.rooms for name in room.features))
+        self.feature_names = list(feature_names)
+        self._bits: Dict[str, int] = {name: 1 << bit for bit, name in enumerate(self.feature_names)}
+        self._masks = [sum(self._bits[name] for name, enabled in room.features.items() if enabled)
+                       for room in self.rooms]
+
+        by_capacity = sorted((room.capacity, position) for position, room in enumerate(self.rooms)
+                             if room.capacity is not None)
+        self._capacities = [capacity for capacity, _ in by_capacity]
+        self._by_capacity = [position for _, position in by_capacity]
+
+    def __len__(self) -> int:
+        return len(self.rooms)
+
+    def mask(self, names: Sequence[str]) -> int:
+        """
+        Bitmask of the given feature names.
+
+        Raises:
+            ValueError: If a name is not a feature of this catalog
+        """
+        keys = [feature_key(name) for name in names]
+        unknown = [key for key in keys if key not in self._bits]
+        if unknown:
+            available = ', '.join(self.feature_names) or 'none'
+            raise ValueError(f"Unknown room feature(s): {', '.join(unknown)}. Available features: {available}")
+        return sum(self._bits[key] for key in set(keys))
+
+    def filter(self, features: Sequence[str]) -> list:
+        """
+        Rooms (in catalog order) that have every requested feature and satisfy every capacity
+        constraint such as 'capacity>10' (operators >, <, >=, <=, =). Entries that mention
+        capacity without a constraint, e.g. just 'capacity', match any room.
+
+        Raises:
+            ValueError: If a requested feature is not in the catalog
+        """
+        required = self.mask([feature for feature in features if 'capacity' not in feature.lower()])
+        low, high = _capacity_bounds(features)
+
+        if low is None and high is None:
+            positions = range(len(self.rooms))
+        else:
+            first = 0 if low is None else bisect_left(self._capacities, low)
+            last = len(self._capacities) if high is None else bisect_right(self._capacities, high)
+            positions = sorted(self._by_capacity[first:last])
+        masks = self._masks
+        return [self.rooms[position] for position in positions if masks[position] & required == required]
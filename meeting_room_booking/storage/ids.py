@@ -0,0 +1,55 @@
+"""
+Booking ID allocation for the Meeting Room Booking System.
+
+New booking IDs come from a persisted sequence instead of random four-digit numbers, so
+allocating one is O(1) and can never collide or run out. The sequence always continues
+above the highest numeric booking ID in the data, which keeps the existing four-digit IDs
+valid: a store that predates the sequence simply carries on from its largest ID.
+"""
+
+import os
+import threading
+from typing import List
+
+from meeting_room_booking.storage.locks import FileLock
+
+# Width of the counter record; fixed so an update is a single in-place write
+_RECORD_WIDTH = 20
+
+
+class BookingSequence:
+    """
+    Monotonic counter kept in a small file and shared by threads and processes.
+
+    The file holds the last issued number. ``allocate`` reads, increments and rewrites it
+    under a thread lock plus a byte-range lock on the same file. The owning store raises
+    ``floor`` to every numeric ID it loads, so a deleted or damaged counter file, or IDs
+    added to the CSV by hand, can never cause an existing ID to be handed out again.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.floor = 0
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(path)
+
+    def raise_floor(self, booking_id) -> None:
+        """Make sure the sequence continues above ``booking_id`` (non-numeric IDs are ignored)."""
+        value = str(booking_id)
+        if value.isdigit() and int(value) > self.floor:
+            self.floor = int(value)
+
+    def allocate(self, count: int = 1) -> List[int]:
+        """Reserve ``count`` consecutive new numbers."""
+        if count < 1:
+            return []
+        with self._lock, self._file_lock.hold(0):
+            fd = self._file_lock.fileno()
+            try:
+                last = int(os.pread(fd, _RECORD_WIDTH + 1, 0).strip() or 0)
+            except ValueError:
+                # A torn write from a crash; the floor still covers every stored booking
+                last = 0
+            last = max(last, self.floor)
+            os.pwrite(fd, f"{last + count:0{_RECORD_WIDTH}d}\n".encode('ascii'), 0)
+        return list(range(last + 1, last + count + 1))
@@ -0,0 +1,27 @@
+"""
+One-shot importer from the CSV data files into a SQLite booking database.
+
+Usage:
+    python -m meeting_room_booking.storage.importer --db data/bookings.db
+"""
+
+import argparse
+
+from meeting_room_booking.storage.sqlite_store import DB_FILE, SQLiteBookingStore
+from meeting_room_booking.storage.store import BOOKINGS_FILE, ROOMS_FILE
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import the CSV data files into a SQLite booking database.")
+    parser.add_argument('--db', default=DB_FILE, help=f"database file (default: {DB_FILE})")
+    parser.add_argument('--rooms', default=ROOMS_FILE, help=f"rooms CSV (default: {ROOMS_FILE})")
+    parser.add_argument('--bookings', default=BOOKINGS_FILE, help=f"bookings CSV (default: {BOOKINGS_FILE})")
+    args = parser.parse_args(argv)
+
+    counts = SQLiteBookingStore(args.db).import_csv(args.rooms, args.bookings)
+    print(f"Imported {counts['rooms']} rooms and {counts['bookings']} bookings into {args.db} "
+          f"({counts['skipped']} invalid bookings skipped)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Per-room interval index for the Meeting Room Booking System.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Sequence, Tuple
+
+Interval = Tuple[datetime, datetime]
+
+
+class RoomIndex:
+    """
+    Bookings of a single room kept sorted by start time.
+
+    Overlap and day queries bisect into the sorted start times. Because bookings can
+    be of any length, the index also tracks the longest booking it has seen: a booking
+    can only end after ``start`` if it began after ``start - max_duration``, which bounds
+    the slice that has to be checked.
+    """
+
+    def __init__(self):
+        self._starts: List[datetime] = []
+        self._bookings: list = []
+        self._max_duration = timedelta(0)
+
+    @classmethod
+    def from_bookings(cls, bookings: list) -> 'RoomIndex':
+        """Build an index in one sort instead of repeated inserts."""
+        index = cls()
+        index._bookings = sorted(bookings, key=lambda booking: booking.start_dt)
+        index._starts = [booking.start_dt for booking in index._bookings]
+        if index._bookings:
+            index._max_duration = max(timedelta(0), max(booking.end_dt - booking.start_dt
+                                                        for booking in index._bookings))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._bookings)
+
+    def bookings(self) -> list:
+        """All bookings in start-time order."""
+        return list(self._bookings)
+
+    def add(self, booking):
+        """Insert a booking, keeping the index sorted by start time."""
+        position = bisect_right(self._starts, booking.start_dt)
+        self._starts.insert(position, booking.start_dt)
+        self._bookings.insert(position, booking)
+        self._max_duration = max(self._max_duration, booking.end_dt - booking.start_dt)
+
+    def remove(self, booking) -> bool:
+        """Remove a booking from the index. Returns False if it was not indexed."""
+        position = bisect_left(self._starts, booking.start_dt)
+        while position < len(self._starts) and self._starts[position] == booking.start_dt:
+            if self._bookings[position] is booking:
+                del self._starts[position]
+                del self._bookings[position]
+                return True
+            position += 1
+        return False
+
+    def overlapping(self, start: datetime, end: datetime) -> list:
+        """Bookings that overlap the half-open interval [start, end), in start-time order."""
+        lo = bisect_right(self._starts, start - self._max_duration)
+        hi = bisect_left(self._starts, end)
+        return [booking for booking in self._bookings[lo:hi] if booking.end_dt > start]
+
+    def has_overlap(self, start: datetime, end: datetime) -> bool:
+        """Whether anything in the room overlaps [start, end)."""
+        lo = bisect_right(self._starts, start - self._max_duration)
+        hi = bisect_left(self._starts, end)
+        return any(self._bookings[i].end_dt > start for i in range(lo, hi))
+
+    def on_day(self, day: datetime) -> list:
+        """Bookings that overlap the calendar day containing ``day``."""
+        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.overlapping(day_start, day_start + timedelta(days=1))
+
+
+def merge_intervals(busy: Sequence[Interval]) -> List[Interval]:
+    """
+    Fold intervals sorted by start into disjoint, non-touching blocks. Unlike the input,
+    the blocks' ends are increasing, which is what lets a sweep move strictly forward.
+    """
+    blocks: List[Interval] = []
+    for start, end in busy:
+        if blocks and start <= blocks[-1][1]:
+            if end > blocks[-1][1]:
+                blocks[-1] = (blocks[-1][0], end)
+        else:
+            blocks.append((start, end))
+    return blocks
+
+
+def sweep_overlaps(intervals: Sequence[Interval], busy: Sequence[Interval]) -> List[int]:
+    """
+    Positions of ``intervals`` that overlap any interval in ``busy``, both sorted by start,
+    in a single forward pass over both lists.
+    """
+    blocks = merge_intervals(busy)
+    hits, j = [], 0
+    for position, (start, end) in enumerate(intervals):
+        while j < len(blocks) and blocks[j][1] <= start:
+            j += 1
+        if j < len(blocks) and blocks[j][0] < end:
+            hits.append(position)
+    return hits
+
+
+def find_conflicts(bookings: list, busy: Callable[[int, datetime, datetime], List[Interval]]) -> list:
+    """
+    Bookings among ``bookings`` that cannot all be stored together.
+
+    Each room is handled in one sweep: ``busy(room_id, start, end)`` returns the room's
+    existing (start, end) intervals overlapping the span of the new bookings, sorted by
+    start. A new booking also conflicts when it overlaps an earlier one of the same batch.
+
+    Returns:
+        The conflicting bookings, in input order
+    """
+    by_room: Dict[int, list] = {}
+    for booking in bookings:
+        by_room.setdefault(booking.room_id, []).append(booking)
+
+    conflicting = set()
+    for room_id, room_bookings in by_room.items():
+        room_bookings = sorted(room_bookings, key=lambda booking: booking.start_dt)
+        intervals = [(booking.start_dt, booking.end_dt) for booking in room_bookings]
+        existing = busy(room_id, intervals[0][0], max(end for _, end in intervals))
+        conflicting.update(id(room_bookings[position]) for position in sweep_overlaps(intervals, existing))
+        latest_end = None
+        for booking in room_bookings:
+            if latest_end is not None and booking.start_dt < latest_end:
+                conflicting.add(id(booking))
+            latest_end = booking.end_dt if latest_end is None else max(latest_end, booking.end_dt)
+    return [booking for booking in bookings if id(booking) in conflicting]
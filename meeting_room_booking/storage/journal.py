@@ -0,0 +1,87 @@
+"""
+Append-only booking journal for the Meeting Room Booking System.
+
+Each booking or cancellation is written as one JSON line. The bookings CSV acts as the
+snapshot; the store replays the journal on top of it and periodically compacts the two
+back into a fresh snapshot.
+"""
+
+import json
+import os
+from typing import List, Tuple
+
+
+class BookingJournal:
+    """
+    A JSON-lines write-ahead log.
+
+    Appends are a single ``write`` on an ``O_APPEND`` descriptor followed by ``fsync``, so a
+    crash can at worst leave one incomplete trailing line. ``read`` skips it, and the next
+    append starts on a fresh line so the torn record cannot swallow it.
+    """
+
+    def __init__(self, path: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def append(self, record: dict) -> int:
+        """Append a record and return the journal size after the write."""
+        data = (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+        fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            size = os.fstat(fd).st_size
+            if size and os.pread(fd, 1, size - 1) != b'\n':
+                data = b'\n' + data
+            os.write(fd, data)
+            if self.fsync:
+                os.fsync(fd)
+            return os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+
+    def read(self, offset: int = 0) -> Tuple[List[dict], int]:
+        """
+        Read the complete records that follow ``offset``.
+
+        Returns:
+            (records, offset just past the last complete line)
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], 0
+
+        end = data.rfind(b'\n') + 1
+        records = []
+        for line in data[:end].splitlines():
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # A torn write from an earlier crash; the records around it are still valid
+                continue
+        return records, offset + end
+
+    def discard_before(self, offset: int):
+        """Atomically drop everything before ``offset``, keeping later appends."""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                tail = f.read()
+        except FileNotFoundError:
+            tail = b''
+
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(tail)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
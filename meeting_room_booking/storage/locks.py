@@ -0,0 +1,81 @@
+"""
+Locking helpers for the Meeting Room Booking System.
+
+Booking writes are guarded at two levels: a ``threading.Lock`` per room for threads of the
+same process, and a POSIX byte-range lock per room on a shared lock file for other
+processes. Byte 0 of the lock file is reserved for the store-wide write lock, byte
+``room_id + 1`` belongs to the room.
+"""
+
+import errno
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking is available
+    fcntl = None
+
+
+class FileLock:
+    """
+    Exclusive byte-range locks on a single lock file.
+
+    POSIX record locks belong to the process, not the thread, and are all released when
+    any descriptor of the file is closed. The descriptor is therefore opened once and kept
+    for the lifetime of the object, and callers must serialize threads themselves.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = None
+        self._fd_lock = threading.Lock()
+
+    def fileno(self) -> int:
+        """The lock file's descriptor, for callers that keep data in the lock file itself."""
+        if self._fd is None:
+            with self._fd_lock:
+                if self._fd is None:
+                    self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        return self._fd
+
+    @contextmanager
+    def hold(self, slot: int):
+        """Hold an exclusive lock on byte ``slot`` of the lock file."""
+        if fcntl is None:
+            yield
+            return
+        fd = self.fileno()
+        while True:
+            try:
+                fcntl.lockf(fd, fcntl.LOCK_EX, 1, slot)
+                break
+            except OSError as e:
+                # The kernel tracks lock waits per process, so two multi-threaded processes
+                # waiting on each other's *different* threads look like a deadlock. Locks are
+                # always taken in a fixed order, so back off and retry.
+                if e.errno != errno.EDEADLK:
+                    raise
+                time.sleep(0.001)
+        try:
+            yield
+        finally:
+            fcntl.lockf(fd, fcntl.LOCK_UN, 1, slot)
+
+
+class KeyedLocks:
+    """A lazily created ``threading.Lock`` per key."""
+
+    def __init__(self):
+        self._locks: Dict[object, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key) -> threading.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._guard:
+                lock = self._locks.setdefault(key, threading.Lock())
+        return lock
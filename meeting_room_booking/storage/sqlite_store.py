@@ -0,0 +1,383 @@
+"""
+SQLite storage backend for the Meeting Room Booking System.
+
+Bookings live in an indexed SQLite database instead of CSV files. Times are stored as
+'YYYY-MM-DD HH:MM' text, whose lexicographic order is chronological, so range queries
+can use the ``(room_id, start_time, end_time)`` index directly.
+
+Import the existing CSV data once with:
+    python -m meeting_room_booking.storage.importer --db data/bookings.db
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from meeting_room_booking.storage.base import BookingBackend
+from meeting_room_booking.storage.catalog import BASE_ROOM_COLUMNS, RoomCatalog
+from meeting_room_booking.storage.index import find_conflicts
+from meeting_room_booking.storage.store import (
+    BOOKINGS_FILE,
+    ROOM_FEATURES,
+    ROOMS_FILE,
+    TIME_FORMAT,
+    Booking,
+    Room,
+    read_bookings,
+    read_rooms,
+)
+
+DB_FILE = "data/bookings.db"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS rooms (
+    room_id INTEGER PRIMARY KEY,
+    room_location TEXT NOT NULL,
+    capacity INTEGER,
+    {', '.join(f'{name} INTEGER NOT NULL DEFAULT 0' for name in ROOM_FEATURES)}
+);
+CREATE TABLE IF NOT EXISTS bookings (
+    booking_id TEXT PRIMARY KEY,
+    room_id INTEGER NOT NULL,
+    customer_name TEXT NOT NULL,
+    customer_id TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    series_id TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_bookings_room_time ON bookings (room_id, start_time, end_time);
+CREATE INDEX IF NOT EXISTS idx_bookings_customer ON bookings (customer_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Created after the migration below, so databases from before recurring series get the column first
+SERIES_INDEX = "CREATE INDEX IF NOT EXISTS idx_bookings_series ON bookings (series_id) WHERE series_id != ''"
+
+# Rooms have one 0/1 column per feature after the base columns; import_csv adds columns for new features
+_ROOM_BASE = len(BASE_ROOM_COLUMNS)
+
+_BOOKING_COLUMNS = "booking_id, room_id, customer_name, customer_id, start_time, end_time, series_id"
+_BOOKING_VALUES = "?, ?, ?, ?, ?, ?, ?"
+
+
+def _booking_values(booking: Booking) -> tuple:
+    return (booking.booking_id, booking.room_id, booking.customer_name, booking.customer_id,
+            booking.start_dt.strftime(TIME_FORMAT), booking.end_dt.strftime(TIME_FORMAT), booking.series_id)
+
+
+def _rooms_from_cursor(cursor: sqlite3.Cursor) -> List[Room]:
+    names = [column[0] for column in cursor.description][_ROOM_BASE:]
+    return [Room(room_id=row[0], room_location=row[1], capacity=row[2],
+                 features={name: bool(flag) for name, flag in zip(names, row[_ROOM_BASE:])})
+            for row in cursor.fetchall()]
+
+
+def _booking_from_row(row) -> Booking:
+    booking_id, room_id, customer_name, customer_id, start_time, end_time, series_id = row
+    return Booking(
+        booking_id=booking_id,
+        room_id=room_id,
+        customer_name=customer_name,
+        customer_id=customer_id,
+        start_time=start_time,
+        end_time=end_time,
+        start_dt=datetime.strptime(start_time, TIME_FORMAT),
+        end_dt=datetime.strptime(end_time, TIME_FORMAT),
+        series_id=series_id,
+    )
+
+
+class SQLiteBookingStore(BookingBackend):
+    """
+    Booking backend on a local SQLite database.
+
+    Each thread gets its own connection. The database runs in WAL mode, so readers never
+    block the writer, and every write is a ``BEGIN IMMEDIATE`` transaction, which makes the
+    conflict check and the insert atomic across threads and processes.
+
+    Overlap queries bound the index range scan from below with the longest booking duration
+    seen so far (kept in the ``meta`` table), like the in-memory ``RoomIndex``.
+    """
+
+    def __init__(self, db_path: str = DB_FILE, timeout: float = 30.0):
+        self.db_path = db_path
+        self.timeout = timeout
+        self._local = threading.local()
+        # (rooms_version, catalog) of the last catalog() call
+        self._catalog: Tuple[int, Optional[RoomCatalog]] = (-1, None)
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(bookings)")}
+        if 'series_id' not in columns:
+            conn.execute("ALTER TABLE bookings ADD COLUMN series_id TEXT NOT NULL DEFAULT ''")
+        conn.execute(SERIES_INDEX)
+        # Databases from before the booking ID sequence continue above their largest numeric ID
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) "
+                     "SELECT 'booking_seq', COALESCE(MAX(CAST(booking_id AS INTEGER)), 0) FROM bookings "
+                     "WHERE booking_id != '' AND booking_id NOT GLOB '*[^0-9]*'")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode: transactions are opened explicitly in _transaction()
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    def _max_duration(self, conn: sqlite3.Connection) -> timedelta:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'max_duration_minutes'").fetchone()
+        return timedelta(minutes=row[0] if row else 0)
+
+    def _record_duration(self, conn: sqlite3.Connection, booking: Booking):
+        minutes = int((booking.end_dt - booking.start_dt).total_seconds() // 60) + 1
+        conn.execute("INSERT INTO meta (key, value) VALUES ('max_duration_minutes', ?) "
+                     "ON CONFLICT (key) DO UPDATE SET value = MAX(value, excluded.value)", (minutes,))
+
+    def _raise_sequence(self, conn: sqlite3.Connection, floor: int):
+        conn.execute("INSERT INTO meta (key, value) VALUES ('booking_seq', ?) "
+                     "ON CONFLICT (key) DO UPDATE SET value = MAX(value, excluded.value)", (floor,))
+
+    def _bump_version(self, conn: sqlite3.Connection):
+        conn.execute("INSERT INTO meta (key, value) VALUES ('version', 1) "
+                     "ON CONFLICT (key) DO UPDATE SET value = value + 1")
+
+    def _overlapping(self, conn: sqlite3.Connection, room_id: int, start: datetime, end: datetime) -> List[Booking]:
+        lower = start - self._max_duration(conn)
+        rows = conn.execute(
+            f"SELECT {_BOOKING_COLUMNS} FROM bookings "
+            "WHERE room_id = ? AND start_time > ? AND start_time < ? AND end_time > ? "
+            "ORDER BY start_time",
+            (room_id, lower.strftime(TIME_FORMAT), end.strftime(TIME_FORMAT), start.strftime(TIME_FORMAT)),
+        ).fetchall()
+        return [_booking_from_row(row) for row in rows]
+
+    def _insert(self, conn: sqlite3.Connection, booking: Booking, replace: bool = False):
+        verb = "INSERT OR REPLACE" if replace else "INSERT"
+        conn.execute(f"{verb} INTO bookings ({_BOOKING_COLUMNS}) VALUES ({_BOOKING_VALUES})",
+                     _booking_values(booking))
+        self._record_duration(conn, booking)
+        if booking.booking_id.isdigit():
+            self._raise_sequence(conn, int(booking.booking_id))
+        self._bump_version(conn)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @property
+    def version(self) -> int:
+        row = self._connection().execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else 0
+
+    def rooms(self) -> List[Room]:
+        return _rooms_from_cursor(self._connection().execute("SELECT * FROM rooms ORDER BY rowid"))
+
+    def get_room(self, room_id: int) -> Optional[Room]:
+        rooms = _rooms_from_cursor(self._connection().execute("SELECT * FROM rooms WHERE room_id = ?", (room_id,)))
+        return rooms[0] if rooms else None
+
+    def catalog(self) -> RoomCatalog:
+        """Feature/capacity index over the rooms, rebuilt only after an import changed them."""
+        row = self._connection().execute("SELECT value FROM meta WHERE key = 'rooms_version'").fetchone()
+        rooms_version = row[0] if row else 0
+        cached_version, catalog = self._catalog
+        if catalog is None or cached_version != rooms_version:
+            catalog = RoomCatalog(self.rooms())
+            self._catalog = (rooms_version, catalog)
+        return catalog
+
+    def get_booking(self, booking_id: str) -> Optional[Booking]:
+        row = self._connection().execute(
+            f"SELECT {_BOOKING_COLUMNS} FROM bookings WHERE booking_id = ?", (booking_id,)
+        ).fetchone()
+        return _booking_from_row(row) if row else None
+
+    def room_bookings(self, room_id: int) -> List[Booking]:
+        rows = self._connection().execute(
+            f"SELECT {_BOOKING_COLUMNS} FROM bookings WHERE room_id = ? ORDER BY start_time", (room_id,)
+        ).fetchall()
+        return [_booking_from_row(row) for row in rows]
+
+    def overlapping(self, room_id: int, start: datetime, end: datetime) -> List[Booking]:
+        return self._overlapping(self._connection(), room_id, start, end)
+
+    def customer_bookings(self, customer_id: str) -> List[Booking]:
+        rows = self._connection().execute(
+            f"SELECT {_BOOKING_COLUMNS} FROM bookings WHERE customer_id = ?", (customer_id,)
+        ).fetchall()
+        return [_booking_from_row(row) for row in rows]
+
+    def series_bookings(self, series_id: str) -> List[Booking]:
+        rows = self._connection().execute(
+            f"SELECT {_BOOKING_COLUMNS} FROM bookings WHERE series_id = ? AND series_id != '' ORDER BY start_time",
+            (series_id,),
+        ).fetchall()
+        return [_booking_from_row(row) for row in rows]
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+    def allocate_booking_ids(self, count: int = 1) -> List[str]:
+        if count < 1:
+            return []
+        with self._transaction() as conn:
+            conn.execute("UPDATE meta SET value = value + ? WHERE key = 'booking_seq'", (count,))
+            last = conn.execute("SELECT value FROM meta WHERE key = 'booking_seq'").fetchone()[0] - count
+            return [str(number) for number in range(last + 1, last + count + 1)]
+
+    def book(self, booking: Booking) -> bool:
+        with self._transaction() as conn:
+            if self._overlapping(conn, booking.room_id, booking.start_dt, booking.end_dt):
+                return False
+            try:
+                self._insert(conn, booking)
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Booking ID {booking.booking_id} already exists")
+            return True
+
+    def add_booking(self, booking: Booking):
+        with self._transaction() as conn:
+            self._insert(conn, booking, replace=True)
+
+    def remove_booking(self, booking_id: str) -> Optional[Booking]:
+        with self._transaction() as conn:
+            row = conn.execute(f"SELECT {_BOOKING_COLUMNS} FROM bookings WHERE booking_id = ?",
+                               (booking_id,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("DELETE FROM bookings WHERE booking_id = ?", (booking_id,))
+            self._bump_version(conn)
+            return _booking_from_row(row)
+
+    def reschedule(self, booking_id: str, booking: Booking) -> Optional[bool]:
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM bookings WHERE booking_id = ?", (booking_id,)).fetchone() is None:
+                return None
+            conflicts = self._overlapping(conn, booking.room_id, booking.start_dt, booking.end_dt)
+            if any(other.booking_id != booking_id for other in conflicts):
+                return False
+            conn.execute("DELETE FROM bookings WHERE booking_id = ?", (booking_id,))
+            try:
+                self._insert(conn, booking)
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Booking ID {booking.booking_id} already exists")
+            return True
+
+    def _busy(self, conn: sqlite3.Connection, room_id: int, start: datetime, end: datetime,
+              ignore=frozenset()) -> List[Tuple[datetime, datetime]]:
+        return [(booking.start_dt, booking.end_dt) for booking in self._overlapping(conn, room_id, start, end)
+                if booking.booking_id not in ignore]
+
+    def book_many(self, bookings: List[Booking], partial: bool = False) -> List[Booking]:
+        if not bookings:
+            return []
+        with self._transaction() as conn:
+            conflicts = find_conflicts(bookings, lambda room_id, start, end: self._busy(conn, room_id, start, end))
+            if conflicts and not partial:
+                return conflicts
+            rejected = {id(booking) for booking in conflicts}
+            try:
+                for booking in bookings:
+                    if id(booking) not in rejected:
+                        self._insert(conn, booking)
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Booking ID {booking.booking_id} already exists")
+            return conflicts
+
+    def cancel_series(self, series_id: str, after: Optional[datetime] = None) -> List[Booking]:
+        with self._transaction() as conn:
+            query = f"SELECT {_BOOKING_COLUMNS} FROM bookings WHERE series_id = ? AND series_id != ''"
+            params = [series_id]
+            if after is not None:
+                query += " AND start_time >= ?"
+                params.append(after.strftime(TIME_FORMAT))
+            removed = [_booking_from_row(row) for row in conn.execute(query + " ORDER BY start_time", params)]
+            if removed:
+                conn.executemany("DELETE FROM bookings WHERE booking_id = ?",
+                                 [(booking.booking_id,) for booking in removed])
+                self._bump_version(conn)
+            return removed
+
+    def reschedule_series(self, series_id: str, bookings: List[Booking]) -> Optional[List[Booking]]:
+        with self._transaction() as conn:
+            current = {row[0] for row in conn.execute(
+                "SELECT booking_id FROM bookings WHERE series_id = ? AND series_id != ''", (series_id,))}
+            if not current:
+                return None
+            for booking in bookings:
+                if booking.booking_id not in current:
+                    raise ValueError(f"Booking ID {booking.booking_id} is not part of series {series_id}")
+            replaced = {booking.booking_id for booking in bookings}
+            conflicts = find_conflicts(bookings, lambda room_id, start, end: self._busy(conn, room_id, start, end,
+                                                                                        ignore=replaced))
+            if conflicts:
+                return conflicts
+            for booking in bookings:
+                self._insert(conn, booking, replace=True)
+            return []
+
+    # ------------------------------------------------------------------
+    # Import
+    # ------------------------------------------------------------------
+    def import_csv(self, rooms_path: str = ROOMS_FILE, bookings_path: str = BOOKINGS_FILE) -> dict:
+        """
+        Copy rooms and bookings from the CSV files into the database in one transaction.
+        Existing rows with the same IDs are replaced; bookings without an ID, a valid room or a valid
+        time range are skipped. The CSV files are only read.
+
+        Returns:
+            Counts of imported rooms, imported bookings and skipped bookings
+        """
+        rooms_by_id, features = read_rooms(rooms_path)
+        rooms = list(rooms_by_id.values())
+        all_bookings = read_bookings(bookings_path)
+        bookings = [booking for booking in all_bookings if booking.booking_id and booking.is_valid]
+        skipped = len(all_bookings) - len(bookings)
+
+        with self._transaction() as conn:
+            # Feature names are restricted to identifiers (see catalog.feature_columns); quoting covers keywords
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(rooms)")}
+            for name in features:
+                if name not in existing:
+                    conn.execute(f'ALTER TABLE rooms ADD COLUMN "{name}" INTEGER NOT NULL DEFAULT 0')
+            columns = BASE_ROOM_COLUMNS + [f'"{name}"' for name in features]
+            conn.executemany(
+                f"INSERT OR REPLACE INTO rooms ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                [(room.room_id, room.room_location, room.capacity,
+                  *(int(room.features[name]) for name in features)) for room in rooms],
+            )
+            conn.execute("INSERT INTO meta (key, value) VALUES ('rooms_version', 1) "
+                         "ON CONFLICT (key) DO UPDATE SET value = value + 1")
+            conn.executemany(
+                f"INSERT OR REPLACE INTO bookings ({_BOOKING_COLUMNS}) VALUES ({_BOOKING_VALUES})",
+                [_booking_values(b) for b in bookings],
+            )
+            if bookings:
+                longest = max(bookings, key=lambda b: b.end_dt - b.start_dt)
+                self._record_duration(conn, longest)
+            numeric_ids = [int(b.booking_id) for b in bookings if b.booking_id.isdigit()]
+            if numeric_ids:
+                self._raise_sequence(conn, max(numeric_ids))
+            self._bump_version(conn)
+
+        return {'rooms': len(rooms), 'bookings': len(bookings), 'skipped': skipped}
+
@@ -0,0 +1,787 @@
+"""
+In-memory booking store for the Meeting Room Booking System.
+
+The store loads ``meeting_rooms.csv`` and ``bookings.csv`` once, keeps them as
+pre-parsed Python objects and only reloads a file when its modification time
+or size changes on disk.
+
+In journaled mode, bookings and cancellations are appended to a write-ahead log next
+to ``bookings.csv`` instead of rewriting the CSV, and a background thread periodically
+compacts the log into a new CSV snapshot.
+"""
+
+import csv
+import os
+import threading
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from meeting_room_booking.storage.base import BookingBackend
+from meeting_room_booking.storage.catalog import BASE_ROOM_COLUMNS, RoomCatalog, feature_columns, feature_key
+from meeting_room_booking.storage.ids import BookingSequence
+from meeting_room_booking.storage.index import RoomIndex, find_conflicts
+from meeting_room_booking.storage.journal import BookingJournal
+from meeting_room_booking.storage.locks import FileLock, KeyedLocks
+
+BOOKINGS_FILE = "data/bookings.csv"
+ROOMS_FILE = "data/meeting_rooms.csv"
+
+# BOOKING_STORAGE_MODE selects the backend: 'csv' (default), 'journal' (write-ahead log
+# instead of full CSV rewrites) or 'sqlite' (database at BOOKING_DB_PATH)
+STORAGE_MODE_ENV = "BOOKING_STORAGE_MODE"
+DB_PATH_ENV = "BOOKING_DB_PATH"
+COMPACT_EVERY = 1000
+
+TIME_FORMAT = '%Y-%m-%d %H:%M'
+
+# series_id is empty for single bookings and shared by the occurrences of a recurring series
+BOOKING_COLUMNS = ['booking_id', 'room_id', 'customer_name', 'customer_id', 'start_time', 'end_time', 'series_id']
+# Features of the original catalog; any other yes/no column of meeting_rooms.csv is picked up as well
+ROOM_FEATURES = ['projector', 'whiteboard', 'internet']
+
+
+@dataclass
+class Room:
+    room_id: int
+    room_location: str
+    capacity: Optional[int]
+    features: Dict[str, bool]
+
+    def feature_names(self) -> List[str]:
+        """Names of the features this room has, in catalog order."""
+        return [name for name, enabled in self.features.items() if enabled]
+
+
+@dataclass
+class Booking:
+    booking_id: str
+    room_id: Optional[int]
+    customer_name: str
+    customer_id: str
+    start_time: str
+    end_time: str
+    start_dt: Optional[datetime] = None
+    end_dt: Optional[datetime] = None
+    series_id: str = ''
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the booking has a room and a parseable time range."""
+        return self.room_id is not None and self.start_dt is not None and self.end_dt is not None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, str]) -> 'Booking':
+        try:
+            room_id = int(row.get('room_id', ''))
+        except ValueError:
+            room_id = None
+        return cls(
+            booking_id=row.get('booking_id', ''),
+            room_id=room_id,
+            customer_name=row.get('customer_name', ''),
+            customer_id=row.get('customer_id', ''),
+            start_time=row.get('start_time', ''),
+            end_time=row.get('end_time', ''),
+            start_dt=parse_datetime(row.get('start_time', '')),
+            end_dt=parse_datetime(row.get('end_time', '')),
+            series_id=row.get('series_id', ''),
+        )
+
+    def to_row(self) -> Dict[str, str]:
+        return {
+            'booking_id': self.booking_id,
+            'room_id': '' if self.room_id is None else str(self.room_id),
+            'customer_name': self.customer_name,
+            'customer_id': self.customer_id,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'series_id': self.series_id,
+        }
+
+
+def parse_datetime(value: str) -> Optional[datetime]:
+    """Parse a single booking timestamp, returning None if it is not a valid time."""
+    try:
+        return datetime.strptime(value, TIME_FORMAT)
+    except ValueError:
+        parsed = pd.to_datetime(value, errors='coerce')
+        return None if pd.isna(parsed) else parsed.to_pydatetime()
+
+
+def parse_datetimes(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of booking timestamps.
+
+    The canonical 'YYYY-MM-DD HH:MM' format is parsed in one vectorized pass;
+    anything else falls back to pandas' format inference. Unparseable values become NaT.
+    """
+    parsed = pd.to_datetime(values, format=TIME_FORMAT, errors='coerce')
+    retry = parsed.isna() & (values != '')
+    if retry.any():
+        parsed[retry] = pd.to_datetime(values[retry], format='mixed', errors='coerce')
+    return parsed
+
+
+def read_rooms(path: str) -> Tuple[Dict[int, Room], List[str]]:
+    """
+    Parse meeting_rooms.csv without touching anything else on disk.
+
+    Returns:
+        (rooms by ID in file order, feature names in column order)
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError("Meeting rooms data not found.")
+
+    df = pd.read_csv(path, on_bad_lines='skip', dtype=str, keep_default_na=False)
+    if not all(col in df.columns for col in BASE_ROOM_COLUMNS):
+        raise ValueError("Missing required columns in meeting_rooms.csv")
+
+    room_ids = pd.to_numeric(df['room_id'], errors='coerce')
+    capacities = pd.to_numeric(df['capacity'], errors='coerce')
+    flags = {feature_key(column): (df[column].str.strip().str.lower() == 'yes').tolist()
+             for column in feature_columns(df)}
+
+    rooms = {}
+    for i, (room_id, location, capacity) in enumerate(zip(room_ids.tolist(), df['room_location'].tolist(),
+                                                           capacities.tolist())):
+        if pd.isna(room_id):
+            continue
+        rooms[int(room_id)] = Room(
+            room_id=int(room_id),
+            room_location=location,
+            capacity=None if pd.isna(capacity) else int(capacity),
+            features={name: values[i] for name, values in flags.items()},
+        )
+    return rooms, list(flags)
+
+
+def read_bookings(path: str) -> List[Booking]:
+    """
+    Parse every row of bookings.csv in file order, without touching anything else on disk.
+    A missing file has no bookings; rows with blank or repeated IDs and unparseable times are kept.
+    """
+    if not os.path.exists(path):
+        return []
+
+    df = pd.read_csv(path, on_bad_lines='skip', dtype=str, keep_default_na=False)
+    if not all(col in df.columns for col in ['room_id', 'start_time', 'end_time']):
+        raise ValueError("Missing required columns in bookings.csv")
+    for col in BOOKING_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+
+    room_ids = pd.to_numeric(df['room_id'], errors='coerce')
+    starts = parse_datetimes(df['start_time'])
+    ends = parse_datetimes(df['end_time'])
+
+    bookings = []
+    for row in zip(df['booking_id'].tolist(), room_ids.tolist(), df['customer_name'].tolist(),
+                   df['customer_id'].tolist(), df['start_time'].tolist(), df['end_time'].tolist(),
+                   starts.tolist(), ends.tolist(), df['series_id'].tolist()):
+        booking_id, room_id, name, customer_id, start_str, end_str, start_dt, end_dt, series_id = row
+        bookings.append(Booking(
+            booking_id=booking_id,
+            room_id=None if pd.isna(room_id) else int(room_id),
+            customer_name=name,
+            customer_id=customer_id,
+            start_time=start_str,
+            end_time=end_str,
+            start_dt=None if pd.isna(start_dt) else start_dt.to_pydatetime(),
+            end_dt=None if pd.isna(end_dt) else end_dt.to_pydatetime(),
+            series_id=series_id,
+        ))
+    return bookings
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_snapshot(path: str, bookings: List[Booking], replace: bool = True):
+    """
+    Write bookings to ``path + '.tmp'`` and atomically rename it over ``path``, so a crash
+    never truncates the CSV. With ``replace=False`` the rename is left to the caller.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=BOOKING_COLUMNS)
+        writer.writeheader()
+        for booking in bookings:
+            writer.writerow(booking.to_row())
+        f.flush()
+        os.fsync(f.fileno())
+    if replace:
+        os.replace(tmp_path, path)
+
+
+class BookingStore(BookingBackend):
+    """
+    Process-wide cache of rooms and bookings.
+
+    Every public accessor first checks the backing files' (mtime, size) signature and
+    reloads only the table that changed, so edits made outside the process are still seen.
+
+    Writes are check-and-insert operations under per-room locks (a thread lock plus a
+    byte-range lock on ``<bookings_path>.lock`` for other processes), so bookings for
+    different rooms are validated in parallel and only the final file write is serialized.
+
+    Args:
+        bookings_path: Bookings CSV (the snapshot in journaled mode)
+        rooms_path: Meeting rooms CSV
+        journaled: Append changes to ``<bookings_path>.journal`` instead of rewriting the CSV
+        compact_every: Journal records after which a background compaction is started
+    """
+
+    def __init__(self, bookings_path: str = BOOKINGS_FILE, rooms_path: str = ROOMS_FILE,
+                 journaled: bool = False, compact_every: int = COMPACT_EVERY):
+        self.bookings_path = bookings_path
+        self.rooms_path = rooms_path
+        self.journaled = journaled
+        self.compact_every = compact_every
+        self._journal = BookingJournal(bookings_path + '.journal') if journaled else None
+        self._journal_offset = 0
+        # Journal size at the last check; differs from the offset while a torn trailing line is pending
+        self._journal_size = 0
+        self._journal_records = 0
+        self._compacting = False
+        # Guards the in-memory tables; held only for short, non-blocking sections
+        self._lock = threading.RLock()
+        self._room_locks = KeyedLocks()
+        self._write_lock = threading.Lock()
+        self._file_lock = FileLock(bookings_path + '.lock')
+        self._sequence = BookingSequence(bookings_path + '.seq')
+        self._rooms_signature = None
+        self._bookings_signature = None
+        self._rooms: Dict[int, Room] = {}
+        self._catalog = RoomCatalog([])
+        self._bookings: Dict[str, Booking] = {}
+        # Rows whose booking_id is blank or repeats an earlier row's; they cannot be looked up
+        # by ID but still block their room and are written back on every rewrite
+        self._unkeyed: List[Booking] = []
+        self._by_room: Dict[int, RoomIndex] = {}
+        self._by_customer: Dict[str, List[Booking]] = {}
+        self._by_series: Dict[str, List[Booking]] = {}
+        self._rooms_loaded = False
+        self._bookings_loaded = False
+        # Bumped on every change to the in-memory tables, whether made here or loaded from disk
+        self._version = 0
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def _refresh(self):
+        signature = _file_signature(self.rooms_path)
+        if not self._rooms_loaded or signature != self._rooms_signature:
+            self._load_rooms()
+            self._rooms_signature = signature
+            self._rooms_loaded = True
+
+        signature = _file_signature(self.bookings_path)
+        if not self._bookings_loaded or signature != self._bookings_signature:
+            self._load_bookings()
+            self._bookings_signature = signature
+            self._bookings_loaded = True
+        elif self._journal is not None and self._journal.size() != self._journal_size:
+            if self._journal.size() < self._journal_offset:
+                # Compacted by someone else without touching the snapshot we have; start over
+                self._load_bookings()
+            else:
+                self._replay_journal()
+
+    def _replay_journal(self):
+        # Sized before reading, so anything appended meanwhile is picked up by the next check
+        self._journal_size = self._journal.size()
+        records, self._journal_offset = self._journal.read(self._journal_offset)
+        self._journal_records += len(records)
+        for record in records:
+            if record.get('op') == 'book':
+                self._apply_book(Booking.from_row(record['booking']))
+            elif record.get('op') == 'cancel':
+                self._apply_cancel(record['booking_id'])
+            elif record.get('op') == 'reschedule':
+                self._apply_cancel(record['booking_id'])
+                self._apply_book(Booking.from_row(record['booking']))
+            elif record.get('op') == 'book_many':
+                for row in record['bookings']:
+                    self._apply_book(Booking.from_row(row))
+            elif record.get('op') == 'cancel_many':
+                for booking_id in record['booking_ids']:
+                    self._apply_cancel(booking_id)
+
+    def _load_rooms(self):
+        rooms, features = read_rooms(self.rooms_path)
+        self._rooms = rooms
+        self._catalog = RoomCatalog(list(rooms.values()), features)
+        self._version += 1
+
+    def _load_bookings(self):
+        bookings: Dict[str, Booking] = {}
+        unkeyed: List[Booking] = []
+        floor = 0
+        for booking in read_bookings(self.bookings_path):
+            if booking.booking_id and booking.booking_id not in bookings:
+                bookings[booking.booking_id] = booking
+                if booking.booking_id.isdigit():
+                    floor = max(floor, int(booking.booking_id))
+            else:
+                unkeyed.append(booking)
+        self._sequence.raise_floor(floor)
+        self._bookings = bookings
+        self._unkeyed = unkeyed
+        self._rebuild_indexes()
+        self._version += 1
+
+        if self._journal is not None:
+            self._journal_offset = 0
+            self._journal_records = 0
+            self._replay_journal()
+
+    def _rebuild_indexes(self):
+        by_room: Dict[int, List[Booking]] = {}
+        self._by_customer = {}
+        self._by_series = {}
+        for booking in self._all_bookings():
+            if booking.is_valid:
+                by_room.setdefault(booking.room_id, []).append(booking)
+            self._by_customer.setdefault(booking.customer_id, []).append(booking)
+            if booking.series_id:
+                self._by_series.setdefault(booking.series_id, []).append(booking)
+        self._by_room = {room_id: RoomIndex.from_bookings(bookings) for room_id, bookings in by_room.items()}
+
+    def _all_bookings(self) -> List[Booking]:
+        return list(self._bookings.values()) + self._unkeyed
+
+    def _index(self, booking: Booking):
+        if booking.is_valid:
+            self._by_room.setdefault(booking.room_id, RoomIndex()).add(booking)
+        self._by_customer.setdefault(booking.customer_id, []).append(booking)
+        if booking.series_id:
+            self._by_series.setdefault(booking.series_id, []).append(booking)
+
+    def _unindex(self, booking: Booking):
+        if booking.is_valid:
+            self._by_room[booking.room_id].remove(booking)
+        customer_bookings = self._by_customer[booking.customer_id]
+        customer_bookings[:] = [b for b in customer_bookings if b is not booking]
+        if booking.series_id:
+            series = [b for b in self._by_series[booking.series_id] if b is not booking]
+            if series:
+                self._by_series[booking.series_id] = series
+            else:
+                del self._by_series[booking.series_id]
+
+    def _apply_book(self, booking: Booking):
+        previous = self._bookings.get(booking.booking_id)
+        if previous is not None:
+            self._unindex(previous)
+        self._bookings[booking.booking_id] = booking
+        self._index(booking)
+        self._sequence.raise_floor(booking.booking_id)
+        self._version += 1
+
+    def _apply_cancel(self, booking_id: str) -> Optional[Booking]:
+        booking = self._bookings.pop(booking_id, None)
+        if booking is not None:
+            self._unindex(booking)
+            self._version += 1
+        return booking
+
+    @contextmanager
+    def _room_guard(self, *room_ids: int):
+        """Lock rooms against other threads and processes, always in ascending order."""
+        with ExitStack() as stack:
+            for room_id in sorted({room_id for room_id in room_ids if room_id is not None}):
+                stack.enter_context(self._room_locks.get(room_id))
+                stack.enter_context(self._file_lock.hold(room_id + 1))
+            yield
+
+    @contextmanager
+    def _write_guard(self):
+        """Serialize writes to the bookings file/journal across threads and processes."""
+        with self._write_lock, self._file_lock.hold(0):
+            yield
+
+    def _save_bookings(self):
+        with self._lock:
+            bookings = self._all_bookings()
+        write_snapshot(self.bookings_path, bookings, replace=False)
+        with self._lock:
+            os.replace(self.bookings_path + '.tmp', self.bookings_path)
+            # Our own write must not trigger a reload on the next access
+            self._bookings_signature = _file_signature(self.bookings_path)
+
+    def _persist(self, record: dict):
+        """
+        Record a change: one journal append in journaled mode, a full CSV rewrite otherwise.
+        Must be called under the write guard.
+        """
+        if self._journal is None:
+            self._save_bookings()
+            return
+
+        offset = self._journal.append(record)
+        with self._lock:
+            self._journal_offset = self._journal_size = offset
+            self._journal_records += 1
+            start_compaction = self._journal_records >= self.compact_every and not self._compacting
+            if start_compaction:
+                self._compacting = True
+        if start_compaction:
+            threading.Thread(target=self.compact, name='booking-journal-compaction', daemon=True).start()
+
+    def compact(self):
+        """
+        Fold the journal into a new CSV snapshot.
+
+        The snapshot is written without holding any lock; records appended meanwhile stay in
+        the journal. Replaying is idempotent, so a crash between replacing the snapshot and
+        trimming the journal only replays changes the snapshot already contains.
+        """
+        if self._journal is None:
+            return
+        try:
+            with self._write_guard(), self._lock:
+                self._refresh()
+                bookings = self._all_bookings()
+                offset = self._journal_offset
+                records = self._journal_records
+                signature = self._bookings_signature
+
+            write_snapshot(self.bookings_path + '.snapshot', bookings)
+
+            with self._write_guard(), self._lock:
+                if _file_signature(self.bookings_path) != signature:
+                    # Another process compacted first; its snapshot supersedes ours
+                    os.remove(self.bookings_path + '.snapshot')
+                    return
+                os.replace(self.bookings_path + '.snapshot', self.bookings_path)
+                self._bookings_signature = _file_signature(self.bookings_path)
+                self._journal.discard_before(offset)
+                self._journal_offset -= offset
+                self._journal_size -= offset
+                self._journal_records -= records
+        finally:
+            self._compacting = False
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @property
+    def version(self) -> int:
+        with self._lock:
+            self._refresh()
+            return self._version
+
+    def rooms(self) -> List[Room]:
+        """All rooms in catalog order."""
+        with self._lock:
+            self._refresh()
+            return list(self._rooms.values())
+
+    def get_room(self, room_id: int) -> Optional[Room]:
+        with self._lock:
+            self._refresh()
+            return self._rooms.get(room_id)
+
+    def catalog(self) -> RoomCatalog:
+        """Feature/capacity index over the rooms, rebuilt whenever meeting_rooms.csv is reloaded."""
+        with self._lock:
+            self._refresh()
+            return self._catalog
+
+    def get_booking(self, booking_id: str) -> Optional[Booking]:
+        with self._lock:
+            self._refresh()
+            return self._bookings.get(booking_id)
+
+    def bookings(self) -> List[Booking]:
+        """
+        All bookings, including ones with unparseable times. Rows with a blank or repeated
+        booking_id come last.
+        """
+        with self._lock:
+            self._refresh()
+            return self._all_bookings()
+
+    def has_booking_id(self, booking_id: str) -> bool:
+        with self._lock:
+            self._refresh()
+            return booking_id in self._bookings
+
+    def room_bookings(self, room_id: int) -> List[Booking]:
+        """Valid bookings for a room in start-time order (bookings with unparseable times are skipped)."""
+        with self._lock:
+            self._refresh()
+            index = self._by_room.get(room_id)
+            return index.bookings() if index else []
+
+    def overlapping(self, room_id: int, start: datetime, end: datetime) -> List[Booking]:
+        """Bookings of a room that overlap [start, end), in start-time order."""
+        with self._lock:
+            self._refresh()
+            index = self._by_room.get(room_id)
+            return index.overlapping(start, end) if index else []
+
+    def has_conflict(self, room_id: int, start: datetime, end: datetime) -> bool:
+        """Whether any booking of the room overlaps [start, end)."""
+        with self._lock:
+            self._refresh()
+            index = self._by_room.get(room_id)
+            return index.has_overlap(start, end) if index else False
+
+    def day_bookings(self, room_id: int, day: datetime) -> List[Booking]:
+        """Bookings of a room that overlap the calendar day containing ``day``."""
+        with self._lock:
+            self._refresh()
+            index = self._by_room.get(room_id)
+            return index.on_day(day) if index else []
+
+    def customer_bookings(self, customer_id: str) -> List[Booking]:
+        with self._lock:
+            self._refresh()
+            return list(self._by_customer.get(customer_id, []))
+
+    def series_bookings(self, series_id: str) -> List[Booking]:
+        """Occurrences of a recurring series in start-time order."""
+        with self._lock:
+            self._refresh()
+            return sorted(self._by_series.get(series_id, []), key=lambda booking: booking.start_dt)
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+    def allocate_booking_ids(self, count: int = 1) -> List[str]:
+        """
+        Reserve ``count`` new booking IDs from the sequence in ``<bookings_path>.seq``.
+        IDs are never handed out twice, even across processes; unused ones are simply skipped.
+        """
+        with self._lock:
+            # Bookings written by other processes raise the floor when they are loaded
+            self._refresh()
+        return [str(number) for number in self._sequence.allocate(count)]
+
+    def book(self, booking: Booking) -> bool:
+        """
+        Atomically add a booking if its room is free for the booking's time range.
+
+        Returns:
+            True if the booking was stored, False if it overlaps an existing booking
+
+        Raises:
+            ValueError: If the booking ID is already in use
+        """
+        with self._room_guard(booking.room_id):
+            # Other threads/processes can only change this room while holding the same lock,
+            # so the check stays valid until the booking is written below
+            with self._lock:
+                self._refresh()
+                if self._conflicts(booking):
+                    return False
+
+            with self._write_guard():
+                with self._lock:
+                    self._refresh()
+                    if booking.booking_id in self._bookings:
+                        raise ValueError(f"Booking ID {booking.booking_id} already exists")
+                    self._apply_book(booking)
+                self._persist({'op': 'book', 'booking': booking.to_row()})
+            return True
+
+    def add_booking(self, booking: Booking):
+        """Add (or overwrite) a booking without checking for conflicts."""
+        with self._room_guard(booking.room_id), self._write_guard():
+            with self._lock:
+                self._refresh()
+                self._apply_book(booking)
+            self._persist({'op': 'book', 'booking': booking.to_row()})
+
+    def remove_booking(self, booking_id: str) -> Optional[Booking]:
+        """Remove a booking by ID and persist the change. Returns the removed booking, if any."""
+        booking = self.get_booking(booking_id)
+        if booking is None:
+            return None
+
+        with self._room_guard(booking.room_id), self._write_guard():
+            with self._lock:
+                self._refresh()
+                booking = self._apply_cancel(booking_id)
+            if booking is not None:
+                self._persist({'op': 'cancel', 'booking_id': booking_id})
+            return booking
+
+    def reschedule(self, booking_id: str, booking: Booking) -> Optional[bool]:
+        """
+        Atomically replace a booking with a new one.
+
+        The new time range is checked against every other booking in the target room (the
+        booking being replaced does not count as a conflict), and the cancellation and the new
+        booking are persisted as a single record.
+
+        Returns:
+            None if ``booking_id`` does not exist, False if the new slot is taken, True on success
+        """
+        original = self.get_booking(booking_id)
+        if original is None:
+            return None
+
+        with self._room_guard(original.room_id, booking.room_id):
+            with self._lock:
+                self._refresh()
+                original = self._bookings.get(booking_id)
+                if original is None:
+                    return None
+                if self._conflicts(booking, ignore=original):
+                    return False
+
+            with self._write_guard():
+                with self._lock:
+                    self._refresh()
+                    if booking.booking_id != booking_id and booking.booking_id in self._bookings:
+                        raise ValueError(f"Booking ID {booking.booking_id} already exists")
+                    self._apply_cancel(booking_id)
+                    self._apply_book(booking)
+                self._persist({'op': 'reschedule', 'booking_id': booking_id, 'booking': booking.to_row()})
+            return True
+
+    def book_many(self, bookings: List[Booking], partial: bool = False) -> List[Booking]:
+        """
+        Atomically add several bookings, e.g. the occurrences of a recurring series.
+
+        All of them are checked in one sweep per room while the rooms are locked. By default
+        nothing is stored if any booking conflicts; with ``partial`` the free ones are stored.
+        Either way the stored bookings are persisted as a single record.
+
+        Returns:
+            The conflicting bookings (empty if everything was stored)
+
+        Raises:
+            ValueError: If a booking ID is already in use
+        """
+        if not bookings:
+            return []
+        with self._room_guard(*(booking.room_id for booking in bookings)):
+            with self._lock:
+                self._refresh()
+                conflicts = find_conflicts(bookings, self._busy)
+            if conflicts and not partial:
+                return conflicts
+            rejected = {id(booking) for booking in conflicts}
+            accepted = [booking for booking in bookings if id(booking) not in rejected]
+            if not accepted:
+                return conflicts
+
+            with self._write_guard():
+                with self._lock:
+                    self._refresh()
+                    for booking in accepted:
+                        if booking.booking_id in self._bookings:
+                            raise ValueError(f"Booking ID {booking.booking_id} already exists")
+                    for booking in accepted:
+                        self._apply_book(booking)
+                self._persist({'op': 'book_many', 'bookings': [booking.to_row() for booking in accepted]})
+            return conflicts
+
+    def cancel_series(self, series_id: str, after: Optional[datetime] = None) -> List[Booking]:
+        """
+        Remove the occurrences of a series (only those starting at or after ``after``, if given)
+        as a single persisted change. Returns the removed bookings.
+        """
+        targets = [booking for booking in self.series_bookings(series_id)
+                   if after is None or booking.start_dt >= after]
+        if not targets:
+            return []
+
+        with self._room_guard(*(booking.room_id for booking in targets)), self._write_guard():
+            with self._lock:
+                self._refresh()
+                removed = [booking for booking in (self._apply_cancel(target.booking_id) for target in targets)
+                           if booking is not None]
+            if removed:
+                self._persist({'op': 'cancel_many', 'booking_ids': [booking.booking_id for booking in removed]})
+            return removed
+
+    def reschedule_series(self, series_id: str, bookings: List[Booking]) -> Optional[List[Booking]]:
+        """
+        Atomically replace occurrences of a series with new versions carrying the same booking IDs.
+
+        The occurrences being replaced do not count as conflicts for the new times. Nothing
+        changes if any new occurrence conflicts.
+
+        Returns:
+            None if the series does not exist, otherwise the conflicting new bookings
+            (empty on success)
+
+        Raises:
+            ValueError: If a booking does not belong to the series
+        """
+        original = self.series_bookings(series_id)
+        if not original:
+            return None
+        rooms = [booking.room_id for booking in original] + [booking.room_id for booking in bookings]
+
+        with self._room_guard(*rooms):
+            with self._lock:
+                self._refresh()
+                current = {booking.booking_id: booking for booking in self._by_series.get(series_id, [])}
+                if not current:
+                    return None
+                for booking in bookings:
+                    if booking.booking_id not in current:
+                        raise ValueError(f"Booking ID {booking.booking_id} is not part of series {series_id}")
+                replaced = {id(current[booking.booking_id]) for booking in bookings}
+                conflicts = find_conflicts(bookings, lambda room_id, start, end: self._busy(room_id, start, end,
+                                                                                          ignore=replaced))
+                if conflicts:
+                    return conflicts
+
+            with self._write_guard():
+                with self._lock:
+                    self._refresh()
+                    for booking in bookings:
+                        self._apply_cancel(booking.booking_id)
+                        self._apply_book(booking)
+                self._persist({'op': 'book_many', 'bookings': [booking.to_row() for booking in bookings]})
+            return []
+
+    def _busy(self, room_id: int, start: datetime, end: datetime,
+              ignore=frozenset()) -> List[Tuple[datetime, datetime]]:
+        index = self._by_room.get(room_id)
+        if index is None:
+            return []
+        return [(booking.start_dt, booking.end_dt) for booking in index.overlapping(start, end)
+                if id(booking) not in ignore]
+
+    def _conflicts(self, booking: Booking, ignore: Optional[Booking] = None) -> bool:
+        index = self._by_room.get(booking.room_id)
+        if index is None:
+            return False
+        return any(other is not ignore for other in index.overlapping(booking.start_dt, booking.end_dt))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> BookingBackend:
+    """Return the process-wide booking backend selected by BOOKING_STORAGE_MODE, creating it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                mode = os.environ.get(STORAGE_MODE_ENV, 'csv').lower()
+                if mode == 'sqlite':
+                    from meeting_room_booking.storage.sqlite_store import DB_FILE, SQLiteBookingStore
+                    _store = SQLiteBookingStore(os.environ.get(DB_PATH_ENV, DB_FILE))
+                elif mode in ('csv', 'journal'):
+                    _store = BookingStore(journaled=mode == 'journal')
+                else:
+                    raise ValueError(f"Unknown {STORAGE_MODE_ENV} '{mode}'. Use 'csv', 'journal' or 'sqlite'.")
+    return _store
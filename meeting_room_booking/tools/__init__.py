@@ -6,17 +6,29 @@ Contains implementations of the tools used by the agents.
 from meeting_room_booking.tools.tools import (
     check_availability_features,
     check_specific_room,
+    check_availability_batch,
+    check_availability_range,
+    find_next_available,
     book_room,
     cancel_booking, 
     reschedule_booking,
+    book_recurring_room,
+    cancel_series,
+    reschedule_series,
     get_user_bookings
 )
 
 __all__ = [
     'check_availability_features',
     'check_specific_room',
+    'check_availability_batch',
+    'check_availability_range',
+    'find_next_available',
     'book_room',
     'cancel_booking',
     'reschedule_booking',
+    'book_recurring_room',
+    'cancel_series',
+    'reschedule_series',
     'get_user_bookings'
 ]
@@ -0,0 +1,316 @@
+"""
+Multi-slot availability queries for the Meeting Room Booking System.
+
+``check_slots`` evaluates many (room_id, start, duration) candidates at once: each distinct
+room and day is looked up in the room index once, the free gaps of all of them come out of
+a single ``find_available_intervals_batch`` pass, and every candidate is then answered from
+its day's gaps, together with the nearest start times that would fit in the same room.
+
+``free_intervals_range`` answers "when is this room free this week": the free intervals of
+each room on each day of a date range, optionally within working hours, from one range
+lookup and one forward sweep per room instead of a query per day.
+
+``earliest_slots`` finds the K earliest free slots across many rooms within a horizon of
+days: each room lazily yields its free gaps in time order, and a heap merges the streams so
+the search stops, without looking further into any room, as soon as K slots are found.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from meeting_room_booking.storage import get_store
+from meeting_room_booking.storage.index import merge_intervals
+from meeting_room_booking.storage.store import TIME_FORMAT
+from meeting_room_booking.tools.find_intervals import find_available_intervals_batch
+
+DEFAULT_ALTERNATIVES = 2
+# Longest date range ``free_intervals_range`` accepts, and longest horizon of ``earliest_slots``
+MAX_RANGE_DAYS = 31
+DEFAULT_HORIZON_DAYS = 14
+
+
+@dataclass
+class SlotCheck:
+    """Availability of one candidate slot."""
+    room_id: int
+    start: Optional[datetime]
+    duration: float
+    available: bool = False
+    error: Optional[str] = None
+    # Nearest (start, end) slots of the same length in the same room and day, closest first
+    alternatives: List[Tuple[datetime, datetime]] = field(default_factory=list)
+
+    @property
+    def end(self) -> Optional[datetime]:
+        return None if self.start is None else self.start + timedelta(hours=self.duration)
+
+
+@dataclass
+class FreeSlot:
+    """A slot of the requested length at the start of a free gap."""
+    room_id: int
+    start: datetime
+    end: datetime
+    # End of the free gap the slot starts, i.e. how long the room stays free
+    # (None if it stays free to the end of the search horizon)
+    free_until: Optional[datetime]
+
+
+def _parse_candidate(room_id, start: Union[str, datetime], duration) -> SlotCheck:
+    try:
+        room_id = int(room_id)
+        duration = float(duration)
+    except (TypeError, ValueError):
+        return SlotCheck(room_id=room_id, start=None, duration=0.0, error="Invalid room ID or duration")
+    if isinstance(start, str):
+        try:
+            start = datetime.strptime(start.strip(), TIME_FORMAT)
+        except ValueError:
+            return SlotCheck(room_id=room_id, start=None, duration=duration,
+                             error="Invalid start time; use 'YYYY-MM-DD HH:MM'")
+    if duration <= 0:
+        return SlotCheck(room_id=room_id, start=start, duration=duration, error="Duration must be positive")
+    return SlotCheck(room_id=room_id, start=start, duration=duration)
+
+
+def _nearest_slots(start: datetime, length: timedelta, gaps: List[Tuple[datetime, datetime]],
+                   limit: int) -> List[Tuple[datetime, datetime]]:
+    """The ``limit`` feasible slots of ``length`` closest to ``start``, one per gap."""
+    options = []
+    for gap_start, gap_end in gaps:
+        if gap_end - gap_start < length:
+            continue
+        # The start inside [gap_start, gap_end - length] closest to the requested one
+        nearest = min(max(start, gap_start), gap_end - length)
+        options.append((abs(nearest - start), nearest))
+    options.sort()
+    return [(nearest, nearest + length) for _, nearest in options[:limit]]
+
+
+def check_slots(candidates: Iterable[Tuple[int, Union[str, datetime], float]],
+                max_alternatives: int = DEFAULT_ALTERNATIVES) -> List[SlotCheck]:
+    """
+    Check many candidate slots in one pass.
+
+    Args:
+        candidates: (room_id, start, duration in hours) tuples; ``start`` is a datetime or
+                    a 'YYYY-MM-DD HH:MM' string
+        max_alternatives: Nearest alternative slots to suggest for each unavailable candidate
+
+    Returns:
+        One ``SlotCheck`` per candidate, in input order
+    """
+    store = get_store()
+    checks = [_parse_candidate(*candidate) for candidate in candidates]
+
+    # One search window per distinct (room, day); a slot past midnight also needs the next day
+    windows: Dict[Tuple[int, datetime], int] = {}
+    for check in checks:
+        if check.error is not None:
+            continue
+        if store.get_room(check.room_id) is None:
+            check.error = f"There is no room with ID {check.room_id}"
+            continue
+        day = check.start.replace(hour=0, minute=0, second=0, microsecond=0)
+        while day < check.end:
+            windows.setdefault((check.room_id, day), len(windows))
+            day += timedelta(days=1)
+
+    positions, starts, ends = [], [], []
+    for (room_id, day), position in windows.items():
+        for booking in store.overlapping(room_id, day, day + timedelta(days=1)):
+            positions.append(position)
+            starts.append(booking.start_dt)
+            ends.append(booking.end_dt)
+    window_start = np.array([day for _, day in windows], dtype='datetime64[us]')
+    gap_window, gap_start, gap_end = find_available_intervals_batch(
+        window_start, window_start + np.timedelta64(1, 'D'),
+        positions, np.array(starts, dtype='datetime64[us]'), np.array(ends, dtype='datetime64[us]'),
+        n_rooms=len(windows))
+
+    gaps: Dict[int, List[Tuple[datetime, datetime]]] = {position: [] for position in windows.values()}
+    for position, interval_start, interval_end in zip(gap_window.tolist(), gap_start.tolist(), gap_end.tolist()):
+        gaps[position].append((interval_start, interval_end))
+
+    for check in checks:
+        if check.error is not None:
+            continue
+        day = check.start.replace(hour=0, minute=0, second=0, microsecond=0)
+        # Free gaps of every day the slot touches; gaps meeting at midnight are joined
+        room_gaps: List[Tuple[datetime, datetime]] = []
+        while day < check.end:
+            for interval in gaps[windows[(check.room_id, day)]]:
+                if room_gaps and room_gaps[-1][1] == interval[0]:
+                    room_gaps[-1] = (room_gaps[-1][0], interval[1])
+                else:
+                    room_gaps.append(interval)
+            day += timedelta(days=1)
+        check.available = any(gap_start <= check.start and check.end <= gap_end for gap_start, gap_end in room_gaps)
+        if not check.available and max_alternatives > 0:
+            check.alternatives = _nearest_slots(check.start, check.end - check.start, room_gaps, max_alternatives)
+    return checks
+
+
+def _window_gaps(windows: List[Tuple[datetime, datetime]], blocks: List[Tuple[datetime, datetime]],
+                 min_length: timedelta) -> List[List[Tuple[datetime, datetime]]]:
+    """
+    Free gaps of at least ``min_length`` inside each window, for windows sorted by start and
+    disjoint busy ``blocks`` (see ``merge_intervals``). Both lists are walked once; a block
+    reaching into the next window is kept for it.
+    """
+    gaps, j = [], 0
+    for window_start, window_end in windows:
+        while j < len(blocks) and blocks[j][1] <= window_start:
+            j += 1
+        window_gaps, cursor, k = [], window_start, j
+        while k < len(blocks) and blocks[k][0] < window_end:
+            if blocks[k][0] - cursor >= min_length and blocks[k][0] > cursor:
+                window_gaps.append((cursor, blocks[k][0]))
+            cursor = max(cursor, blocks[k][1])
+            k += 1
+        if window_end - cursor >= min_length and window_end > cursor:
+            window_gaps.append((cursor, window_end))
+        gaps.append(window_gaps)
+    return gaps
+
+
+def free_intervals_range(room_ids: List[int], first_day: date, last_day: date,
+                         day_start: Optional[time] = None, day_end: Optional[time] = None,
+                         min_duration: float = 0.0) -> Dict[int, Dict[date, List[Tuple[datetime, datetime]]]]:
+    """
+    Free intervals of several rooms on every day of a date range.
+
+    Args:
+        room_ids: Rooms to look at
+        first_day: First day of the range
+        last_day: Last day of the range (inclusive)
+        day_start: Start of the daily window, e.g. 09:00 (default: midnight)
+        day_end: End of the daily window, e.g. 17:00 (default: the next midnight)
+        min_duration: Minimum length in hours of a reported interval
+
+    Returns:
+        {room_id: {day: [(start, end), ...]}} with every day of the range present, in order
+
+    Raises:
+        ValueError: If the range or the daily window is empty, or the range is longer than MAX_RANGE_DAYS
+    """
+    days = (last_day - first_day).days + 1
+    if days < 1:
+        raise ValueError("The end date is before the start date")
+    if days > MAX_RANGE_DAYS:
+        raise ValueError(f"The date range can span at most {MAX_RANGE_DAYS} days")
+    if day_start is not None and day_end is not None and day_end <= day_start:
+        raise ValueError("The end of the daily window must be after its start")
+
+    dates = [first_day + timedelta(days=offset) for offset in range(days)]
+    windows = []
+    for day in dates:
+        window_start = datetime.combine(day, day_start or time(0))
+        window_end = datetime.combine(day, day_end) if day_end is not None else \
+            datetime.combine(day + timedelta(days=1), time(0))
+        windows.append((window_start, window_end))
+
+    store = get_store()
+    min_length = timedelta(hours=min_duration)
+    result = {}
+    for room_id in room_ids:
+        # One range lookup per room; its bookings come back sorted by start
+        busy = [(booking.start_dt, booking.end_dt)
+                for booking in store.overlapping(room_id, windows[0][0], windows[-1][1])]
+        result[room_id] = dict(zip(dates, _window_gaps(windows, merge_intervals(busy), min_length)))
+    return result
+
+
+def _search_windows(after: datetime, until: datetime, day_start: Optional[time],
+                    day_end: Optional[time]) -> List[Tuple[datetime, datetime]]:
+    """The searchable parts of [after, until): one window, or each day's working hours."""
+    if day_start is None and day_end is None:
+        return [(after, until)]
+    windows = []
+    day = after.date()
+    while datetime.combine(day, time(0)) < until:
+        window_start = max(datetime.combine(day, day_start or time(0)), after)
+        window_end = min(datetime.combine(day, day_end) if day_end is not None else
+                         datetime.combine(day + timedelta(days=1), time(0)), until)
+        if window_start < window_end:
+            windows.append((window_start, window_end))
+        day += timedelta(days=1)
+    return windows
+
+
+def _gap_stream(store, room_id: int, windows: List[Tuple[datetime, datetime]],
+                length: timedelta) -> Iterator[Tuple[datetime, datetime]]:
+    """
+    Free gaps of at least ``length`` of one room inside ``windows``, in time order.
+
+    The room index is read one day at a time, only as far as the consumer asks for. A gap
+    can span several of these chunks; a booking reaching into the next chunk is simply
+    seen again there and moves the cursor no further.
+    """
+    for window_start, window_end in windows:
+        cursor = chunk_start = window_start
+        while chunk_start < window_end:
+            chunk_end = min(chunk_start + timedelta(days=1), window_end)
+            for booking in store.overlapping(room_id, chunk_start, chunk_end):
+                if booking.start_dt - cursor >= length:
+                    yield cursor, booking.start_dt
+                cursor = max(cursor, booking.end_dt)
+            chunk_start = chunk_end
+        if window_end - cursor >= length:
+            yield cursor, window_end
+
+
+def earliest_slots(room_ids: List[int], duration: float, after: datetime,
+                   horizon_days: int = DEFAULT_HORIZON_DAYS, limit: int = 5,
+                   day_start: Optional[time] = None, day_end: Optional[time] = None) -> List[FreeSlot]:
+    """
+    The ``limit`` earliest slots of ``duration`` hours in any of the rooms, one per free gap.
+
+    Args:
+        room_ids: Candidate rooms (e.g. the rooms with the requested features)
+        duration: Slot length in hours
+        after: Earliest allowed start
+        horizon_days: Search only starts before ``after`` plus this many days
+        limit: Number of slots to return (K)
+        day_start: Start of the daily working hours (default: midnight)
+        day_end: End of the daily working hours (default: the next midnight)
+
+    Returns:
+        Slots ordered by start time, then room ID
+
+    Raises:
+        ValueError: If the duration, horizon or working hours are invalid
+    """
+    if duration <= 0:
+        raise ValueError("Duration must be positive")
+    if not 1 <= horizon_days <= MAX_RANGE_DAYS:
+        raise ValueError(f"The search horizon must be between 1 and {MAX_RANGE_DAYS} days")
+    if day_start is not None and day_end is not None and day_end <= day_start:
+        raise ValueError("The end of the daily window must be after its start")
+
+    store = get_store()
+    length = timedelta(hours=duration)
+    until = after + timedelta(days=horizon_days)
+    windows = _search_windows(after, until, day_start, day_end)
+
+    streams = {room_id: _gap_stream(store, room_id, windows, length) for room_id in room_ids}
+    heap = []
+    for room_id, stream in streams.items():
+        gap = next(stream, None)
+        if gap is not None:
+            heap.append((gap[0], room_id, gap[1]))
+    heapq.heapify(heap)
+
+    slots = []
+    while heap and len(slots) < limit:
+        start, room_id, gap_end = heapq.heappop(heap)
+        slots.append(FreeSlot(room_id=room_id, start=start, end=start + length,
+                              free_until=None if gap_end == until else gap_end))
+        gap = next(streams[room_id], None)
+        if gap is not None:
+            heapq.heappush(heap, (gap[0], room_id, gap[1]))
+    return slots
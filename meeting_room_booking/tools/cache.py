@@ -0,0 +1,122 @@
+"""
+Result cache for the read-only availability tools.
+
+Results are keyed on the tool name, its normalized arguments and the storage backend's
+data version. Every booking, cancellation or reschedule (and any reload of changed files)
+bumps the version, so an entry can never be served for data it was not computed from;
+stale entries simply stop being looked up and age out of the LRU.
+"""
+
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from meeting_room_booking.storage import get_store
+
+CACHE_SIZE_ENV = "TOOL_CACHE_SIZE"
+CACHE_TTL_ENV = "TOOL_CACHE_TTL"
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 300.0
+
+
+class ToolResultCache:
+    """
+    Thread-safe LRU cache with a per-entry time to live.
+
+    Args:
+        max_size: Maximum number of entries; 0 disables caching
+        ttl: Seconds an entry stays valid
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], str]) -> str:
+        if self.max_size <= 0:
+            return compute()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+
+        # Computed outside the lock; concurrent misses for the same key just compute twice
+        value = compute()
+        if value.startswith("Error"):
+            return value
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+            }
+
+
+availability_cache = ToolResultCache(
+    max_size=int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE)),
+    ttl=float(os.environ.get(CACHE_TTL_ENV, DEFAULT_CACHE_TTL)),
+)
+
+
+def memoize_tool(normalize: Callable[..., Hashable], cache: ToolResultCache = availability_cache):
+    """
+    Cache a tool function's results in ``cache``.
+
+    ``normalize`` receives the call's arguments (defaults applied) as keywords and returns
+    the hashable part of the key, so equivalent calls share one entry.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            try:
+                key = (func.__name__, normalize(**bound.arguments), get_store().version)
+            except Exception:
+                # Unreadable data or odd arguments: let the tool report the problem itself
+                return func(*args, **kwargs)
+            return cache.get_or_compute(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+    return decorator
@@ -0,0 +1,68 @@
+"""
+Bounded worker pool for running the tools from async code.
+
+The tools parse CSV files, scan bookings and write files, all synchronously. Under
+``ainvoke`` they would block the event loop and stall every other conversation, so their
+async variants run the same functions on a small dedicated thread pool. Threads (not
+processes) keep the in-memory booking store and its locks shared; NumPy and file I/O
+release the GIL for most of the heavy work.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Callable, Optional
+
+from langchain_core.tools import BaseTool
+
+POOL_SIZE_ENV = "TOOL_POOL_SIZE"
+DEFAULT_POOL_SIZE = 4
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """Return the shared tool pool, sized by TOOL_POOL_SIZE, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                size = int(os.environ.get(POOL_SIZE_ENV, DEFAULT_POOL_SIZE))
+                _pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix='booking-tool')
+    return _pool
+
+
+def set_pool_size(max_workers: int):
+    """Replace the shared pool with one of ``max_workers`` threads; running calls finish on the old one."""
+    global _pool
+    with _pool_lock:
+        previous, _pool = _pool, ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='booking-tool')
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+async def run_in_pool(func: Callable, *args, **kwargs):
+    """Run ``func`` on the tool pool, keeping the caller's context (callbacks, tracing)."""
+    call = functools.partial(copy_context().run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(get_pool(), call)
+
+
+def offload_async(tool: BaseTool) -> BaseTool:
+    """
+    Give a ``@tool`` a native async variant that runs its function on the tool pool.
+
+    ``tool.ainvoke`` then awaits the pool instead of using the event loop's default executor,
+    so the number of threads doing tool work stays bounded.
+    """
+    func = tool.func
+
+    @functools.wraps(func)
+    async def coroutine(*args, **kwargs):
+        return await run_in_pool(func, *args, **kwargs)
+
+    tool.coroutine = coroutine
+    return tool
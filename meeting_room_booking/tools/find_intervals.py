@@ -1,56 +1,140 @@
 """
-Helper function for finding available time intervals.
+Helper functions for finding available time intervals.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Tuple
 
+import numpy as np
+
+# Timestamps are handled as int64 microseconds so Python datetimes round-trip exactly
+_UNIT = 'datetime64[us]'
+_MICROSECONDS_PER_HOUR = 3600 * 10**6
+
+
+def _as_int64(values) -> Tuple[np.ndarray, bool]:
+    """Convert datetimes/datetime64 to int64 microseconds. int64 input is used as-is."""
+    array = np.asarray(values)
+    if np.issubdtype(array.dtype, np.integer):
+        return array.astype(np.int64, copy=False), False
+    return np.asarray(values, dtype=_UNIT).astype(np.int64), True
+
+
+def find_available_intervals_batch(
+    window_start,
+    window_end,
+    room_index: np.ndarray,
+    booking_start,
+    booking_end,
+    min_duration: float = None,
+    n_rooms: int = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the free gaps of many rooms in one vectorized pass.
+
+    Each room ``r`` has a search window [window_start[r], window_end[r]) (scalars are
+    broadcast to every room). Booking ``i`` belongs to room ``room_index[i]``; bookings may be
+    unsorted, overlap each other or extend past the window.
+
+    Times can be datetime64 arrays (or sequences of datetimes), or int64 arrays in
+    microseconds. The returned gap times use the same representation as ``booking_start``.
+
+    Args:
+        window_start: Start of each room's search window
+        window_end: End of each room's search window
+        room_index: Room position (0..R-1) of every booking
+        booking_start: Booking start times
+        booking_end: Booking end times
+        min_duration: Minimum required gap length in hours, or None for any length
+        n_rooms: Number of rooms R; inferred from the window arrays and ``room_index`` if omitted.
+                 Pass it when windows are scalars and some rooms have no bookings.
+
+    Returns:
+        (room_index, gap_start, gap_end) arrays, sorted by room then gap start
+    """
+    room_index = np.asarray(room_index, dtype=np.int64)
+    starts, is_datetime = _as_int64(booking_start)
+    ends, _ = _as_int64(booking_end)
+    window_start, window_is_datetime = _as_int64(window_start)
+    window_end, _ = _as_int64(window_end)
+    if not len(starts):
+        is_datetime = window_is_datetime
+
+    if n_rooms is None:
+        n_rooms = max(window_start.size, window_end.size,
+                      int(room_index.max()) + 1 if room_index.size else 0)
+    window_start = np.broadcast_to(window_start, (n_rooms,))
+    window_end = np.broadcast_to(window_end, (n_rooms,))
+
+    # Keep the bookings that overlap their room's window, clipped to it
+    keep = (starts < window_end[room_index]) & (ends > window_start[room_index])
+    room_index = room_index[keep]
+    starts = np.maximum(starts[keep], window_start[room_index])
+    ends = np.minimum(ends[keep], window_end[room_index])
+
+    order = np.lexsort((starts, room_index))
+    room_index, starts, ends = room_index[order], starts[order], ends[order]
+
+    # Running maximum of booking ends within each room. Ends are shifted to be relative
+    # to the room's window and offset per room, so a single global accumulate never lets
+    # one room's value leak into the next.
+    span = int((window_end - window_start).max()) + 1 if n_rooms else 1
+    offset = room_index * span - window_start[room_index]
+    covered = np.maximum.accumulate(ends + offset) - offset if ends.size else ends
+
+    first = np.ones(room_index.size, dtype=bool)
+    first[1:] = room_index[1:] != room_index[:-1]
+    previous_end = np.empty_like(starts)
+    previous_end[1:] = covered[:-1]
+    previous_end[first] = window_start[room_index[first]]
+
+    # Gap after the last booking of every room (or the whole window for rooms without bookings)
+    tail_start = window_start.copy()
+    last = np.ones(room_index.size, dtype=bool)
+    last[:-1] = room_index[1:] != room_index[:-1]
+    tail_start[room_index[last]] = covered[last]
+
+    gap_room = np.concatenate([room_index, np.arange(n_rooms, dtype=np.int64)])
+    gap_start = np.concatenate([previous_end, tail_start])
+    gap_end = np.concatenate([starts, window_end])
+
+    length = gap_end - gap_start
+    keep = length > 0
+    if min_duration is not None:
+        keep &= length >= min_duration * _MICROSECONDS_PER_HOUR
+    gap_room, gap_start, gap_end = gap_room[keep], gap_start[keep], gap_end[keep]
+
+    order = np.lexsort((gap_start, gap_room))
+    gap_room, gap_start, gap_end = gap_room[order], gap_start[order], gap_end[order]
+    if is_datetime:
+        gap_start, gap_end = gap_start.astype(_UNIT), gap_end.astype(_UNIT)
+    return gap_room, gap_start, gap_end
+
+
 def find_available_intervals(
-    day_start: datetime, 
-    day_end: datetime, 
-    booking_intervals: List[Tuple[datetime, datetime]], 
+    day_start: datetime,
+    day_end: datetime,
+    booking_intervals: List[Tuple[datetime, datetime]],
     min_duration: float = None
 ) -> List[Tuple[datetime, datetime]]:
     """
     Find available time intervals between bookings.
-    
+
     Args:
         day_start: Start time of the day
         day_end: End time of the day
         booking_intervals: List of (start, end) tuples representing booked intervals
         min_duration: Minimum required duration in hours, or None for any duration
-        
+
     Returns:
         List of (start, end) tuples representing available intervals
     """
-    # Sort booking intervals by start time
-    sorted_bookings = sorted(booking_intervals, key=lambda x: x[0])
-    
-    # Initialize the list of available intervals
-    available_intervals = []
-    
-    # Start with the beginning of the day
-    current_time = day_start
-    
-    # Check each booking interval
-    for booking_start, booking_end in sorted_bookings:
-        # If there's time before this booking, add it to available intervals
-        if current_time < booking_start:
-            interval = (current_time, booking_start)
-            
-            # Only include if it meets the minimum duration (if specified)
-            if min_duration is None or (booking_start - current_time).total_seconds() / 3600 >= min_duration:
-                available_intervals.append(interval)
-        
-        # Move current time to the end of this booking
-        current_time = max(current_time, booking_end)
-    
-    # Check if there's time after the last booking
-    if current_time < day_end:
-        interval = (current_time, day_end)
-        
-        # Only include if it meets the minimum duration (if specified)
-        if min_duration is None or (day_end - current_time).total_seconds() / 3600 >= min_duration:
-            available_intervals.append(interval)
-    
-    return available_intervals 
\ No newline at end of file
+    starts = [booking_start for booking_start, _ in booking_intervals]
+    ends = [booking_end for _, booking_end in booking_intervals]
+    _, gap_start, gap_end = find_available_intervals_batch(
+        np.array([day_start], dtype=_UNIT), np.array([day_end], dtype=_UNIT),
+        np.zeros(len(booking_intervals), dtype=np.int64),
+        np.array(starts, dtype=_UNIT), np.array(ends, dtype=_UNIT),
+        min_duration,
+    )
+    return list(zip(gap_start.tolist(), gap_end.tolist()))
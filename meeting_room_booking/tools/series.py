@@ -0,0 +1,184 @@
+"""
+Recurring bookings for the Meeting Room Booking System.
+
+A series is a set of ordinary bookings sharing a ``series_id``. ``book_series`` expands a
+daily, weekly or monthly rule into its occurrences, and the store checks all of them in one
+sweep per room and commits them as a single change. Conflicting occurrences come back with
+the nearest free slots of the same length on their day (via ``check_slots``).
+``move_series`` and ``BookingBackend.cancel_series`` change the upcoming occurrences of a
+series in one operation as well.
+"""
+
+import calendar
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from meeting_room_booking.storage import Booking, get_store
+from meeting_room_booking.storage.store import TIME_FORMAT
+from meeting_room_booking.tools.availability import SlotCheck, check_slots
+
+FREQUENCIES = ('daily', 'weekly', 'monthly')
+# Upper bound on occurrences per series (a weekday-daily series for most of a year)
+MAX_OCCURRENCES = 260
+
+
+@dataclass
+class SeriesResult:
+    """Outcome of booking or moving a series."""
+    series_id: str
+    # Occurrences the rule expanded to
+    occurrences: int = 0
+    # Occurrences that were stored
+    booked: List[Booking] = field(default_factory=list)
+    # Occurrences that could not be stored, with suggested replacement slots
+    conflicts: List[SlotCheck] = field(default_factory=list)
+    # First day of each month a monthly series skipped because it lacks the start day (e.g. the 31st)
+    skipped_months: List[date] = field(default_factory=list)
+
+
+def _add_months(moment: datetime, months: int) -> Optional[datetime]:
+    """``moment`` moved by whole months, or None if that month lacks the day (e.g. the 31st)."""
+    month_index = moment.month - 1 + months
+    year, month = moment.year + month_index // 12, month_index % 12 + 1
+    if moment.day > calendar.monthrange(year, month)[1]:
+        return None
+    return moment.replace(year=year, month=month)
+
+
+def skipped_months(start: datetime, last: datetime, interval: int = 1) -> List[date]:
+    """Months of a monthly series from ``start`` to ``last`` that have no occurrence because they lack the day."""
+    months, step = [], 1
+    while True:
+        month_index = start.month - 1 + step * interval
+        year, month = start.year + month_index // 12, month_index % 12 + 1
+        if (year, month) > (last.year, last.month):
+            return months
+        if _add_months(start, step * interval) is None:
+            months.append(date(year, month, 1))
+        step += 1
+
+
+def occurrence_starts(start: datetime, frequency: str, count: Optional[int] = None,
+                      until: Optional[date] = None, interval: int = 1) -> List[datetime]:
+    """
+    Start times of a recurring series.
+
+    Args:
+        start: First occurrence
+        frequency: 'daily', 'weekly' or 'monthly'; monthly series keep the day of the month
+                   and skip months that do not have it
+        count: Number of occurrences
+        until: Last day (inclusive) an occurrence may start on
+        interval: Repeat every ``interval`` days/weeks/months
+
+    Raises:
+        ValueError: If the rule is invalid or expands to more than MAX_OCCURRENCES
+    """
+    frequency = (frequency or '').strip().lower()
+    if frequency not in FREQUENCIES:
+        raise ValueError(f"Unknown frequency '{frequency}'. Use one of: {', '.join(FREQUENCIES)}")
+    if (count is None) == (until is None):
+        raise ValueError("Give either a number of occurrences or an end date")
+    if interval < 1:
+        raise ValueError("The interval must be at least 1")
+    if count is not None and not 1 <= count <= MAX_OCCURRENCES:
+        raise ValueError(f"The number of occurrences must be between 1 and {MAX_OCCURRENCES}")
+    if until is not None and until < start.date():
+        raise ValueError("The end date is before the first occurrence")
+
+    starts, step = [], 0
+    while count is None or len(starts) < count:
+        if frequency == 'monthly':
+            moment = _add_months(start, step * interval)
+        else:
+            moment = start + timedelta(days=step * interval * (7 if frequency == 'weekly' else 1))
+        step += 1
+        if moment is None:
+            continue
+        if until is not None and moment.date() > until:
+            break
+        if len(starts) == MAX_OCCURRENCES:
+            raise ValueError(f"A series can have at most {MAX_OCCURRENCES} occurrences")
+        starts.append(moment)
+    return starts
+
+
+def _hours_of(booking: Booking) -> float:
+    return (booking.end_dt - booking.start_dt).total_seconds() / 3600
+
+
+def _suggestions(conflicts: List[Booking]) -> List[SlotCheck]:
+    return check_slots([(booking.room_id, booking.start_dt, _hours_of(booking)) for booking in conflicts])
+
+
+def book_series(room_id: int, customer_name: str, customer_id: str, start: datetime, duration: float,
+                frequency: str, count: Optional[int] = None, until: Optional[date] = None, interval: int = 1,
+                skip_conflicts: bool = False) -> SeriesResult:
+    """
+    Book every occurrence of a recurring rule in one atomic store operation.
+
+    Unless ``skip_conflicts`` is set, nothing is booked when any occurrence conflicts; the
+    result then lists the conflicts and ``booked`` is empty.
+
+    Raises:
+        ValueError: If the rule is invalid or the occurrences overlap each other
+    """
+    if duration <= 0:
+        raise ValueError("Duration must be positive")
+    starts = occurrence_starts(start, frequency, count=count, until=until, interval=interval)
+    length = timedelta(hours=duration)
+    if len(starts) > 1 and min(b - a for a, b in zip(starts, starts[1:])) < length:
+        raise ValueError("Occurrences of the series would overlap each other")
+
+    store = get_store()
+    booking_ids = store.allocate_booking_ids(len(starts))
+    # Booking IDs are never reused, so the first one also names the series uniquely
+    series_id = f"S{booking_ids[0]}"
+    bookings = [
+        Booking(booking_id=booking_id, room_id=room_id, customer_name=customer_name, customer_id=customer_id,
+                start_time=moment.strftime(TIME_FORMAT), end_time=(moment + length).strftime(TIME_FORMAT),
+                start_dt=moment, end_dt=moment + length, series_id=series_id)
+        for booking_id, moment in zip(booking_ids, starts)
+    ]
+    conflicts = store.book_many(bookings, partial=skip_conflicts)
+
+    rejected = {id(booking) for booking in conflicts}
+    booked = [] if conflicts and not skip_conflicts else [b for b in bookings if id(b) not in rejected]
+    skipped = skipped_months(start, starts[-1], interval) if frequency.strip().lower() == 'monthly' else []
+    return SeriesResult(series_id=series_id, occurrences=len(bookings), booked=booked,
+                        conflicts=_suggestions(conflicts), skipped_months=skipped)
+
+
+def move_series(series_id: str, new_start: datetime, room_id: Optional[int] = None,
+                duration: Optional[float] = None, now: Optional[datetime] = None) -> Optional[SeriesResult]:
+    """
+    Shift the upcoming occurrences of a series so that the next one starts at ``new_start``;
+    every later occurrence moves by the same offset. Optionally also change the room or length.
+    Nothing changes if any moved occurrence conflicts.
+
+    Returns:
+        None if the series has no upcoming occurrences
+    """
+    now = now or datetime.now()
+    upcoming = [booking for booking in get_store().series_bookings(series_id) if booking.start_dt >= now]
+    if not upcoming:
+        return None
+
+    offset = new_start - upcoming[0].start_dt
+    moved = []
+    for booking in upcoming:
+        start = booking.start_dt + offset
+        end = start + (timedelta(hours=duration) if duration is not None else booking.end_dt - booking.start_dt)
+        moved.append(Booking(booking_id=booking.booking_id,
+                             room_id=room_id if room_id is not None else booking.room_id,
+                             customer_name=booking.customer_name, customer_id=booking.customer_id,
+                             start_time=start.strftime(TIME_FORMAT), end_time=end.strftime(TIME_FORMAT),
+                             start_dt=start, end_dt=end, series_id=series_id))
+
+    conflicts = get_store().reschedule_series(series_id, moved)
+    if conflicts is None:
+        return None
+    return SeriesResult(series_id=series_id, occurrences=len(moved), booked=[] if conflicts else moved,
+                        conflicts=_suggestions(conflicts))
+
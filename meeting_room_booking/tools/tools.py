@@ -2,17 +2,121 @@
 Tool implementations for the Meeting Room Booking System.
 """
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from datetime import timedelta, datetime
+import numpy as np
 import pandas as pd
 import re
 from langchain_core.tools import tool
-import os
+from typing_extensions import TypedDict
 
 # Import helper function for finding available intervals
-from meeting_room_booking.tools.find_intervals import find_available_intervals
+from meeting_room_booking.tools.find_intervals import find_available_intervals, find_available_intervals_batch
+from meeting_room_booking.tools.availability import (
+    DEFAULT_HORIZON_DAYS,
+    FreeSlot,
+    SlotCheck,
+    check_slots,
+    earliest_slots,
+    free_intervals_range,
+)
+from meeting_room_booking.tools.series import book_series, move_series
+from meeting_room_booking.tools.cache import memoize_tool
+from meeting_room_booking.tools.executor import offload_async
+from meeting_room_booking.storage import Booking, Room, get_store
+from meeting_room_booking.storage.store import TIME_FORMAT
 
+
+def _parse_start(start: str) -> Tuple[datetime, bool]:
+    """Parse a 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD' string, returning (datetime, is_specific_time)."""
+    if len(start) > 10 and " " in start:
+        return datetime.strptime(start, TIME_FORMAT), True
+    return datetime.strptime(start, '%Y-%m-%d'), False
+
+
+def _day_bounds(moment: datetime) -> Tuple[datetime, datetime]:
+    """Return the [midnight, next midnight) window containing ``moment``."""
+    day_start = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    return day_start, day_start + timedelta(days=1)
+
+
+def _day_booking_intervals(room_id: int, day_start: datetime,
+                           day_end: datetime) -> List[Tuple[datetime, datetime]]:
+    """Bookings of a room that overlap [day_start, day_end), clipped to that window."""
+    return [(max(booking.start_dt, day_start), min(booking.end_dt, day_end))
+            for booking in get_store().overlapping(room_id, day_start, day_end)]
+
+
+def _free_intervals_by_room(room_ids: List[int], day_start: datetime, day_end: datetime,
+                            min_duration: float = None) -> Dict[int, List[Tuple[datetime, datetime]]]:
+    """Free intervals of every room in [day_start, day_end), computed in a single batched pass."""
+    store = get_store()
+    positions, starts, ends = [], [], []
+    for position, room_id in enumerate(room_ids):
+        for booking in store.overlapping(room_id, day_start, day_end):
+            positions.append(position)
+            starts.append(booking.start_dt)
+            ends.append(booking.end_dt)
+
+    gap_room, gap_start, gap_end = find_available_intervals_batch(
+        np.datetime64(day_start, 'us'), np.datetime64(day_end, 'us'),
+        positions, starts, ends, min_duration, n_rooms=len(room_ids))
+
+    free_intervals = {room_id: [] for room_id in room_ids}
+    for position, interval_start, interval_end in zip(gap_room.tolist(), gap_start.tolist(), gap_end.tolist()):
+        free_intervals[room_ids[position]].append((interval_start, interval_end))
+    return free_intervals
+
+
+def _filter_rooms(features: List[str]) -> List[Room]:
+    """
+    Rooms that have every requested feature and satisfy any capacity constraint, looked up in
+    the store's room catalog index.
+
+    Raises:
+        ValueError: If a requested feature is not a column of the room catalog
+    """
+    return get_store().catalog().filter(features)
+
+def _features_key(start: str, features: List[str], duration: float):
+    # Features are matched case-insensitively and combined with AND, so order and repeats don't matter
+    return start, tuple(sorted({feature.lower() for feature in features})), float(duration)
+
+
+def _room_key(start: str, room_id: int, duration: float):
+    return start, int(room_id), float(duration)
+
+
+# Slots suggested by check_availability_features / check_specific_room when the requested day is full
+NEXT_SLOTS_SUGGESTED = 3
+MAX_NEXT_SLOTS = 10
+
+
+def _slot_lines(slots: List[FreeSlot], rooms: Dict[int, Room]) -> str:
+    def clock(moment: datetime, day: datetime) -> str:
+        return moment.strftime('%H:%M' if moment.date() == day.date() else TIME_FORMAT)
+
+    lines = []
+    for slot in slots:
+        room = rooms[slot.room_id]
+        free = (f"free until {clock(slot.free_until, slot.start)}" if slot.free_until is not None
+                else "free until the end of the search")
+        lines.append(f"- Room {room.room_id} - {room.room_location} (capacity {room.capacity}): "
+                     f"{slot.start.strftime(TIME_FORMAT)} to {clock(slot.end, slot.start)} ({free})")
+    return "\n".join(lines)
+
+
+def _next_slots_hint(rooms: List[Room], duration: float, after: datetime) -> str:
+    """Earliest later slots in ``rooms``, so the agent needs no second call for another day."""
+    slots = earliest_slots([room.room_id for room in rooms], duration, after, limit=NEXT_SLOTS_SUGGESTED)
+    if not slots:
+        return f"No free slot of that length in the next {DEFAULT_HORIZON_DAYS} days."
+    return f"Earliest free slots after that:\n{_slot_lines(slots, {room.room_id: room for room in rooms})}"
+
+
+@offload_async
 @tool
+@memoize_tool(_features_key)
 def check_availability_features(
     start: str, 
     features: List[str],
@@ -26,7 +130,8 @@ def check_availability_features(
                If only date is provided, returns all available time slots for that day
         features: List of features required (e.g., ['capacity>10', 'projector', 'whiteboard'])
                  Capacity can be specified with operators (>, <, >=, <=, =)
-                 Other features (projector, whiteboard, internet) are considered required if included
+                 Other features (the yes/no columns of the room catalog, e.g. projector, whiteboard,
+                 internet) are considered required if included
         duration: Float duration in hours (default: 1.0)
     
     Returns:
@@ -34,243 +139,103 @@ def check_availability_features(
              If no rooms are available at the requested time, suggests alternative times
     """
     try:
-        # Read data from CSV files
-        df_booking = pd.read_csv('data/bookings.csv', on_bad_lines='skip', dtype=str)
-        df_rooms = pd.read_csv('data/meeting_rooms.csv', on_bad_lines='skip', dtype=str)
+        store = get_store()
+        catalog = store.catalog()
     except pd.errors.ParserError as e:
         return f"Error reading CSV files: {e}"
     except Exception as e:
         return f"Error: {e}"
 
-    # Ensure required columns exist
-    required_booking_cols = ['room_id', 'start_time', 'end_time']
-    required_room_cols = ['room_id', 'room_location', 'capacity', 'projector', 'whiteboard', 'internet']
-    
-    if not all(col in df_booking.columns for col in required_booking_cols):
-        return "Error: Missing required columns in bookings.csv"
-    if not all(col in df_rooms.columns for col in required_room_cols):
-        return "Error: Missing required columns in meeting_rooms.csv"
-
-    # Convert room_id to numeric, handling potential non-numeric values
-    df_booking['room_id'] = pd.to_numeric(df_booking['room_id'], errors='coerce')
-    df_rooms['room_id'] = pd.to_numeric(df_rooms['room_id'], errors='coerce')
-    
-    # Convert capacity to numeric
-    df_rooms['capacity'] = pd.to_numeric(df_rooms['capacity'], errors='coerce')
-
-    # Convert date strings to datetime in bookings dataframe
-    try:
-        df_booking['start_time'] = pd.to_datetime(df_booking['start_time'], errors='coerce')
-        df_booking['end_time'] = pd.to_datetime(df_booking['end_time'], errors='coerce')
-        # Drop rows with invalid dates
-        df_booking = df_booking.dropna(subset=['start_time', 'end_time', 'room_id'])
-    except Exception as e:
-        return f"Error parsing dates in bookings.csv: {e}"
-
     # Parse the start date/time based on format
     try:
-        # Try to parse as YYYY-MM-DD HH:MM format
-        if len(start) > 10 and " " in start:
-            start_time = datetime.strptime(start, '%Y-%m-%d %H:%M')
-            is_specific_time = True
+        start_time, is_specific_time = _parse_start(start)
+        if is_specific_time:
             end_time = start_time + timedelta(hours=duration)
-        else:
-            # Parse as just YYYY-MM-DD format
-            start_time = datetime.strptime(start, '%Y-%m-%d')
-            is_specific_time = False
     except ValueError as e:
         return f"Invalid date format: {e}. Use 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD'"
 
     # Filter rooms based on features
-    filtered_rooms = df_rooms.copy()
-    
-    for feature in features:
-        if feature.lower() in ['projector', 'whiteboard', 'internet']:
-            # For boolean features, filter rooms that have the feature
-            filtered_rooms = filtered_rooms[filtered_rooms[feature.lower()].str.lower() == 'yes']
-        elif 'capacity' in feature.lower():
-            # For capacity, check the operator and value
-            match = re.match(r'capacity\s*([><]=?|=)\s*(\d+)', feature.lower())
-            if match:
-                operator, value = match.groups()
-                value = int(value)
-                
-                if operator == '>':
-                    filtered_rooms = filtered_rooms[filtered_rooms['capacity'] > value]
-                elif operator == '>=':
-                    filtered_rooms = filtered_rooms[filtered_rooms['capacity'] >= value]
-                elif operator == '<':
-                    filtered_rooms = filtered_rooms[filtered_rooms['capacity'] < value]
-                elif operator == '<=':
-                    filtered_rooms = filtered_rooms[filtered_rooms['capacity'] <= value]
-                else:  # operator == '='
-                    filtered_rooms = filtered_rooms[filtered_rooms['capacity'] == value]
-            else:
-                # Just 'capacity' means any capacity
-                pass
+    try:
+        filtered_rooms = catalog.filter(features)
+    except ValueError as e:
+        return f"Error: {e}."
     
     # If no rooms match the features, return early
-    if filtered_rooms.empty:
+    if not filtered_rooms:
         return "No rooms match the requested features."
     
+    day_start, day_end = _day_bounds(start_time)
+
     # Results to store room availability
     results = []
     
-    # For each room that matches features, check availability
-    for _, room in filtered_rooms.iterrows():
-        room_id = int(room['room_id'])
-        room_location = room['room_location']
-        room_capacity = room['capacity']
-        room_features = {
-            'projector': room['projector'].lower() == 'yes',
-            'whiteboard': room['whiteboard'].lower() == 'yes',
-            'internet': room['internet'].lower() == 'yes'
-        }
-        
-        # Filter bookings for this room
-        room_bookings = df_booking[df_booking['room_id'] == room_id]
-        
-        # Handle specific time check
-        if is_specific_time:
-            # Check for overlap with existing bookings
-            is_available = True
-            if not room_bookings.empty:
-                for _, booking in room_bookings.iterrows():
-                    if (start_time < booking['end_time'] and 
-                        end_time > booking['start_time']):
-                        is_available = False
-                        break
-            
-            # If available, add to results
-            if is_available:
-                room_info = {
-                    'room_id': room_id,
-                    'location': room_location,
-                    'capacity': room_capacity,
-                    'features': ', '.join([f for f, enabled in room_features.items() if enabled]),
+    if is_specific_time:
+        # Check each matching room for overlap with existing bookings
+        for room in filtered_rooms:
+            if not store.has_conflict(room.room_id, start_time, end_time):
+                results.append({
+                    'room_id': room.room_id,
+                    'location': room.room_location,
+                    'capacity': room.capacity,
+                    'features': ', '.join(room.feature_names()),
                     'availability': f"{start} for {duration} hour{'s' if duration != 1 else ''}"
-                }
-                results.append(room_info)
-        
-        # Handle day-only check - Find all available intervals
-        else:
-            day_start = start_time.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = day_start + timedelta(days=1) - timedelta(minutes=1)  # 23:59
-            
-            # Collect all booking intervals for this room on this day
-            booking_intervals = []
-            for _, booking in room_bookings.iterrows():
-                # Check if booking overlaps with the day
-                if booking['start_time'] < day_end + timedelta(minutes=1) and booking['end_time'] > day_start:
-                    # Add the overlapping part of the booking
-                    interval_start = max(booking['start_time'], day_start)
-                    interval_end = min(booking['end_time'], day_end + timedelta(minutes=1))
-                    booking_intervals.append((interval_start, interval_end))
-            
-            # Find available intervals that can accommodate the requested duration
-            available_intervals = find_available_intervals(day_start, day_end + timedelta(minutes=1), 
-                                                          booking_intervals, duration)
+                })
+    else:
+        # Day-only check - Find the available intervals of all matching rooms in one pass
+        free_intervals = _free_intervals_by_room([room.room_id for room in filtered_rooms],
+                                                 day_start, day_end, duration)
+        for room in filtered_rooms:
+            available_intervals = free_intervals[room.room_id]
             
             # If there are available intervals, add room to results
             if available_intervals:
                 # Format intervals for display
-                interval_strings = []
-                for interval_start, interval_end in available_intervals:
-                    start_str = interval_start.strftime('%H:%M')
-                    end_str = interval_end.strftime('%H:%M')
-                    interval_strings.append(f"{start_str} - {end_str}")
+                interval_strings = [f"{interval_start.strftime('%H:%M')} - {interval_end.strftime('%H:%M')}"
+                                    for interval_start, interval_end in available_intervals]
                 
-                room_info = {
-                    'room_id': room_id,
-                    'location': room_location,
-                    'capacity': room_capacity,
-                    'features': ', '.join([f for f, enabled in room_features.items() if enabled]),
+                results.append({
+                    'room_id': room.room_id,
+                    'location': room.room_location,
+                    'capacity': room.capacity,
+                    'features': ', '.join(room.feature_names()),
                     'availability': ', '.join(interval_strings)
-                }
-                results.append(room_info)
+                })
     
     # Format the response
     if not results:
         if is_specific_time:
-            # If no rooms are available at the requested time, suggest alternatives
+            # If no rooms are available at the requested time, suggest alternatives on the same day
             alternatives = []
+            free_intervals = _free_intervals_by_room([room.room_id for room in filtered_rooms],
+                                                     day_start, day_end, duration)
             
-            # Check for alternative time slots on the same day
-            day_start = start_time.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = day_start + timedelta(days=1) - timedelta(minutes=1)  # 23:59
-            
-            for _, room in filtered_rooms.iterrows():
-                room_id = int(room['room_id'])
-                room_location = room['room_location']
-                
-                # Filter bookings for this room
-                room_bookings = df_booking[df_booking['room_id'] == room_id]
-                
-                # Collect all booking intervals for this room on this day
-                booking_intervals = []
-                for _, booking in room_bookings.iterrows():
-                    if booking['start_time'] < day_end + timedelta(minutes=1) and booking['end_time'] > day_start:
-                        interval_start = max(booking['start_time'], day_start)
-                        interval_end = min(booking['end_time'], day_end + timedelta(minutes=1))
-                        booking_intervals.append((interval_start, interval_end))
-                
-                # Find available intervals that can accommodate the requested duration
-                available_intervals = find_available_intervals(day_start, day_end + timedelta(minutes=1), 
-                                                            booking_intervals, duration)
-                
-                for interval_start, interval_end in available_intervals:
-                    # Add the entire available interval
-                    start_str = interval_start.strftime('%H:%M')
-                    end_str = interval_end.strftime('%H:%M')
-                        
-                    alternatives.append({
-                        'room_id': room_id,
-                        'location': room_location,
-                        'capacity': room['capacity'],
-                        'features': ', '.join([f for f, enabled in {
-                            'projector': room['projector'].lower() == 'yes',
-                            'whiteboard': room['whiteboard'].lower() == 'yes',
-                            'internet': room['internet'].lower() == 'yes'
-                        }.items() if enabled]),
-                        'time': f"{start_str} - {end_str}"
-                    })
+            for room in filtered_rooms:
+                available_intervals = free_intervals[room.room_id]
+                if available_intervals:
+                    alternatives.append((room, [f"{interval_start.strftime('%H:%M')} - {interval_end.strftime('%H:%M')}"
+                                                for interval_start, interval_end in available_intervals]))
             
             if alternatives:
-                # Sort alternatives by room_id and time
-                alternatives.sort(key=lambda x: (x['room_id'], x['time']))
-                
                 response = (f"No rooms with the requested features are available at {start} for "
                           f"{duration} hour{'s' if duration != 1 else ''}.\n\n"
                           f"Alternative options on {start_time.date()}:\n\n")
                 
-                # Group alternatives by room
-                current_room = None
-                for alt in alternatives:
-                    if current_room != alt['room_id']:
-                        features_str = f"Features: {alt['features']}" if alt['features'] else "No special features"
-                        response += (f"Room {alt['room_id']} - {alt['location']}\n"
-                                    f"Capacity: {alt['capacity']}\n"
-                                    f"{features_str}\n"
-                                    f"Available: {alt['time']}")
-                        current_room = alt['room_id']
-                    else:
-                        # Just add the time for the same room
-                        response += f", {alt['time']}"
-                    
-                    # Check if next alternative is for a different room
-                    next_is_different = alternatives.index(alt) < len(alternatives) - 1 and alternatives[alternatives.index(alt) + 1]['room_id'] != current_room
-                    if next_is_different or alternatives.index(alt) == len(alternatives) - 1:
-                        response += "\n\n"
+                # Group alternatives by room, sorted by room_id and time
+                for room, times in sorted(alternatives, key=lambda alt: alt[0].room_id):
+                    room_features = ', '.join(room.feature_names())
+                    features_str = f"Features: {room_features}" if room_features else "No special features"
+                    response += (f"Room {room.room_id} - {room.room_location}\n"
+                                f"Capacity: {room.capacity}\n"
+                                f"{features_str}\n"
+                                f"Available: {', '.join(sorted(times))}\n\n")
                 
                 return response.strip()
             else:
-                # Check the next day for alternatives
-                next_day = day_start + timedelta(days=1)
-                next_day_str = next_day.strftime('%Y-%m-%d')
-                
+                # Look ahead for the earliest slots on the following days
                 return (f"No rooms with the requested features are available at {start} for "
                       f"{duration} hour{'s' if duration != 1 else ''}.\n\n"
-                      f"No alternative times are available on this day. Try checking availability on {next_day_str}.")
+                      f"No alternative times are available on this day. "
+                      f"{_next_slots_hint(filtered_rooms, duration, day_end)}")
         else:
             return f"No rooms with the requested features are available on {start}."
     
@@ -289,7 +254,9 @@ def check_availability_features(
     
     return response.strip()
 
+@offload_async
 @tool
+@memoize_tool(_room_key)
 def check_specific_room(
     start: str, 
     room_id: int,
@@ -309,250 +276,358 @@ def check_specific_room(
              If room is not available at requested time, suggests alternative available slots on the same day
     """
     try:
-        # Read data from CSV files
-        df_booking = pd.read_csv('data/bookings.csv', on_bad_lines='skip', dtype=str)
-        df_rooms = pd.read_csv('data/meeting_rooms.csv', on_bad_lines='skip', dtype=str)
+        store = get_store()
+        room = store.get_room(room_id)
     except pd.errors.ParserError as e:
         return f"Error reading CSV files: {e}"
     except Exception as e:
         return f"Error: {e}"
 
-    # Get valid room IDs from df_rooms
-    try:
-        valid_room_ids = df_rooms['room_id'].dropna().astype(int).unique().tolist()
-    except ValueError as e:
-        return f"Error: Invalid room_id values in meeting_rooms.csv: {e}"
-
     # Check if room_id is valid
-    if room_id not in valid_room_ids:
+    if room is None:
+        valid_room_ids = [r.room_id for r in store.rooms()]
         return f"There is no room with ID {room_id}. Available rooms: {valid_room_ids}"
 
-    # Ensure required columns exist
-    required_booking_cols = ['room_id', 'start_time', 'end_time']
-    if not all(col in df_booking.columns for col in required_booking_cols):
-        return "Error: Missing required columns in bookings.csv"
-
-    # Convert room_id to numeric, handling potential non-numeric values
-    df_booking['room_id'] = pd.to_numeric(df_booking['room_id'], errors='coerce')
-    df_rooms['room_id'] = pd.to_numeric(df_rooms['room_id'], errors='coerce')
-
-    # Convert date strings to datetime in bookings dataframe
-    try:
-        df_booking['start_time'] = pd.to_datetime(df_booking['start_time'], errors='coerce')
-        df_booking['end_time'] = pd.to_datetime(df_booking['end_time'], errors='coerce')
-        # Drop rows with invalid dates
-        df_booking = df_booking.dropna(subset=['start_time', 'end_time', 'room_id'])
-    except Exception as e:
-        return f"Error parsing dates in bookings.csv: {e}"
-
     # Parse the start date/time based on format
     try:
-        # Try to parse as YYYY-MM-DD HH:MM format
-        if len(start) > 10 and " " in start:
-            start_time = datetime.strptime(start, '%Y-%m-%d %H:%M')
-            is_specific_time = True
-        else:
-            # Parse as just YYYY-MM-DD format
-            start_time = datetime.strptime(start, '%Y-%m-%d')
-            is_specific_time = False
+        start_time, is_specific_time = _parse_start(start)
     except ValueError as e:
         return f"Invalid date format: {e}. Use 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD'"
 
-    # Filter bookings for the specific room
-    room_bookings = df_booking[df_booking['room_id'] == room_id]
+    day_start, day_end = _day_bounds(start_time)
 
     # Handle specific time slot check
     if is_specific_time:
         # Calculate end_time
         end_time = start_time + timedelta(hours=duration)
-        # Check for overlap with existing bookings
-        is_available = True
-        if not room_bookings.empty:
-            for _, booking in room_bookings.iterrows():
-                if (start_time < booking['end_time'] and 
-                    end_time > booking['start_time']):
-                    is_available = False
-                    break
-        
         time_slot = f"{start} for {duration} hour{'s' if duration != 1 else ''}"
         
         # Return availability message
-        if is_available:
+        if not store.has_conflict(room_id, start_time, end_time):
             return f"Room {room_id} is available {time_slot}."
         
-        # Collect all booking intervals for this room on this day
-        booking_intervals = []
-        day_start = start_time.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1) - timedelta(minutes=1)  # 23:59
-        
-        for _, booking in room_bookings.iterrows():
-            # Check if booking overlaps with the day
-            if booking['start_time'] < day_end + timedelta(minutes=1) and booking['end_time'] > day_start:
-                # Add the overlapping part of the booking
-                interval_start = max(booking['start_time'], day_start)
-                interval_end = min(booking['end_time'], day_end + timedelta(minutes=1))
-                booking_intervals.append((interval_start, interval_end))
-        
-        # Find available intervals that can accommodate the requested duration
-        available_intervals = find_available_intervals(day_start, day_end + timedelta(minutes=1), booking_intervals, duration)
+        # Find available intervals on the same day that can accommodate the requested duration
+        booking_intervals = _day_booking_intervals(room_id, day_start, day_end)
+        available_intervals = find_available_intervals(day_start, day_end, booking_intervals, duration)
         
         if not available_intervals:
             return (f"Room {room_id} is not available for the time slot {time_slot}. "
-                    f"No alternative times available on {start_time.date()}.")
+                    f"No alternative times available on {start_time.date()}. "
+                    f"{_next_slots_hint([room], duration, day_end)}")
         
         # Format the alternative time slots with both start and end times
-        alternative_slots = []
-        for interval_start, interval_end in available_intervals:  # Show all available intervals
-            start_str = interval_start.strftime('%H:%M')
-            end_str = interval_end.strftime('%H:%M')
-            alternative_slots.append(f"{start_str} to {end_str}")
-        
-        alternative_str = ", ".join(alternative_slots)
+        alternative_str = ", ".join(f"{interval_start.strftime('%H:%M')} to {interval_end.strftime('%H:%M')}"
+                                    for interval_start, interval_end in available_intervals)
         return (f"Room {room_id} is not available for the time slot {time_slot}. "
                 f"Alternative available slots on {start_time.date()}: {alternative_str}.")
     
     # Handle day-only query - Return all available time intervals for the day
     else:
-        day_start = start_time.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1) - timedelta(minutes=1)  # 23:59
-        
-        # Collect all booking intervals for this room on this day
-        booking_intervals = []
-        for _, booking in room_bookings.iterrows():
-            # Check if booking overlaps with the day
-            if booking['start_time'] < day_end and booking['end_time'] > day_start:
-                # Add the overlapping part of the booking
-                interval_start = max(booking['start_time'], day_start)
-                interval_end = min(booking['end_time'], day_end + timedelta(minutes=1))
-                booking_intervals.append((interval_start, interval_end))
-        
-        # Find available intervals
-        available_intervals = find_available_intervals(day_start, day_end + timedelta(minutes=1), booking_intervals)
+        booking_intervals = _day_booking_intervals(room_id, day_start, day_end)
+        available_intervals = find_available_intervals(day_start, day_end, booking_intervals)
         
         # Format the response
         if not available_intervals:
             return f"Room {room_id} is fully booked on {start}. No available time intervals."
         
-        interval_strings = []
-        for interval_start, interval_end in available_intervals:
-            start_str = interval_start.strftime('%H:%M')
-            end_str = interval_end.strftime('%H:%M')
-            interval_strings.append(f"{start_str} to {end_str}")
-        
-        intervals_formatted = ", ".join(interval_strings)
+        intervals_formatted = ", ".join(f"{interval_start.strftime('%H:%M')} to {interval_end.strftime('%H:%M')}"
+                                        for interval_start, interval_end in available_intervals)
         return f"Room {room_id} is available at the following times on {start}: {intervals_formatted}"
 
+
+class SlotCandidate(TypedDict, total=False):
+    """One slot to check with ``check_availability_batch``."""
+    room_id: int
+    start: str
+    duration: float
+
+
+# Upper bound on candidates per batch call, to keep the answer readable
+MAX_BATCH_CANDIDATES = 50
+
+
+def _batch_key(candidates: List[SlotCandidate]):
+    return tuple((candidate.get('room_id'), str(candidate.get('start', '')).strip(),
+                  float(candidate.get('duration', 1.0))) for candidate in candidates)
+
+
+def _hours(duration: float) -> str:
+    return f"{duration:g} hour{'s' if duration != 1 else ''}"
+
+
+@offload_async
 @tool
-def book_room(room_id: int, customer_name: str, start_time:str, customer_id: str, duration: int = 1) -> str:
+@memoize_tool(_batch_key)
+def check_availability_batch(candidates: List[SlotCandidate]) -> str:
     """
-    Book a meeting room for a specific time slot and generate a unique booking ID.
+    Check several candidate slots in one call, e.g. to compare rooms or times.
     
     Args:
-        room_id: Room identifier (must exist in meeting_rooms.csv)
-        customer_name: Name of the customer booking the room
-        start_time: Starting time of the booking in format 'YYYY-MM-DD HH:MM'
-        customer_id: Customer identifier (required)
-        duration: Duration of booking in hours (default: 1)
+        candidates: List of slots, each with 'room_id' (int), 'start' (string 'YYYY-MM-DD HH:MM')
+                    and optionally 'duration' (float hours, default 1.0)
     
     Returns:
-        str: Confirmation message with booking details and booking ID if successful,
-             or error message if room doesn't exist, is already booked, or any other error occurs
+        str: One line per candidate saying whether it is available; for unavailable slots, the nearest
+             free start times of the same length in the same room on the same day
+    """
+    if not candidates:
+        return "No candidate slots given."
+    if len(candidates) > MAX_BATCH_CANDIDATES:
+        return f"Error: at most {MAX_BATCH_CANDIDATES} candidate slots can be checked at once."
+    try:
+        checks = check_slots([(candidate.get('room_id'), candidate.get('start', ''), candidate.get('duration', 1.0))
+                              for candidate in candidates])
+    except pd.errors.ParserError as e:
+        return f"Error reading CSV files: {e}"
+    except Exception as e:
+        return f"Error: {e}"
+
+    lines = []
+    for candidate, check in zip(candidates, checks):
+        if check.error is not None:
+            lines.append(f"- Room {candidate.get('room_id')} at {candidate.get('start')}: {check.error}.")
+            continue
+        slot = f"Room {check.room_id} at {check.start.strftime(TIME_FORMAT)} for {_hours(check.duration)}"
+        if check.available:
+            lines.append(f"- {slot}: available.")
+        elif check.alternatives:
+            nearest = ", ".join(f"{alt_start.strftime(TIME_FORMAT)} to {alt_end.strftime('%H:%M')}"
+                                for alt_start, alt_end in check.alternatives)
+            lines.append(f"- {slot}: not available. Nearest free slots: {nearest}.")
+        else:
+            lines.append(f"- {slot}: not available. No free slot of that length on {check.start.date()}.")
+    available = sum(check.available for check in checks)
+    return f"Checked {len(checks)} slot{'s' if len(checks) != 1 else ''}, {available} available:\n\n" + "\n".join(lines)
+
+
+def _range_key(start_date: str, end_date: str, room_id: Optional[int], features: Optional[List[str]],
+               working_hours: Optional[str], min_duration: float):
+    return (start_date.strip(), end_date.strip(), None if room_id is None else int(room_id),
+            tuple(sorted({feature.lower() for feature in features or []})),
+            (working_hours or '').replace(' ', ''), float(min_duration))
+
+
+def _parse_working_hours(working_hours: Optional[str]):
+    """'09:00-17:00' -> (time(9), time(17)); empty -> (None, None)."""
+    if not working_hours or not working_hours.strip():
+        return None, None
+    opening, closing = (part.strip() for part in working_hours.split('-', 1))
+    return datetime.strptime(opening, '%H:%M').time(), datetime.strptime(closing, '%H:%M').time()
+
+
+@offload_async
+@tool
+@memoize_tool(_range_key)
+def check_availability_range(start_date: str, end_date: str, room_id: Optional[int] = None,
+                             features: Optional[List[str]] = None, working_hours: Optional[str] = None,
+                             min_duration: float = 1.0) -> str:
+    """
+    List the free time intervals of rooms on every day of a date range, e.g. "when is room 3 free this week?".
+    
+    Args:
+        start_date: First day in format 'YYYY-MM-DD'
+        end_date: Last day (inclusive) in format 'YYYY-MM-DD', at most 31 days after start_date
+        room_id: A specific room to check (default: every room matching ``features``)
+        features: Required features when no room_id is given (e.g., ['capacity>10', 'projector'])
+        working_hours: Daily window as 'HH:MM-HH:MM', e.g. '09:00-17:00' (default: the whole day)
+        min_duration: Only list intervals of at least this many hours (default: 1.0)
+    
+    Returns:
+        str: For each room, one line per day with its free intervals, or an error message
+    """
+    try:
+        first_day = datetime.strptime(start_date.strip(), '%Y-%m-%d').date()
+        last_day = datetime.strptime(end_date.strip(), '%Y-%m-%d').date()
+    except ValueError as e:
+        return f"Invalid date format: {e}. Use 'YYYY-MM-DD'"
+    try:
+        day_start, day_end = _parse_working_hours(working_hours)
+    except ValueError:
+        return "Invalid working_hours format. Use 'HH:MM-HH:MM', e.g. '09:00-17:00'"
+
+    try:
+        store = get_store()
+        if room_id is not None:
+            room = store.get_room(room_id)
+            if room is None:
+                return f"Error: There is no room with ID {room_id}."
+            rooms = [room]
+        else:
+            rooms = _filter_rooms(features or [])
+            if not rooms:
+                return "No rooms match the requested features."
+        free = free_intervals_range([room.room_id for room in rooms], first_day, last_day,
+                                    day_start, day_end, min_duration)
+    except ValueError as e:
+        return f"Error: {e}."
+    except pd.errors.ParserError as e:
+        return f"Error reading CSV files: {e}"
+    except Exception as e:
+        return f"Error: {e}"
+
+    window = f", {working_hours.strip()}" if working_hours and working_hours.strip() else ""
+    response = (f"Free intervals of at least {_hours(min_duration)} from {first_day} to {last_day}{window}:\n\n"
+                if min_duration > 0 else f"Free intervals from {first_day} to {last_day}{window}:\n\n")
+    for room in rooms:
+        features_str = ', '.join(room.feature_names()) or "no special features"
+        response += f"Room {room.room_id} - {room.room_location} (capacity {room.capacity}, {features_str})\n"
+        for day, intervals in free[room.room_id].items():
+            times = ", ".join(f"{interval_start.strftime('%H:%M')} - {interval_end.strftime('%H:%M')}"
+                              for interval_start, interval_end in intervals)
+            response += f"{day} ({day.strftime('%a')}): {times or 'no free time'}\n"
+        response += "\n"
+    return response.strip()
+
+
+def _search_start(start: Optional[str]) -> datetime:
+    """The given 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD' (midnight), or now rounded up to the next quarter hour."""
+    if start and start.strip():
+        return _parse_start(start.strip())[0]
+    now = datetime.now().replace(second=0, microsecond=0)
+    return now + timedelta(minutes=-now.minute % 15)
+
+
+def _next_key(duration: float, features: Optional[List[str]], start: Optional[str], horizon_days: int,
+              limit: int, working_hours: Optional[str], room_id: Optional[int]):
+    return (float(duration), tuple(sorted({feature.lower() for feature in features or []})), _search_start(start),
+            int(horizon_days), int(limit), (working_hours or '').replace(' ', ''),
+            None if room_id is None else int(room_id))
+
+
+@offload_async
+@tool
+@memoize_tool(_next_key)
+def find_next_available(duration: float = 1.0, features: Optional[List[str]] = None, start: Optional[str] = None,
+                        horizon_days: int = DEFAULT_HORIZON_DAYS, limit: int = 5,
+                        working_hours: Optional[str] = None, room_id: Optional[int] = None) -> str:
+    """
+    Find the earliest free slots across all matching rooms, e.g. "when is a room with a projector next free?".
+    
+    Args:
+        duration: Length of the meeting in hours (default: 1.0)
+        features: Required features (e.g., ['capacity>10', 'projector']); default: any room
+        start: Earliest start as 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD' (default: now)
+        horizon_days: How many days ahead to search (default: 14, at most 31)
+        limit: Number of slots to return (default: 5, at most 10)
+        working_hours: Daily window as 'HH:MM-HH:MM', e.g. '09:00-17:00' (default: the whole day)
+        room_id: Only search this room
+    
+    Returns:
+        str: The earliest free slots in time order (one per free gap), with room details, or an error message
+    """
+    try:
+        after = _search_start(start)
+    except ValueError as e:
+        return f"Invalid date format: {e}. Use 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD'"
+    try:
+        day_start, day_end = _parse_working_hours(working_hours)
+    except ValueError:
+        return "Invalid working_hours format. Use 'HH:MM-HH:MM', e.g. '09:00-17:00'"
+    limit = max(1, min(int(limit), MAX_NEXT_SLOTS))
+
+    try:
+        store = get_store()
+        if room_id is not None:
+            room = store.get_room(room_id)
+            if room is None:
+                return f"Error: There is no room with ID {room_id}."
+            rooms = [room]
+        else:
+            rooms = _filter_rooms(features or [])
+            if not rooms:
+                return "No rooms match the requested features."
+        slots = earliest_slots([room.room_id for room in rooms], duration, after, horizon_days, limit,
+                               day_start, day_end)
+    except ValueError as e:
+        return f"Error: {e}."
+    except pd.errors.ParserError as e:
+        return f"Error reading CSV files: {e}"
+    except Exception as e:
+        return f"Error: {e}"
+
+    if not slots:
+        return (f"No matching room has a free slot of {_hours(duration)} between {after.strftime(TIME_FORMAT)} "
+                f"and {(after + timedelta(days=horizon_days)).date()}.")
+    return (f"Earliest free slots of {_hours(duration)} from {after.strftime(TIME_FORMAT)}:\n\n"
+            f"{_slot_lines(slots, {room.room_id: room for room in rooms})}")
+
+
+def _book_room(room_id: int, customer_name: str, start_time: str, customer_id: str, duration: int = 1,
+               replaces: str = None) -> str:
+    """
+    Implementation of ``book_room``; also used by ``reschedule_booking``.
+
+    When ``replaces`` is given, the booking with that ID is swapped for the new one in a
+    single atomic store operation, and does not count as a conflict for the new slot.
     """
     if not customer_id or customer_id.strip() == "":
         return "Error: customer_id is required."
     
     # Check if room_id exists in meeting_rooms.csv
     try:
-        if not os.path.exists("data/meeting_rooms.csv"):
-            return "Error: Meeting rooms data not found."
-        
-        rooms_df = pd.read_csv("data/meeting_rooms.csv")
-        if 'room_id' not in rooms_df.columns:
-            return "Error: Invalid meeting rooms data format. Missing 'room_id' column."
-        
-        # Convert room_id to numeric to ensure proper comparison
-        rooms_df['room_id'] = pd.to_numeric(rooms_df['room_id'], errors='coerce')
-        
-        if room_id not in rooms_df['room_id'].values:
+        store = get_store()
+        if store.get_room(room_id) is None:
             return f"Room {room_id} does not exist."
     except Exception as e:
         return f"Error checking room existence: {str(e)}"
-        
-    try:
-        if not os.path.exists("data/bookings.csv"):
-            bookings_df = pd.DataFrame(columns=['booking_id', 'room_id', 'customer_name', 'customer_id', 'start_time', 'end_time'])
-        else:
-            bookings_df = pd.read_csv("data/bookings.csv", dtype={'customer_id': str, 'booking_id': str})
-            required_columns = ['booking_id', 'room_id', 'customer_name', 'customer_id', 'start_time', 'end_time']
-            for col in required_columns:
-                if col not in bookings_df.columns:
-                    bookings_df[col] = ""
-            
-            bookings_df = bookings_df.loc[:, ~bookings_df.columns.duplicated()]
-    except Exception as e:
-        return f"Error reading bookings file: {str(e)}"
     
     try:
-        start_dt = pd.to_datetime(start_time, format='%Y-%m-%d %H:%M')
+        start_dt = datetime.strptime(start_time, TIME_FORMAT)
     except ValueError:
         return "Error: Invalid start_time format. Use 'YYYY-MM-DD HH:MM'."
     
-    end_dt = start_dt + pd.Timedelta(hours=duration)
-    end_time_str = end_dt.strftime('%Y-%m-%d %H:%M')
+    end_dt = start_dt + timedelta(hours=duration)
+    end_time_str = end_dt.strftime(TIME_FORMAT)
     
     try:
-        conflict_check_df = bookings_df.copy()
-        
-        conflict_check_df['room_id'] = pd.to_numeric(conflict_check_df['room_id'], errors='coerce')
-        
-        conflict_check_df['start_time_dt'] = pd.to_datetime(conflict_check_df['start_time'], format='%Y-%m-%d %H:%M', errors='coerce')
-        conflict_check_df['end_time_dt'] = pd.to_datetime(conflict_check_df['end_time'], format='%Y-%m-%d %H:%M', errors='coerce')
-        
-        valid_bookings = conflict_check_df.dropna(subset=['start_time_dt', 'end_time_dt', 'room_id'])
-        
-        conflicting_bookings = valid_bookings[
-            (valid_bookings['room_id'] == room_id) &
-            (valid_bookings['start_time_dt'] < end_dt) &
-            (valid_bookings['end_time_dt'] > start_dt)
-        ]
+        # IDs come from the store's sequence and are never reused, so no retry is needed;
+        # the conflict check and the insert happen atomically under the room's lock
+        booking_id = store.allocate_booking_ids()[0]
+        booking = Booking(
+            booking_id=booking_id,
+            room_id=room_id,
+            customer_name=customer_name,
+            customer_id=customer_id,
+            start_time=start_time,
+            end_time=end_time_str,
+            start_dt=start_dt,
+            end_dt=end_dt,
+        )
+        if replaces is None:
+            booked = store.book(booking)
+        else:
+            booked = store.reschedule(replaces, booking)
+            if booked is None:
+                return f"No booking found with booking ID {replaces}."
         
-        if not conflicting_bookings.empty:
+        if not booked:
             return f"Room {room_id} is already booked during the requested time slot."
-    except Exception as e:
-        return f"Error checking for conflicts: {str(e)}"
-    
-    try:
-        # Generate a unique four-digit booking ID
-        import random
-        
-        # Get existing booking IDs to avoid duplicates
-        existing_ids = []
-        if not bookings_df.empty and 'booking_id' in bookings_df.columns:
-            existing_ids = bookings_df['booking_id'].astype(str).tolist()
-        
-        # Generate a unique four-digit ID
-        while True:
-            booking_id = str(random.randint(1000, 9999))
-            if booking_id not in existing_ids:
-                break
-        
-        new_booking = pd.DataFrame([{
-            'booking_id': booking_id,
-            'room_id': room_id,
-            'customer_name': customer_name,
-            'customer_id': customer_id,
-            'start_time': start_time,
-            'end_time': end_time_str
-            }])
-        
-        bookings_df = pd.concat([bookings_df, new_booking], ignore_index=True)
-        
-        bookings_df.to_csv("data/bookings.csv", index=False)
         
         return f"Successfully booked Room {room_id} for {customer_name} from {start_time} to {end_time_str} (duration: {duration} hour{'s' if duration != 1 else ''}). Booking ID: {booking_id}"
     except Exception as e:
         return f"Error saving booking: {str(e)}"
 
+@offload_async
+@tool
+def book_room(room_id: int, customer_name: str, start_time:str, customer_id: str, duration: int = 1) -> str:
+    """
+    Book a meeting room for a specific time slot and generate a unique booking ID.
+    
+    Args:
+        room_id: Room identifier (must exist in meeting_rooms.csv)
+        customer_name: Name of the customer booking the room
+        start_time: Starting time of the booking in format 'YYYY-MM-DD HH:MM'
+        customer_id: Customer identifier (required)
+        duration: Duration of booking in hours (default: 1)
+    
+    Returns:
+        str: Confirmation message with booking details and booking ID if successful,
+             or error message if room doesn't exist, is already booked, or any other error occurs
+    """
+    return _book_room(room_id, customer_name, start_time, customer_id, duration)
+
+
+@offload_async
 @tool
 def cancel_booking(booking_id: str) -> str:
     """
@@ -565,43 +640,17 @@ def cancel_booking(booking_id: str) -> str:
         str: Confirmation message with room and time details if successful,
              or error message if booking not found or an error occurs
     """
-    file_path = "data/bookings.csv"
-    
-    if not os.path.exists(file_path):
-        return "Error: No bookings found to cancel (bookings file does not exist)."
-    
     try:
-        bookings_df = pd.read_csv(file_path, dtype={'customer_id': str, 'booking_id': str}, keep_default_na=False)
-        
-        if 'booking_id' not in bookings_df.columns:
-            return "Error: Bookings file format is incorrect. Missing 'booking_id' column."
+        booking = get_store().remove_booking(booking_id)
     except Exception as e:
-        return f"Error reading bookings file: {str(e)}"
-    
-    matching_booking = bookings_df[bookings_df['booking_id'] == booking_id]
+        return f"Error saving bookings file after cancellation: {str(e)}"
     
-    if matching_booking.empty:
+    if booking is None:
         return f"No booking found with booking ID {booking_id}."
     
-    if 'room_id' in matching_booking.columns and 'start_time' in matching_booking.columns:
-        room_id = matching_booking['room_id'].iloc[0]
-        start_time = matching_booking['start_time'].iloc[0]
-        details_available = True
-    else:
-        details_available = False
-    
-    updated_bookings_df = bookings_df[bookings_df['booking_id'] != booking_id].copy()
-    
-    try:
-        updated_bookings_df.to_csv(file_path, index=False)
-    except Exception as e:
-        return f"Error saving bookings file after cancellation: {str(e)}"
-    
-    if details_available:
-        return f"Successfully canceled booking ID {booking_id} for Room {room_id} at {start_time}."
-    else:
-        return f"Successfully canceled booking ID {booking_id}."
+    return f"Successfully canceled booking ID {booking_id} for Room {booking.room_id} at {booking.start_time}."
 
+@offload_async
 @tool
 def reschedule_booking(room_id: int, customer_name: str, start_time: str, customer_id: str, 
                    booking_id: str, duration: int = 1) -> str:
@@ -620,37 +669,181 @@ def reschedule_booking(room_id: int, customer_name: str, start_time: str, custom
         str: Confirmation message with old and new booking details if successful,
              or error message if original booking not found, new time slot unavailable, or other errors occur
     """
-    file_path = "data/bookings.csv"
-    if not os.path.exists(file_path):
-        return "Error: No bookings found to reschedule (bookings file does not exist)."
-    
     try:
-        bookings_df = pd.read_csv(file_path, dtype={'customer_id': str, 'booking_id': str}, keep_default_na=False)
-        if 'booking_id' not in bookings_df.columns:
-            return "Error: Bookings file format is incorrect. Missing 'booking_id' column."
-            
-        if booking_id not in bookings_df['booking_id'].values:
-            return f"Error: No booking found with booking ID {booking_id}."
-            
+        store = get_store()
+        original = store.get_booking(booking_id)
     except Exception as e:
         return f"Error reading bookings file: {str(e)}"
     
-    cancel_result = cancel_booking(booking_id)
+    if original is None:
+        return f"Error: No booking found with booking ID {booking_id}."
     
-    if not cancel_result.startswith("Successfully"):
-        return f"Error rescheduling: {cancel_result}"
-    
-    
-    book_result = book_room(room_id, customer_name, start_time, customer_id, duration)
+    # The old booking is only removed if the new one can be made
+    book_result = _book_room(room_id, customer_name, start_time, customer_id, duration, replaces=booking_id)
     if "Successfully" not in book_result:
-        return f"Error creating new booking after cancellation: {book_result}"
+        return f"Error rescheduling: {book_result}"
     
-    import re
     new_booking_id_match = re.search(r"Booking ID: (\d+)", book_result)
     new_booking_id = new_booking_id_match.group(1) if new_booking_id_match else "Unknown"
     
     return f"Successfully rescheduled booking {booking_id} to new booking {new_booking_id}. {book_result}"
 
+def _conflict_lines(conflicts: List[SlotCheck]) -> str:
+    lines = []
+    for check in conflicts:
+        slot = f"- {check.start.strftime(TIME_FORMAT)} (Room {check.room_id})"
+        if check.alternatives:
+            nearest = ", ".join(f"{alt_start.strftime(TIME_FORMAT)} to {alt_end.strftime('%H:%M')}"
+                                for alt_start, alt_end in check.alternatives)
+            lines.append(f"{slot}: taken. Nearest free slots: {nearest}.")
+        else:
+            lines.append(f"{slot}: taken. No free slot of that length on {check.start.date()}.")
+    return "\n".join(lines)
+
+
+@offload_async
+@tool
+def book_recurring_room(room_id: int, customer_name: str, start_time: str, customer_id: str, frequency: str,
+                        count: Optional[int] = None, until: Optional[str] = None, duration: float = 1,
+                        interval: int = 1, skip_conflicts: bool = False) -> str:
+    """
+    Book a room for a recurring series of meetings (e.g. a weekly standup) in one operation.
+    
+    Args:
+        room_id: Room identifier (must exist in meeting_rooms.csv)
+        customer_name: Name of the customer booking the room
+        start_time: First occurrence in format 'YYYY-MM-DD HH:MM'
+        customer_id: Customer identifier (required)
+        frequency: 'daily', 'weekly' or 'monthly'. A monthly series keeps the day of the month and
+                   skips months that lack it: starting on the 31st it books only months with 31 days
+                   (e.g. Jan 31, Mar 31, May 31 for count=3); the reply lists the skipped months
+        count: Number of occurrences (give either count or until)
+        until: Last date an occurrence may fall on, in format 'YYYY-MM-DD'
+        duration: Duration of each occurrence in hours (default: 1)
+        interval: Repeat every N days/weeks/months (default: 1)
+        skip_conflicts: Book the free occurrences even if some are taken (default: False, book all or nothing)
+    
+    Returns:
+        str: Confirmation with the series ID and booking IDs, or the conflicting occurrences
+             with the nearest free slots for each, or an error message
+    """
+    if not customer_id or customer_id.strip() == "":
+        return "Error: customer_id is required."
+    try:
+        if get_store().get_room(room_id) is None:
+            return f"Room {room_id} does not exist."
+    except Exception as e:
+        return f"Error checking room existence: {str(e)}"
+    try:
+        start_dt = datetime.strptime(start_time, TIME_FORMAT)
+    except ValueError:
+        return "Error: Invalid start_time format. Use 'YYYY-MM-DD HH:MM'."
+    try:
+        until_date = datetime.strptime(until, '%Y-%m-%d').date() if until else None
+    except ValueError:
+        return "Error: Invalid until format. Use 'YYYY-MM-DD'."
+
+    try:
+        result = book_series(room_id, customer_name, customer_id, start_dt, duration, frequency,
+                             count=count, until=until_date, interval=interval, skip_conflicts=skip_conflicts)
+    except ValueError as e:
+        return f"Error: {e}."
+    except Exception as e:
+        return f"Error saving bookings: {str(e)}"
+
+    if not result.booked:
+        if skip_conflicts or len(result.conflicts) == result.occurrences:
+            return (f"Could not book the series: none of the {result.occurrences} occurrences of Room {room_id} "
+                    f"are free, so nothing was booked.\n{_conflict_lines(result.conflicts)}\n"
+                    f"Choose another time or room.")
+        return (f"Could not book the series: {len(result.conflicts)} of {result.occurrences} occurrences of "
+                f"Room {room_id} are already booked, so nothing was booked.\n{_conflict_lines(result.conflicts)}\n"
+                f"Choose another time or room, or book with skip_conflicts=True to book the free occurrences only.")
+
+    first, last = result.booked[0], result.booked[-1]
+    output = (f"Successfully booked a {frequency.strip().lower()} series of {len(result.booked)} "
+              f"occurrence{'s' if len(result.booked) != 1 else ''} of Room {room_id} for {customer_name} "
+              f"({first.start_dt.strftime('%H:%M')} to {first.end_dt.strftime('%H:%M')}, "
+              f"{first.start_dt.date()} to {last.start_dt.date()}). Series ID: {result.series_id}. "
+              f"Booking IDs: {', '.join(booking.booking_id for booking in result.booked)}")
+    if result.skipped_months:
+        months = result.skipped_months
+        output += (f"\nNo occurrence in {', '.join(month.strftime('%B %Y') for month in months)} "
+                   f"(no day {first.start_dt.day} in {'that month' if len(months) == 1 else 'those months'}).")
+    if result.conflicts:
+        output += (f"\nSkipped {len(result.conflicts)} taken occurrence{'s' if len(result.conflicts) != 1 else ''}:\n"
+                   f"{_conflict_lines(result.conflicts)}")
+    return output
+
+
+@offload_async
+@tool
+def cancel_series(series_id: str) -> str:
+    """
+    Cancel all upcoming occurrences of a recurring booking series in one operation.
+    
+    Args:
+        series_id: The series identifier (starts with 'S')
+    
+    Returns:
+        str: Confirmation with the number of canceled occurrences, or an error message
+    """
+    try:
+        removed = get_store().cancel_series(series_id, after=datetime.now())
+    except Exception as e:
+        return f"Error saving bookings file after cancellation: {str(e)}"
+
+    if not removed:
+        return f"No upcoming bookings found for series ID {series_id}."
+    return (f"Successfully canceled {len(removed)} upcoming occurrence{'s' if len(removed) != 1 else ''} of "
+            f"series {series_id} (Room {removed[0].room_id}, {removed[0].start_time} to {removed[-1].start_time}).")
+
+
+@offload_async
+@tool
+def reschedule_series(series_id: str, new_start_time: str, room_id: Optional[int] = None,
+                      duration: Optional[float] = None) -> str:
+    """
+    Move all upcoming occurrences of a recurring booking series in one operation.
+    
+    Args:
+        series_id: The series identifier (starts with 'S')
+        new_start_time: New start of the next occurrence in format 'YYYY-MM-DD HH:MM'; every later
+                        occurrence moves by the same amount
+        room_id: New room for all occurrences (default: keep the room)
+        duration: New duration in hours (default: keep the duration)
+    
+    Returns:
+        str: Confirmation with the moved occurrences, or the conflicting occurrences with the
+             nearest free slots for each, or an error message
+    """
+    try:
+        new_start = datetime.strptime(new_start_time, TIME_FORMAT)
+    except ValueError:
+        return "Error: Invalid new_start_time format. Use 'YYYY-MM-DD HH:MM'."
+    if duration is not None and duration <= 0:
+        return "Error: Duration must be positive."
+    try:
+        if room_id is not None and get_store().get_room(room_id) is None:
+            return f"Room {room_id} does not exist."
+        result = move_series(series_id, new_start, room_id=room_id, duration=duration)
+    except Exception as e:
+        return f"Error rescheduling series: {str(e)}"
+
+    if result is None:
+        return f"Error: No upcoming bookings found for series ID {series_id}."
+    if not result.booked:
+        return (f"Could not reschedule series {series_id}: {len(result.conflicts)} of {result.occurrences} moved "
+                f"occurrences would conflict with existing bookings, so nothing was changed.\n"
+                f"{_conflict_lines(result.conflicts)}")
+    first, last = result.booked[0], result.booked[-1]
+    return (f"Successfully rescheduled {len(result.booked)} occurrence{'s' if len(result.booked) != 1 else ''} "
+            f"of series {series_id} to Room {first.room_id}, {first.start_dt.strftime('%H:%M')} to "
+            f"{first.end_dt.strftime('%H:%M')}, {first.start_dt.date()} to {last.start_dt.date()}. "
+            f"Booking IDs are unchanged.")
+
+
+@offload_async
 @tool
 def get_user_bookings(customer_id: str) -> str:
     """
@@ -663,46 +856,27 @@ def get_user_bookings(customer_id: str) -> str:
         str: Formatted string with all booking information for the user, including booking ID, room ID,
              customer name, and booking times, or error message if no bookings found or an error occurs
     """
-    file_path = "data/bookings.csv"
-    
-    if not os.path.exists(file_path):
-        return "Error: No bookings found (bookings file does not exist)."
-    
     try:
-        bookings_df = pd.read_csv(file_path, dtype={'customer_id': str, 'booking_id': str}, 
-                                 keep_default_na=False)
-        
-        required_columns = ['booking_id', 'room_id', 'customer_name', 'customer_id', 'start_time']
-        if not all(col in bookings_df.columns for col in required_columns):
-            return "Error: Bookings file format is incorrect or missing required columns."
-            
+        user_bookings = get_store().customer_bookings(customer_id)
     except Exception as e:
         return f"Error reading bookings file: {str(e)}"
     
-    user_bookings = bookings_df[bookings_df['customer_id'] == customer_id].copy()
-    
-    if user_bookings.empty:
+    if not user_bookings:
         return f"No bookings found for user ID {customer_id}."
     
-    try:
-        user_bookings['start_time_dt'] = pd.to_datetime(user_bookings['start_time'], 
-                                                      format='%Y-%m-%d %H:%M', errors='coerce')
-        
-        user_bookings = user_bookings.dropna(subset=['start_time_dt'])
-        
-        user_bookings = user_bookings.sort_values(by='start_time_dt', ascending=False)
-        
-        bookings_count = len(user_bookings)
-        output = f"Found {bookings_count} booking{'s' if bookings_count > 1 else ''} for user ID {customer_id}:\n\n"
-        
-        for index, booking in user_bookings.iterrows():
-            output += f"booking_id: {booking['booking_id']}\n"
-            output += f"room_id: {booking['room_id']}\n"
-            output += f"customer_name: {booking['customer_name']}\n"
-            output += f"start_time: {booking['start_time']}\n"
-            output += f"end_time: {booking['end_time']}\n"
-                        
-        return output
-        
-    except Exception as e:
-        return f"Error processing bookings: {str(e)}" 
\ No newline at end of file
+    user_bookings = sorted((booking for booking in user_bookings if booking.start_dt is not None),
+                           key=lambda booking: booking.start_dt, reverse=True)
+    
+    bookings_count = len(user_bookings)
+    output = f"Found {bookings_count} booking{'s' if bookings_count > 1 else ''} for user ID {customer_id}:\n\n"
+    
+    for booking in user_bookings:
+        output += f"booking_id: {booking.booking_id}\n"
+        output += f"room_id: {booking.room_id}\n"
+        output += f"customer_name: {booking.customer_name}\n"
+        output += f"start_time: {booking.start_time}\n"
+        output += f"end_time: {booking.end_time}\n"
+        if booking.series_id:
+            output += f"series_id: {booking.series_id}\n"
+                    
+    return output
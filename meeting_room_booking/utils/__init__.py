@@ -3,6 +3,6 @@ Utilities module for the Meeting Room Booking System.
 Contains helper functions and classes.
 """
 
-from meeting_room_booking.utils.llm import llm
+from meeting_room_booking.utils.llm import create_llm, llm
 
-__all__ = ['llm']
+__all__ = ['create_llm', 'llm']
@@ -0,0 +1,301 @@
+"""
+Offline chat models for the Meeting Room Booking System.
+
+Both models stand in for the live LLM so the whole supervisor -> sub-agent -> tool loop runs
+without network access, deterministically:
+
+- ``ScriptedChatModel`` follows scripted routing: it answers ``with_structured_output(Router)``
+  with a routing decision and the sub-agents with tool calls built from the user's request
+  (dates, times, room and booking IDs, features), then summarizes the tool result
+- ``ReplayChatModel`` returns recorded responses in order; ``ResponseRecorder`` records them
+  from any model (for example a live run) into a JSON file
+
+Select one for the web app with ``LLM_PROVIDER=scripted`` or ``LLM_PROVIDER=replay``
+(see ``utils.llm``), or pass it as ``RoomAppointmentAgents(model=...)``.
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import (AIMessage, BaseMessage, HumanMessage, ToolMessage,
+                                     message_to_dict, messages_from_dict)
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import Field
+
+IDENTITY_PATTERN = re.compile(r"my identification number is (\S+) and my name is ([^.\n]+)")
+DATE_TIME_PATTERN = re.compile(r"\b(\d{4}-\d{2}-\d{2})(?:\s+(?:at\s+)?(\d{1,2}:\d{2}))?")
+DURATION_PATTERN = re.compile(r"\bfor\s+(\d+(?:\.\d+)?)\s*h(?:ours?|rs?)?\b", re.IGNORECASE)
+ROOM_PATTERN = re.compile(r"\broom\s*(?:id)?\s*[:#]?\s*(\d+)\b", re.IGNORECASE)
+BOOKING_ID_PATTERN = re.compile(r"\bbooking(?:[ _]id)?\s*[:#]?\s*(?:id\s*)?(\d{4,})\b", re.IGNORECASE)
+FEATURES = ('projector', 'whiteboard', 'internet')
+
+# Intents in the order they are tested: the first match wins
+INTENTS = [
+    ('cancel', re.compile(r"\b(?:cancel|delete|remove)\b", re.IGNORECASE)),
+    ('reschedule', re.compile(r"\b(?:reschedule|move|postpone)\b", re.IGNORECASE)),
+    ('my_bookings', re.compile(r"\b(?:my|our)\s+(?:\w+\s+)?(?:bookings?|reservations?|meetings?)\b", re.IGNORECASE)),
+    ('book', re.compile(r"\b(?:book|reserve)\b", re.IGNORECASE)),
+    ('availability', re.compile(r"\b(?:available|availability|free|any rooms?)\b", re.IGNORECASE)),
+]
+
+def _answer_node(name: str) -> str:
+    """Node that produced a sub-agent answer, from the message name (agent or tool name)."""
+    # Imported on use: importing the agents package builds its default model, which may be one of these
+    from meeting_room_booking.agents.router import AGENT_NAMES
+    return AGENT_NAMES.get(name, '')
+
+
+def _role(tool_name: str) -> str:
+    """Role of a bound model ('information', 'booking' or 'user_info'), from the first tool it was given."""
+    node = _answer_node(tool_name)
+    return node[:-len('_node')] if node else 'chat'
+
+
+def _text(message: BaseMessage) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+
+
+def classify(query: str) -> str:
+    """Intent of a user request: cancel, reschedule, my_bookings, book, availability or unknown."""
+    for intent, pattern in INTENTS:
+        if pattern.search(query):
+            return intent
+    return 'unknown'
+
+
+def _latest_query(messages: Sequence[BaseMessage]) -> int:
+    """Index of the latest user request (identity and summary messages are not requests)."""
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if isinstance(message, HumanMessage) and not IDENTITY_PATTERN.match(_text(message)):
+            return index
+    return -1
+
+
+def _identity(messages: Sequence[BaseMessage]):
+    for message in messages:
+        match = IDENTITY_PATTERN.search(_text(message)) if isinstance(message, HumanMessage) else None
+        if match:
+            return match.group(1), match.group(2).strip()
+    return '', ''
+
+
+def _latest_booking_id(messages: Sequence[BaseMessage]) -> Optional[str]:
+    """Booking ID in the request, else the last one mentioned in the conversation."""
+    for message in reversed(messages):
+        text = _text(message)
+        found = BOOKING_ID_PATTERN.findall(text)
+        if found:
+            # Booking listings put the newest booking first; elsewhere the last ID is the newest
+            return found[0] if "booking_id: " in text else found[-1]
+    return None
+
+
+def _request_details(query: str) -> Dict[str, Any]:
+    details: Dict[str, Any] = {}
+    when = DATE_TIME_PATTERN.search(query)
+    if when:
+        details['start'] = f"{when.group(1)} {when.group(2).zfill(5)}" if when.group(2) else when.group(1)
+    duration = DURATION_PATTERN.search(query)
+    details['duration'] = float(duration.group(1)) if duration else 1.0
+    room = ROOM_PATTERN.search(query)
+    if room:
+        details['room_id'] = int(room.group(1))
+    details['features'] = [feature for feature in FEATURES if feature in query.lower()]
+    return details
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    Deterministic stand-in for the LLM that follows a fixed routing script.
+
+    ``bind_tools`` returns a copy that knows which tools it was given, which tells it whether
+    it is the supervisor (``Router``) or one of the sub-agents. All copies share the call
+    counters in ``calls`` (per role: supervisor, information, booking, user_info).
+    ``latency`` adds a fixed delay per call to stand in for a remote model.
+    """
+
+    latency: float = 0.0
+    calls: Dict[str, int] = Field(default_factory=dict)
+    tool_names: List[str] = Field(default_factory=list)
+    counter: Dict[str, int] = Field(default_factory=lambda: {'next_id': 0})
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        names = [convert_to_openai_tool(tool)['function']['name'] for tool in tools]
+        return self.model_copy(update={'tool_names': names})
+
+    # ------------------------------------------------------------------
+    # Supervisor
+    # ------------------------------------------------------------------
+    def _route(self, messages: Sequence[BaseMessage]) -> Dict[str, Any]:
+        latest = _latest_query(messages)
+        query = _text(messages[latest]) if latest >= 0 else ''
+        intent = classify(query)
+        answers = [m for m in messages[latest + 1:] if isinstance(m, AIMessage) and m.name != 'supervisor']
+
+        def decide(node: str, reasoning: str, reply: Optional[str] = None) -> Dict[str, Any]:
+            return {'next': node, 'reasoning': reasoning, 'supervisor_response_content': reply}
+
+        if not answers:
+            if intent in ('availability', 'book'):
+                return decide('information_node', f"{intent}: check availability first")
+            if intent == 'my_bookings':
+                return decide('user_info_node', "list the user's bookings")
+            if intent == 'cancel':
+                if BOOKING_ID_PATTERN.search(query):
+                    return decide('booking_node', "cancel the given booking")
+                return decide('user_info_node', "find the booking to cancel")
+            if intent == 'reschedule':
+                if BOOKING_ID_PATTERN.search(query):
+                    return decide('information_node', "check the new slot")
+                return decide('user_info_node', "find the booking to reschedule")
+            return decide('FINISH', "unclear request",
+                          "Could you tell me whether you want to check availability, book, cancel or "
+                          "reschedule a room, or see your bookings?")
+
+        answer = answers[-1]
+        text = _text(answer)
+        node = _answer_node(answer.name or '')
+        if node == 'information_node' and intent in ('book', 'reschedule') and ' is available ' in text:
+            return decide('booking_node', f"slot confirmed, {intent}")
+        if node == 'user_info_node' and intent == 'cancel' and BOOKING_ID_PATTERN.search(text):
+            return decide('booking_node', "booking identified, cancel it")
+        if node == 'user_info_node' and intent == 'reschedule' and BOOKING_ID_PATTERN.search(text):
+            return decide('information_node', "booking identified, check the new slot")
+        return decide('FINISH', "answered", text)
+
+    # ------------------------------------------------------------------
+    # Sub-agents
+    # ------------------------------------------------------------------
+    def _tool_call(self, messages: Sequence[BaseMessage]) -> Optional[Dict[str, Any]]:
+        latest = _latest_query(messages)
+        query = _text(messages[latest]) if latest >= 0 else ''
+        intent = classify(query)
+        details = _request_details(query)
+        customer_id, customer_name = _identity(messages)
+        tools = set(self.tool_names)
+
+        if 'get_user_bookings' in tools:
+            return {'name': 'get_user_bookings', 'args': {'customer_id': customer_id}}
+        if 'check_specific_room' in tools:
+            if 'start' not in details:
+                return None
+            if 'room_id' in details:
+                return {'name': 'check_specific_room', 'args': {'start': details['start'], 'room_id': details['room_id'],
+                                                                 'duration': details['duration']}}
+            return {'name': 'check_availability_features',
+                    'args': {'start': details['start'], 'features': details['features'],
+                             'duration': details['duration']}}
+        if 'cancel_booking' in tools and intent == 'cancel':
+            booking_id = _latest_booking_id(messages[latest:])
+            return {'name': 'cancel_booking', 'args': {'booking_id': booking_id}} if booking_id else None
+        if 'book_room' in tools and 'start' in details and 'room_id' in details:
+            args = {'room_id': details['room_id'], 'customer_name': customer_name, 'start_time': details['start'],
+                    'customer_id': customer_id, 'duration': max(1, int(details['duration']))}
+            if intent == 'reschedule':
+                booking_id = _latest_booking_id(messages[latest:])
+                return {'name': 'reschedule_booking', 'args': {**args, 'booking_id': booking_id}} if booking_id else None
+            return {'name': 'book_room', 'args': args}
+        return None
+
+    def _reply(self, messages: Sequence[BaseMessage]) -> AIMessage:
+        if 'Router' in self.tool_names:
+            role = 'supervisor'
+            message = AIMessage(content='', tool_calls=[{'name': 'Router', 'args': self._route(messages),
+                                                         'id': self._next_id()}])
+        else:
+            role = _role(self.tool_names[0]) if self.tool_names else 'chat'
+            if messages and isinstance(messages[-1], ToolMessage):
+                # Hand the tool result back as the agent's answer
+                message = AIMessage(content=_text(messages[-1]))
+            else:
+                call = self._tool_call(messages)
+                message = (AIMessage(content='', tool_calls=[{**call, 'id': self._next_id()}]) if call else
+                           AIMessage(content="I need more details (date, time, room or booking ID) to help with that."))
+        self.calls[role] = self.calls.get(role, 0) + 1
+        input_tokens = count_tokens_approximately(messages)
+        output_tokens = count_tokens_approximately([message])
+        message.usage_metadata = {'input_tokens': input_tokens, 'output_tokens': output_tokens,
+                                  'total_tokens': input_tokens + output_tokens}
+        return message
+
+    def _next_id(self) -> str:
+        self.counter['next_id'] += 1
+        return f"call_{self.counter['next_id']}"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+
+class ReplayChatModel(BaseChatModel):
+    """
+    Returns recorded responses one after another, whatever the prompt.
+
+    Replaying a conversation corpus in the same order it was recorded reproduces the run
+    exactly; running out of responses raises ``ValueError``.
+    """
+
+    responses: List[dict] = Field(default_factory=list)
+    cursor: Dict[str, int] = Field(default_factory=lambda: {'next': 0})
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    @classmethod
+    def from_file(cls, path: str) -> "ReplayChatModel":
+        with open(path) as f:
+            return cls(responses=json.load(f))
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        index = self.cursor['next']
+        if index >= len(self.responses):
+            raise ValueError(f"Replay exhausted after {len(self.responses)} responses")
+        self.cursor['next'] = index + 1
+        message = messages_from_dict([self.responses[index]])[0]
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class ResponseRecorder(BaseCallbackHandler):
+    """Callback handler that records every chat model response, for ``ReplayChatModel``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses: List[dict] = []
+
+    def on_llm_end(self, response, **kwargs: Any):
+        with self._lock:
+            for generations in response.generations:
+                for generation in generations:
+                    message = getattr(generation, 'message', None)
+                    if message is not None:
+                        self.responses.append(message_to_dict(message))
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.responses, f, indent=1)
@@ -0,0 +1,235 @@
+"""
+Latency, token and tool-call metrics for the Meeting Room Booking System.
+
+``MetricsCallbackHandler`` is attached to the compiled supervisor graph and records a span
+for every graph node, model call and tool call of a request: wall time histograms per
+node and tool, prompt/completion token counters per node and the number of graph hops per
+request. Spans are also logged at DEBUG level. ``render()`` exposes everything in the
+Prometheus text format for the ``/metrics`` route; p50/p99 per node come from the
+histogram buckets (``histogram_quantile`` in Prometheus).
+"""
+
+import bisect
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+HOP_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10, 15, 25)
+
+
+def _label_text(labelnames: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_label_text(self.labelnames, key)} {value:g}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # Per label set: [count per bucket (last one is +Inf), sum]
+        self._values: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.setdefault(key, [[0] * (len(self.buckets) + 1), 0.0])
+            counts[0][index] += 1
+            counts[1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = 'le="+Inf"' if bound == float("inf") else f'le="{bound:g}"'
+                    lines.append(f"{self.name}_bucket{_label_text(self.labelnames, key, le)} {cumulative}")
+                lines.append(f"{self.name}_sum{_label_text(self.labelnames, key)} {total:g}")
+                lines.append(f"{self.name}_count{_label_text(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+NODE_SECONDS = Histogram("booking_node_duration_seconds", "Wall time of a supervisor graph node", ("node",))
+LLM_SECONDS = Histogram("booking_llm_duration_seconds", "Wall time of a model call", ("node",))
+LLM_TOKENS = Counter("booking_llm_tokens_total", "Model tokens by graph node", ("node", "kind"))
+TOOL_SECONDS = Histogram("booking_tool_duration_seconds", "Wall time of a tool call", ("tool",))
+TOOL_CALLS = Counter("booking_tool_calls_total", "Tool calls by outcome", ("tool", "status"))
+REQUEST_SECONDS = Histogram("booking_request_duration_seconds", "Wall time of a workflow run")
+REQUEST_HOPS = Histogram("booking_request_hops", "Graph nodes executed per workflow run", buckets=HOP_BUCKETS)
+REQUEST_ERRORS = Counter("booking_request_errors_total", "Workflow runs that raised")
+
+METRICS = [NODE_SECONDS, LLM_SECONDS, LLM_TOKENS, TOOL_SECONDS, TOOL_CALLS,
+           REQUEST_SECONDS, REQUEST_HOPS, REQUEST_ERRORS]
+
+
+def render(extra: Iterable = ()) -> str:
+    """All metrics (and ``extra`` ones) in the Prometheus text exposition format."""
+    lines: List[str] = []
+    for metric in list(METRICS) + list(extra):
+        lines += metric.render()
+    return "\n".join(lines) + "\n"
+
+
+def _node_of(metadata: Optional[dict]) -> str:
+    """Top-level graph node a run belongs to (sub-agent internals report their parent node)."""
+    metadata = metadata or {}
+    return metadata.get("langgraph_checkpoint_ns", "").split(":")[0] or metadata.get("langgraph_node", "")
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """
+    Callback handler turning graph, model and tool runs into spans.
+
+    A run without a parent is a workflow request; its direct children are the graph
+    nodes (hops). Model and tool runs are attributed to the node they ran in.
+    """
+
+    # Only dictionary updates; cheap enough to run on the event loop
+    run_inline = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # run_id -> (kind, name, started, root run_id)
+        self._spans: Dict[UUID, Tuple[str, str, float, Optional[UUID]]] = {}
+        self._hops: Dict[UUID, int] = {}
+
+    def _start(self, run_id: UUID, kind: str, name: str, root: Optional[UUID] = None):
+        with self._lock:
+            self._spans[run_id] = (kind, name, time.perf_counter(), root)
+
+    def _end(self, run_id: UUID) -> Optional[Tuple[str, str, float, Optional[UUID]]]:
+        with self._lock:
+            span = self._spans.pop(run_id, None)
+        if span is None:
+            return None
+        kind, name, started, root = span
+        elapsed = time.perf_counter() - started
+        logger.debug("span kind=%s name=%s duration_ms=%.1f", kind, name, elapsed * 1000)
+        return kind, name, elapsed, root
+
+    # ------------------------------------------------------------------
+    # Graph runs and nodes
+    # ------------------------------------------------------------------
+    def on_chain_start(self, serialized, inputs, *, run_id: UUID, parent_run_id: Optional[UUID] = None,
+                       metadata: Optional[dict] = None, **kwargs: Any):
+        if parent_run_id is None:
+            with self._lock:
+                self._hops[run_id] = 0
+            self._start(run_id, "request", kwargs.get("name") or "workflow")
+        elif parent_run_id in self._hops:
+            with self._lock:
+                self._hops[parent_run_id] += 1
+            self._start(run_id, "node", kwargs.get("name") or _node_of(metadata), parent_run_id)
+
+    def _chain_end(self, run_id: UUID, error: bool):
+        span = self._end(run_id)
+        if span is None:
+            return
+        kind, name, elapsed, _ = span
+        if kind == "node":
+            NODE_SECONDS.observe(elapsed, node=name)
+            return
+        with self._lock:
+            hops = self._hops.pop(run_id, 0)
+        REQUEST_SECONDS.observe(elapsed)
+        REQUEST_HOPS.observe(hops)
+        if error:
+            REQUEST_ERRORS.inc()
+
+    def on_chain_end(self, outputs, *, run_id: UUID, **kwargs: Any):
+        self._chain_end(run_id, error=False)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._chain_end(run_id, error=True)
+
+    # ------------------------------------------------------------------
+    # Model calls
+    # ------------------------------------------------------------------
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, metadata: Optional[dict] = None,
+                            **kwargs: Any):
+        self._start(run_id, "llm", _node_of(metadata))
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, metadata: Optional[dict] = None, **kwargs: Any):
+        self._start(run_id, "llm", _node_of(metadata))
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs: Any):
+        span = self._end(run_id)
+        if span is None:
+            return
+        _, node, elapsed, _ = span
+        LLM_SECONDS.observe(elapsed, node=node)
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    LLM_TOKENS.inc(usage.get("input_tokens", 0), node=node, kind="prompt")
+                    LLM_TOKENS.inc(usage.get("output_tokens", 0), node=node, kind="completion")
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        span = self._end(run_id)
+        if span is not None:
+            LLM_SECONDS.observe(span[2], node=span[1])
+
+    # ------------------------------------------------------------------
+    # Tool calls
+    # ------------------------------------------------------------------
+    def on_tool_start(self, serialized, input_str, *, run_id: UUID, **kwargs: Any):
+        self._start(run_id, "tool", (serialized or {}).get("name") or kwargs.get("name") or "tool")
+
+    def _tool_end(self, run_id: UUID, status: str):
+        span = self._end(run_id)
+        if span is not None:
+            TOOL_SECONDS.observe(span[2], tool=span[1])
+            TOOL_CALLS.inc(tool=span[1], status=status)
+
+    def on_tool_end(self, output, *, run_id: UUID, **kwargs: Any):
+        # The tools report failures as text rather than raising
+        content = getattr(output, "content", output)
+        failed = isinstance(content, str) and content.startswith("Error")
+        self._tool_end(run_id, "error" if failed else "ok")
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._tool_end(run_id, "error")
+
+
+metrics_handler = MetricsCallbackHandler()
@@ -0,0 +1,207 @@
+"""
+Opt-in per-request profiling for the Meeting Room Booking System.
+
+``RequestProfiler`` wraps a single request's workflow run and writes its profile to
+PROFILE_DIR, named after the request ID:
+
+- ``cprofile``: deterministic cProfile stats (``<id>.prof``; open with ``python -m pstats``
+  or snakeviz), exact call counts but a few times slower while it runs
+- ``sampling``: a thread that samples the request thread's stack every PROFILE_INTERVAL_MS
+  and writes collapsed stacks (``<id>.folded``) for flamegraph.pl or speedscope, cheap
+  enough to leave on
+
+A request is profiled when a random draw falls under PROFILE_SAMPLE_RATE (percent of
+requests, default 0), or when PROFILE_ALLOW_HEADER is set and the client sends an
+``X-Profile`` header (``1``, ``cprofile`` or ``sampling``). Both profilers follow the thread
+that runs the request; work handed to other threads (e.g. the tool pool) shows up as waiting.
+Only one cProfile run can be active in a process (Python 3.12+ refuses a second one), so a
+request picked for cProfile while another is being profiled that way is sampled instead.
+A repeated request ID gets a numbered file rather than overwriting the earlier profile.
+"""
+
+import cProfile
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR_ENV = "PROFILE_DIR"
+PROFILE_RATE_ENV = "PROFILE_SAMPLE_RATE"
+PROFILE_FORMAT_ENV = "PROFILE_FORMAT"
+PROFILE_INTERVAL_ENV = "PROFILE_INTERVAL_MS"
+PROFILE_HEADER_ENV = "PROFILE_ALLOW_HEADER"
+PROFILE_HEADER = "X-Profile"
+REQUEST_ID_HEADER = "X-Request-ID"
+FORMATS = ('cprofile', 'sampling')
+DEFAULT_PROFILE_DIR = "profiles"
+DEFAULT_INTERVAL_MS = 5.0
+
+_REQUEST_ID_RE = re.compile(r"[^A-Za-z0-9_.-]")
+# Held while a cProfile run is active; the profiler hooks are process-wide
+_CPROFILE_LOCK = threading.Lock()
+
+
+def request_id(header_value: Optional[str] = None) -> str:
+    """The client's request ID made safe for a file name, or a new one."""
+    cleaned = _REQUEST_ID_RE.sub('', header_value or '')[:64]
+    return cleaned or uuid.uuid4().hex
+
+
+class StackSampler:
+    """Samples one thread's stack at a fixed interval and counts collapsed stacks."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path: str):
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class RequestProfiler:
+    """Decides which requests to profile and writes one profile per profiled request."""
+
+    def __init__(self, directory: str = DEFAULT_PROFILE_DIR, sample_rate: float = 0.0, fmt: str = 'cprofile',
+                 interval_ms: float = DEFAULT_INTERVAL_MS, allow_header: bool = False):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown profile format {fmt!r}; expected one of {', '.join(FORMATS)}")
+        self.directory = directory
+        self.sample_rate = max(0.0, min(100.0, sample_rate))
+        self.format = fmt
+        self.interval = interval_ms / 1000
+        self.allow_header = allow_header
+        self._lock = threading.Lock()
+        self._profiled = 0
+        self._seconds = 0.0
+        self._fallbacks = 0
+
+    @classmethod
+    def from_env(cls) -> "RequestProfiler":
+        """Profiler configured by the PROFILE_* environment variables."""
+        return cls(directory=os.environ.get(PROFILE_DIR_ENV, DEFAULT_PROFILE_DIR),
+                   sample_rate=float(os.environ.get(PROFILE_RATE_ENV, 0)),
+                   fmt=os.environ.get(PROFILE_FORMAT_ENV, 'cprofile').lower(),
+                   interval_ms=float(os.environ.get(PROFILE_INTERVAL_ENV, DEFAULT_INTERVAL_MS)),
+                   allow_header=os.environ.get(PROFILE_HEADER_ENV, '').lower() in ('1', 'true', 'yes'))
+
+    def choose(self, header_value: Optional[str] = None) -> Optional[str]:
+        """The profile format for a request, or None to run it unprofiled."""
+        header_value = (header_value or '').strip().lower()
+        if self.allow_header and header_value and header_value not in ('0', 'false', 'no'):
+            return header_value if header_value in FORMATS else self.format
+        if self.sample_rate and random.random() * 100 < self.sample_rate:
+            return self.format
+        return None
+
+    def _reserve(self, request_id: str, extension: str) -> str:
+        """Create an empty file for the profile, numbering it if the request ID was used before."""
+        os.makedirs(self.directory, exist_ok=True)
+        base, number = os.path.join(self.directory, request_id), 0
+        while True:
+            path = f"{base}-{number}.{extension}" if number else f"{base}.{extension}"
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+                return path
+            except FileExistsError:
+                number += 1
+
+    def _start_cprofile(self) -> Optional[cProfile.Profile]:
+        """A running cProfile profiler, or None if another profiler is already active."""
+        if not _CPROFILE_LOCK.acquire(blocking=False):
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiling tool (e.g. a debugger or coverage) owns the hooks
+            _CPROFILE_LOCK.release()
+            return None
+        return profiler
+
+    @contextmanager
+    def profile(self, request_id: str, fmt: Optional[str]) -> Iterator[Optional[str]]:
+        """
+        Profile the enclosed code in the current thread if ``fmt`` is set; yields the path
+        the profile will be written to (None when not profiling).
+        """
+        if fmt is None:
+            yield None
+            return
+        started = time.perf_counter()
+        profiler = sampler = None
+        if fmt == 'cprofile':
+            profiler = self._start_cprofile()
+            if profiler is None:
+                fmt = 'sampling'
+                with self._lock:
+                    self._fallbacks += 1
+        try:
+            path = self._reserve(request_id, 'prof' if fmt == 'cprofile' else 'folded')
+        except BaseException:
+            if profiler is not None:
+                profiler.disable()
+                _CPROFILE_LOCK.release()
+            raise
+        if profiler is None:
+            sampler = StackSampler(threading.get_ident(), self.interval)
+            sampler.start()
+        try:
+            yield path
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                _CPROFILE_LOCK.release()
+                profiler.dump_stats(path)
+            else:
+                sampler.stop()
+                sampler.write(path)
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._profiled += 1
+                self._seconds += elapsed
+            logger.info("profiled request %s (%s, %.1f ms) -> %s", request_id, fmt, elapsed * 1000, path)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                'profiled_requests': self._profiled,
+                'profiled_seconds': round(self._seconds, 3),
+                # cProfile requests sampled instead because another cProfile run was active
+                'cprofile_fallbacks': self._fallbacks,
+                'sample_rate_percent': self.sample_rate,
+                'format': self.format,
+                'directory': self.directory,
+                'allow_header': self.allow_header,
+            }
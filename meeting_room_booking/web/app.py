@@ -2,12 +2,14 @@
 Flask web application for the Meeting Room Booking System.
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 from langchain_core.messages import HumanMessage
 import os
 
-# Import the agents module
-from meeting_room_booking.agents import RoomAppointmentAgents
+from meeting_room_booking.tools.cache import availability_cache
+from meeting_room_booking.utils import metrics, profiling
+from meeting_room_booking.web import runtime
+from meeting_room_booking.web.streaming import sse, workflow_events
 
 app = Flask(__name__)
 
@@ -15,6 +17,33 @@ app = Flask(__name__)
 def index():
     return render_template('index.html')
 
+@app.route('/router/stats')
+def router_stats():
+    # Fast-path routing counters: each hit is a supervisor LLM call that was skipped
+    return jsonify(runtime.agents.router.stats() if runtime.agents.router else {})
+
+@app.route('/cache/stats')
+def cache_stats():
+    return jsonify(availability_cache.stats())
+
+@app.route('/sessions/stats')
+def sessions_stats():
+    return jsonify(runtime.session_stats())
+
+@app.route('/history/stats')
+def history_stats():
+    # Prompt tokens saved by history compaction, over all requests
+    return jsonify(runtime.agents.compactor.stats())
+
+@app.route('/profiling/stats')
+def profiling_stats():
+    return jsonify(runtime.profiler.stats())
+
+@app.route('/metrics')
+def metrics_endpoint():
+    # Prometheus text format: per-node, model and tool latency histograms, token and tool counters
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/process', methods=['POST'])
 def process():
     # Get form data
@@ -26,28 +55,62 @@ def process():
         return jsonify({'error': 'Missing required fields'}), 400
     
     try:
-        # Create agents and workflow
-        agents = RoomAppointmentAgents()
-        workflow = agents.workflow()
-        
-        # Create input and state
+        # Create input and state; earlier turns of the session are restored by the checkpointer
         inputs = [HumanMessage(content=prompt)]
         state = {
             'messages': inputs,
             'customer_name': customer_name,
-            'customer_id': customer_id
+            'customer_id': customer_id,
+            'tokens_saved': 0
         }
+        session_id, config = runtime.session_config(request.form.get('session_id'), customer_id)
+        request_id = profiling.request_id(request.headers.get(profiling.REQUEST_ID_HEADER))
+        profile_format = runtime.profiler.choose(request.headers.get(profiling.PROFILE_HEADER))
         
-        # Invoke workflow
-        result = workflow.invoke(state)
+        # Invoke workflow, under the profiler if this request was picked for profiling
+        with runtime.profiler.profile(request_id, profile_format):
+            result = runtime.workflow.invoke(state, config)
         
         # Get the assistant's response
         assistant_response = result['messages'][-1].content
         
-        return jsonify({
+        response = jsonify({
             'success': True,
-            'response': assistant_response
+            'response': assistant_response,
+            'session_id': session_id,
+            'tokens_saved': result.get('tokens_saved', 0)
         })
+        response.headers[profiling.REQUEST_ID_HEADER] = request_id
+        return response
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500 
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500 
+
+@app.route('/process/stream', methods=['POST'])
+def process_stream():
+    """Like /process, but sends progress as Server-Sent Events while the agents work."""
+    customer_name = request.form.get('customer_name')
+    customer_id = request.form.get('customer_id')
+    prompt = request.form.get('prompt')
+
+    if not all([customer_name, customer_id, prompt]):
+        return jsonify({'error': 'Missing required fields'}), 400
+
+    state = {
+        'messages': [HumanMessage(content=prompt)],
+        'customer_name': customer_name,
+        'customer_id': customer_id,
+        'tokens_saved': 0
+    }
+    session_id, config = runtime.session_config(request.form.get('session_id'), customer_id)
+
+    def generate():
+        yield sse('session', {'session_id': session_id})
+        try:
+            for event, data in workflow_events(runtime.workflow, state, config):
+                yield sse(event, data)
+        except Exception as e:
+            yield sse('error', {'error': str(e)})
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
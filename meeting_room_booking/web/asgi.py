@@ -0,0 +1,191 @@
+"""
+ASGI application for the Meeting Room Booking System.
+
+Serves the same routes as the Flask app, but drives the workflow with ``ainvoke`` /
+``astream`` so a request waiting on the model does not hold a thread. One process can
+keep many conversations in flight. Run it with an ASGI server, e.g.:
+    uvicorn meeting_room_booking.web.asgi:app
+"""
+
+import asyncio
+import io
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import HumanMessage
+from werkzeug.formparser import parse_form_data
+
+from meeting_room_booking.tools.cache import availability_cache
+from meeting_room_booking.utils import metrics, profiling
+from meeting_room_booking.web import runtime
+from meeting_room_booking.web.streaming import aworkflow_events, sse
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+
+async def _read_body(receive) -> bytes:
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if not message.get('more_body'):
+            return body
+
+
+def _headers(scope: Dict[str, Any]) -> Dict[str, str]:
+    return {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+
+
+def _parse_form(scope: Dict[str, Any], body: bytes) -> Dict[str, str]:
+    """Decode an urlencoded or multipart form body with werkzeug's parser."""
+    headers = _headers(scope)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'CONTENT_TYPE': headers.get('content-type', ''),
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.input': io.BytesIO(body),
+    }
+    _, form, _ = parse_form_data(environ)
+    return form.to_dict()
+
+
+async def _send_response(send, status: int, body: bytes, content_type: str,
+                         extra_headers: List[Tuple[bytes, bytes]] = ()):
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(b'content-type', content_type.encode()), (b'content-length', str(len(body)).encode()),
+                            *extra_headers]})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _send_json(send, data: Dict[str, Any], status: int = 200, extra_headers: List[Tuple[bytes, bytes]] = ()):
+    await _send_response(send, status, json.dumps(data).encode(), 'application/json', extra_headers)
+
+
+def _profiled_invoke(request_id: str, profile_format: str, state: Dict[str, Any], config: dict):
+    # The profilers follow one thread, and the event loop interleaves other requests, so a
+    # profiled request runs the sync workflow on its own thread
+    with runtime.profiler.profile(request_id, profile_format):
+        return runtime.workflow.invoke(state, config)
+
+
+def _initial_state(form: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """The workflow input for a form, or None if a required field is missing."""
+    customer_name = form.get('customer_name')
+    customer_id = form.get('customer_id')
+    prompt = form.get('prompt')
+    if not all([customer_name, customer_id, prompt]):
+        return None
+    return {
+        'messages': [HumanMessage(content=prompt)],
+        'customer_name': customer_name,
+        'customer_id': customer_id,
+        'tokens_saved': 0
+    }
+
+
+async def _process(scope, receive, send):
+    form = _parse_form(scope, await _read_body(receive))
+    state = _initial_state(form)
+    if state is None:
+        await _send_json(send, {'error': 'Missing required fields'}, 400)
+        return
+    session_id, config = runtime.session_config(form.get('session_id'), state['customer_id'])
+    headers = _headers(scope)
+    request_id = profiling.request_id(headers.get(profiling.REQUEST_ID_HEADER.lower()))
+    profile_format = runtime.profiler.choose(headers.get(profiling.PROFILE_HEADER.lower()))
+    try:
+        if profile_format is None:
+            result = await runtime.workflow.ainvoke(state, config)
+        else:
+            result = await asyncio.to_thread(_profiled_invoke, request_id, profile_format, state, config)
+        await _send_json(send, {'success': True, 'response': result['messages'][-1].content,
+                                'session_id': session_id, 'tokens_saved': result.get('tokens_saved', 0)},
+                         extra_headers=[(profiling.REQUEST_ID_HEADER.lower().encode(), request_id.encode())])
+    except Exception as e:
+        await _send_json(send, {'error': str(e)}, 500)
+
+
+async def _process_stream(scope, receive, send):
+    form = _parse_form(scope, await _read_body(receive))
+    state = _initial_state(form)
+    if state is None:
+        await _send_json(send, {'error': 'Missing required fields'}, 400)
+        return
+    session_id, config = runtime.session_config(form.get('session_id'), state['customer_id'])
+
+    await send({'type': 'http.response.start', 'status': 200,
+                'headers': [(b'content-type', b'text/event-stream'), (b'cache-control', b'no-cache'),
+                            (b'x-accel-buffering', b'no')]})
+    await send({'type': 'http.response.body', 'body': sse('session', {'session_id': session_id}).encode(),
+                'more_body': True})
+    try:
+        async for event, data in aworkflow_events(runtime.workflow, state, config):
+            await send({'type': 'http.response.body', 'body': sse(event, data).encode(), 'more_body': True})
+    except Exception as e:
+        await send({'type': 'http.response.body', 'body': sse('error', {'error': str(e)}).encode(),
+                    'more_body': True})
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def _index(scope, receive, send):
+    with open(os.path.join(TEMPLATE_DIR, 'index.html'), 'rb') as f:
+        await _send_response(send, 200, f.read(), 'text/html; charset=utf-8')
+
+
+async def _router_stats(scope, receive, send):
+    agents = runtime.agents
+    await _send_json(send, agents.router.stats() if agents.router else {})
+
+
+async def _cache_stats(scope, receive, send):
+    await _send_json(send, availability_cache.stats())
+
+
+async def _history_stats(scope, receive, send):
+    await _send_json(send, runtime.agents.compactor.stats())
+
+
+async def _metrics(scope, receive, send):
+    await _send_response(send, 200, metrics.render().encode(), 'text/plain; version=0.0.4')
+
+
+async def _sessions_stats(scope, receive, send):
+    await _send_json(send, runtime.session_stats())
+
+
+async def _profiling_stats(scope, receive, send):
+    await _send_json(send, runtime.profiler.stats())
+
+
+ROUTES = {
+    ('GET', '/'): _index,
+    ('GET', '/router/stats'): _router_stats,
+    ('GET', '/cache/stats'): _cache_stats,
+    ('GET', '/sessions/stats'): _sessions_stats,
+    ('GET', '/history/stats'): _history_stats,
+    ('GET', '/profiling/stats'): _profiling_stats,
+    ('GET', '/metrics'): _metrics,
+    ('POST', '/process'): _process,
+    ('POST', '/process/stream'): _process_stream,
+}
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        # The workflow is compiled when the runtime module is imported; nothing else to set up
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    if scope['type'] != 'http':
+        return
+    handler = ROUTES.get((scope['method'], scope['path']))
+    if handler is None:
+        await _send_json(send, {'error': 'Not found'}, 404)
+        return
+    await handler(scope, receive, send)
@@ -0,0 +1,42 @@
+"""
+Shared agent runtime for the web servers.
+
+The agents and the supervisor graph are compiled once, when this module is first imported,
+and used by both the Flask app and the ASGI app. Conversation state is kept server-side
+per customer and session ID by the checkpointer selected with SESSION_STORE. LOG_LEVEL=DEBUG turns on
+the agents' state and prompt dumps and a log line per node, model and tool span. Requests
+picked by the PROFILE_* settings are profiled (see ``utils.profiling``).
+"""
+
+import logging
+import os
+import uuid
+from typing import Optional, Tuple
+
+from meeting_room_booking.agents import RoomAppointmentAgents
+from meeting_room_booking.agents.sessions import create_checkpointer, session_thread_id
+from meeting_room_booking.utils.profiling import RequestProfiler
+
+LOG_LEVEL_ENV = "LOG_LEVEL"
+
+if os.environ.get(LOG_LEVEL_ENV):
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logging.getLogger("meeting_room_booking").setLevel(os.environ[LOG_LEVEL_ENV].upper())
+
+agents = RoomAppointmentAgents(checkpointer=create_checkpointer())
+workflow = agents.workflow()
+profiler = RequestProfiler.from_env()
+
+
+def session_config(session_id: Optional[str], customer_id: str) -> Tuple[str, dict]:
+    """
+    The session ID to use (a new one unless the client sent one) and the run config of that
+    session for this customer; the same session ID sent by another customer is a different thread.
+    """
+    session_id = (session_id or '').strip()[:128] or uuid.uuid4().hex
+    return session_id, {'configurable': {'thread_id': session_thread_id(customer_id, session_id)}}
+
+
+def session_stats() -> dict:
+    checkpointer = agents.checkpointer
+    return checkpointer.stats() if hasattr(checkpointer, 'stats') else {}
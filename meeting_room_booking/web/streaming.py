@@ -0,0 +1,90 @@
+"""
+Incremental progress events for the Meeting Room Booking System web interface.
+
+Turns LangGraph's ``stream`` output (node updates, sub-agent updates and LLM tokens) into
+small JSON events and formats them as Server-Sent Events.
+"""
+
+import json
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from langchain_core.messages import AIMessageChunk, ToolMessage
+
+STREAM_MODES = ["updates", "messages", "values"]
+
+
+def _content_text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+    return ""
+
+
+def workflow_events(workflow, state: Dict[str, Any],
+                    config: Optional[dict] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Run the workflow and yield ``(event, data)`` pairs as work happens:
+
+    - ``node``: a top-level graph node finished (``node``, and the supervisor's ``next`` decision)
+    - ``tool``: a tool call inside a sub-agent returned (``name``, ``content``)
+    - ``token``: a piece of text generated by a model (``node``, ``text``)
+    - ``final``: the answer also returned by ``/process`` (``response``, ``tokens_saved``)
+
+    ``config`` carries the session's thread ID when the workflow has a checkpointer.
+    """
+    translator = _EventTranslator()
+    for namespace, mode, chunk in workflow.stream(state, config, stream_mode=STREAM_MODES, subgraphs=True):
+        yield from translator.events(namespace, mode, chunk)
+    yield translator.final()
+
+
+async def aworkflow_events(workflow, state: Dict[str, Any],
+                           config: Optional[dict] = None) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """Async twin of ``workflow_events`` built on ``astream``."""
+    translator = _EventTranslator()
+    async for namespace, mode, chunk in workflow.astream(state, config, stream_mode=STREAM_MODES, subgraphs=True):
+        for event in translator.events(namespace, mode, chunk):
+            yield event
+    yield translator.final()
+
+
+class _EventTranslator:
+    """Maps ``(namespace, mode, chunk)`` stream items to events and remembers the final state."""
+
+    def __init__(self):
+        self.final_state = None
+
+    def events(self, namespace: tuple, mode: str, chunk: Any) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        if mode == "values":
+            if not namespace:
+                self.final_state = chunk
+        elif mode == "messages":
+            message, metadata = chunk
+            text = _content_text(message.content) if isinstance(message, AIMessageChunk) else ""
+            if text:
+                # Report the top-level node, not the sub-agent's internal 'agent' node
+                node = metadata.get("langgraph_checkpoint_ns", "").split(":")[0] or metadata.get("langgraph_node")
+                yield "token", {"node": node, "text": text}
+        elif mode == "updates":
+            for node, update in chunk.items():
+                if not namespace:
+                    data = {"node": node}
+                    if isinstance(update, dict) and update.get("next"):
+                        data["next"] = update["next"]
+                    yield "node", data
+                elif isinstance(update, dict):
+                    for message in update.get("messages", []):
+                        if isinstance(message, ToolMessage):
+                            yield "tool", {"name": message.name, "content": _content_text(message.content)}
+
+    def final(self) -> Tuple[str, Dict[str, Any]]:
+        if not self.final_state:
+            return "final", {"response": "", "tokens_saved": 0}
+        return "final", {"response": self.final_state["messages"][-1].content,
+                         "tokens_saved": self.final_state.get("tokens_saved", 0)}
+
+
+def sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
@@ -0,0 +1,45 @@
+"""
+Tests for per-request profiling (meeting_room_booking.utils.profiling).
+"""
+
+import os
+import threading
+
+from meeting_room_booking.utils.profiling import RequestProfiler
+
+
+def test_overlapping_cprofile_requests_do_not_fail(tmp_path):
+    profiler = RequestProfiler(directory=str(tmp_path), interval_ms=1)
+    inside, release = threading.Event(), threading.Event()
+    paths, errors = [], []
+
+    def first():
+        with profiler.profile('first', 'cprofile') as path:
+            paths.append(path)
+            inside.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=first)
+    thread.start()
+    inside.wait(5)
+    try:
+        with profiler.profile('second', 'cprofile') as path:
+            paths.append(path)
+    except Exception as e:
+        errors.append(e)
+    finally:
+        release.set()
+        thread.join()
+
+    assert errors == []
+    assert sorted(os.path.basename(path) for path in paths) == ['first.prof', 'second.folded']
+    assert profiler.stats()['cprofile_fallbacks'] == 1
+
+
+def test_repeated_request_id_keeps_earlier_profiles(tmp_path):
+    profiler = RequestProfiler(directory=str(tmp_path))
+    for _ in range(3):
+        with profiler.profile('same-id', 'cprofile'):
+            sum(range(1000))
+
+    assert sorted(os.listdir(tmp_path)) == ['same-id-1.prof', 'same-id-2.prof', 'same-id.prof']
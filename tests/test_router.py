@@ -0,0 +1,31 @@
+"""
+Tests for the rule-based fast-path router (meeting_room_booking.agents.router).
+"""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from meeting_room_booking.agents.router import FastRouter
+
+
+def _route(query: str, *replies: AIMessage):
+    return FastRouter().route([HumanMessage(content=query), *replies])
+
+
+def test_successful_booking_reply_finishes():
+    reply = AIMessage(content="Successfully canceled booking ID 1001 for Room 1 at 2030-06-15 09:00.",
+                      name='cancel_booking')
+    assert _route("Cancel booking 1001", reply)['next'] == 'FINISH'
+
+
+def test_booking_errors_and_questions_go_to_the_supervisor():
+    error = AIMessage(content="Error: Booking ID 1001 not found.", name='cancel_booking')
+    question = AIMessage(content="Which room would you like to book?", name='booking_agent')
+    assert _route("Cancel booking 1001", error) is None
+    assert _route("Book a room tomorrow at 3pm", question) is None
+
+
+def test_availability_tool_replies_finish():
+    for tool_name in ('check_availability_features', 'check_specific_room', 'check_availability_batch',
+                      'check_availability_range', 'find_next_available'):
+        reply = AIMessage(content="Room 1 is available.", name=tool_name)
+        assert _route("Is room 1 or room 2 available tomorrow at 10:00?", reply)['next'] == 'FINISH', tool_name
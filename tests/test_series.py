@@ -0,0 +1,54 @@
+"""
+Tests for recurring bookings (meeting_room_booking.tools.series and the series tools).
+"""
+
+import shutil
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from meeting_room_booking.storage import store
+from meeting_room_booking.tools.series import skipped_months
+from meeting_room_booking.tools.tools import book_recurring_room
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+@pytest.fixture(autouse=True)
+def data(tmp_path, monkeypatch):
+    shutil.copytree(DATA_DIR, tmp_path / 'data')
+    monkeypatch.chdir(tmp_path)
+    # The shared store resolves data/ against the working directory, so it must not outlive the test
+    monkeypatch.setattr(store, '_store', None)
+
+
+def _book(**kwargs) -> str:
+    args = {'room_id': 1, 'customer_name': 'John Smith', 'customer_id': '1234', 'frequency': 'weekly', 'count': 3}
+    return book_recurring_room.invoke({**args, **kwargs})
+
+
+def test_monthly_series_reports_skipped_months():
+    reply = _book(start_time='2030-01-31 10:00', frequency='monthly')
+
+    assert reply.startswith("Successfully")
+    assert [b.start_time for b in store.get_store().customer_bookings('1234') if b.series_id] == [
+        '2030-01-31 10:00', '2030-03-31 10:00', '2030-05-31 10:00']
+    assert "No occurrence in February 2030, April 2030 (no day 31 in those months)" in reply
+
+
+def test_skipped_months_follow_the_interval():
+    assert skipped_months(datetime(2030, 1, 31), datetime(2030, 7, 31), interval=2) == []
+    assert skipped_months(datetime(2030, 1, 30), datetime(2030, 3, 30)) == [date(2030, 2, 1)]
+
+
+def test_fully_taken_series_does_not_suggest_skip_conflicts():
+    assert _book(start_time='2030-02-04 10:00').startswith("Successfully")
+
+    for skip_conflicts in (True, False):
+        reply = _book(start_time='2030-02-04 10:00', skip_conflicts=skip_conflicts)
+        assert "none of the 3 occurrences of Room 1 are free" in reply
+        assert "skip_conflicts" not in reply
+
+    partial = _book(start_time='2030-01-28 10:00', count=2)
+    assert "1 of 2 occurrences" in partial and "skip_conflicts=True" in partial
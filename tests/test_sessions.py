@@ -0,0 +1,77 @@
+"""
+Tests for server-side conversation sessions (meeting_room_booking.agents.sessions and the web runtime).
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from meeting_room_booking.agents import RoomAppointmentAgents
+from meeting_room_booking.agents.sessions import BoundedMemorySaver, session_thread_id
+from meeting_room_booking.storage import store
+from meeting_room_booking.utils.fake_llm import ScriptedChatModel
+from meeting_room_booking.web import runtime
+from meeting_room_booking.web.app import app
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    shutil.copytree(DATA_DIR, tmp_path / 'data')
+    monkeypatch.chdir(tmp_path)
+    # The shared store resolves data/ against the working directory, so it must not outlive the test
+    monkeypatch.setattr(store, '_store', None)
+    agents = RoomAppointmentAgents(model=ScriptedChatModel(), checkpointer=BoundedMemorySaver())
+    monkeypatch.setattr(runtime, 'agents', agents)
+    monkeypatch.setattr(runtime, 'workflow', agents.workflow())
+    return app.test_client()
+
+
+def _messages(session_id: str, customer_id: str) -> list:
+    _, config = runtime.session_config(session_id, customer_id)
+    return [message.content for message in runtime.workflow.get_state(config).values.get('messages', [])]
+
+
+def test_customers_cannot_read_each_others_session(client):
+    first = client.post('/process', data={'customer_name': 'John Smith', 'customer_id': '1234',
+                                          'prompt': 'Show my bookings', 'session_id': 'shared'})
+    assert first.get_json()['success']
+
+    second = client.post('/process', data={'customer_name': 'Jane Doe', 'customer_id': '5678',
+                                           'prompt': 'What are my reservations?', 'session_id': 'shared'})
+    assert second.get_json()['session_id'] == 'shared'
+
+    assert 'Show my bookings' not in _messages('shared', '5678')
+    assert 'What are my reservations?' not in _messages('shared', '1234')
+    assert 'John Smith' not in second.get_json()['response']
+
+
+def test_session_thread_ids_do_not_collide():
+    assert session_thread_id('1:2', 'x') != session_thread_id('1', '2:x')
+
+
+def test_sqlite_sessions_stay_bounded(tmp_path, monkeypatch):
+    monkeypatch.setenv('SESSION_STORE', 'sqlite')
+    monkeypatch.setenv('SESSION_DB_PATH', str(tmp_path / 'sessions.db'))
+    monkeypatch.setenv('SESSION_MAX', '2')
+    from meeting_room_booking.agents.sessions import create_checkpointer
+    saver = create_checkpointer()
+    workflow = RoomAppointmentAgents(model=ScriptedChatModel(), checkpointer=saver).workflow()
+    shutil.copytree(DATA_DIR, tmp_path / 'data')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(store, '_store', None)
+
+    for session in ('a', 'a', 'b', 'c'):
+        state = {'messages': [('user', 'Show my bookings')], 'customer_name': 'John Smith',
+                 'customer_id': '1234', 'tokens_saved': 0}
+        workflow.invoke(state, {'configurable': {'thread_id': session}})
+
+    stats = saver.stats()
+    assert stats['sessions'] == 2 and stats['evictions'] == 1
+    assert workflow.get_state({'configurable': {'thread_id': 'a'}}).values == {}
+    assert len(workflow.get_state({'configurable': {'thread_id': 'c'}}).values['messages']) >= 2
+    with saver.cursor() as cur:
+        cur.execute("SELECT thread_id, COUNT(*) FROM checkpoints GROUP BY thread_id")
+        assert dict(cur.fetchall()) == {'b': 1, 'c': 1}
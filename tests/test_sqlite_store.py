@@ -0,0 +1,33 @@
+"""
+Tests for the SQLite booking backend (meeting_room_booking.storage.sqlite_store).
+"""
+
+import os
+
+from meeting_room_booking.storage.sqlite_store import SQLiteBookingStore
+
+ROOMS_CSV = """room_id,room_location,capacity,projector,whiteboard,internet
+1,Building A - Floor 1,10,yes,yes,yes
+2,Building A - Floor 2,15,yes,no,yes
+"""
+
+BOOKINGS_CSV = """booking_id,room_id,customer_name,customer_id,start_time,end_time
+1001,1,John Smith,1234,2030-06-15 09:00,2030-06-15 10:00
+1002,2,Jane Doe,5678,2030-06-15 11:00,2030-06-15 12:00
+,1,David Jones,1234,2030-06-16 14:00,2030-06-16 15:00
+"""
+
+
+def test_import_csv_only_reads_its_source(tmp_path):
+    source = tmp_path / 'data'
+    source.mkdir()
+    (source / 'meeting_rooms.csv').write_text(ROOMS_CSV)
+    (source / 'bookings.csv').write_text(BOOKINGS_CSV)
+
+    store = SQLiteBookingStore(str(tmp_path / 'bookings.db'))
+    counts = store.import_csv(str(source / 'meeting_rooms.csv'), str(source / 'bookings.csv'))
+
+    assert counts == {'rooms': 2, 'bookings': 2, 'skipped': 1}
+    assert sorted(os.listdir(source)) == ['bookings.csv', 'meeting_rooms.csv']
+    assert [room.room_id for room in store.rooms()] == [1, 2]
+    assert store.get_booking('1002').room_id == 2
@@ -0,0 +1,76 @@
+"""
+Tests for the in-memory booking store (meeting_room_booking.storage.store).
+"""
+
+import csv
+from datetime import datetime
+
+from meeting_room_booking.storage.store import TIME_FORMAT, Booking, BookingStore
+
+ROOMS_CSV = """room_id,room_location,capacity,projector,whiteboard,internet
+1,Building A - Floor 1,10,yes,yes,yes
+2,Building A - Floor 2,15,yes,no,yes
+"""
+
+BOOKINGS_CSV = """booking_id,room_id,customer_name,customer_id,start_time,end_time
+,1,John Smith,1234,2030-06-15 09:00,2030-06-15 10:00
+,2,Jane Doe,5678,2030-06-15 11:00,2030-06-15 12:00
+1001,1,David Jones,1234,2030-06-16 14:00,2030-06-16 15:00
+1001,2,Emily Watson,9012,2030-06-17 10:00,2030-06-17 11:30
+"""
+
+
+def _store(tmp_path, bookings_csv=BOOKINGS_CSV, **kwargs) -> BookingStore:
+    (tmp_path / 'meeting_rooms.csv').write_text(ROOMS_CSV)
+    (tmp_path / 'bookings.csv').write_text(bookings_csv)
+    return BookingStore(bookings_path=str(tmp_path / 'bookings.csv'),
+                        rooms_path=str(tmp_path / 'meeting_rooms.csv'), **kwargs)
+
+
+def _booking(booking_id: str, room_id: int, start: str, end: str) -> Booking:
+    return Booking(booking_id=booking_id, room_id=room_id, customer_name='Test', customer_id='42',
+                   start_time=start, end_time=end, start_dt=datetime.strptime(start, TIME_FORMAT),
+                   end_dt=datetime.strptime(end, TIME_FORMAT))
+
+
+def _rows(path) -> list:
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_rows_with_blank_and_duplicate_ids_survive_a_rewrite(tmp_path):
+    store = _store(tmp_path)
+    assert len(store.bookings()) == 4
+
+    assert store.book(_booking('2001', 1, '2030-06-18 09:00', '2030-06-18 10:00'))
+
+    rows = _rows(tmp_path / 'bookings.csv')
+    assert len(rows) == 5
+    assert sorted(row['booking_id'] for row in rows) == ['', '', '1001', '1001', '2001']
+    assert len(_store(tmp_path, bookings_csv=(tmp_path / 'bookings.csv').read_text()).bookings()) == 5
+
+
+def test_rows_without_a_unique_id_still_block_their_room(tmp_path):
+    store = _store(tmp_path)
+
+    assert not store.book(_booking('2001', 1, '2030-06-15 09:30', '2030-06-15 10:30'))
+    assert not store.book(_booking('2002', 2, '2030-06-17 11:00', '2030-06-17 12:00'))
+
+
+def test_torn_journal_tail_is_read_once(tmp_path):
+    record = ('{"op":"book","booking":{"booking_id":"2001","room_id":"1","customer_name":"Test",'
+              '"customer_id":"42","start_time":"2030-06-18 09:00","end_time":"2030-06-18 10:00"}}\n')
+    (tmp_path / 'bookings.csv.journal').write_text(record + '{"op":"book","booking":{"booki')
+    store = _store(tmp_path, journaled=True)
+    assert store.get_booking('2001') is not None
+
+    reads = []
+    read = store._journal.read
+    store._journal.read = lambda offset=0: reads.append(offset) or read(offset)
+    for _ in range(3):
+        store.bookings()
+    assert reads == []
+
+    # The next append starts on a fresh line and is still seen by other stores
+    assert store.book(_booking('2002', 2, '2030-06-18 09:00', '2030-06-18 10:00'))
+    assert _store(tmp_path, bookings_csv=BOOKINGS_CSV, journaled=True).get_booking('2002') is not None